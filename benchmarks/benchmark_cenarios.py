@@ -0,0 +1,92 @@
+"""Compara o cálculo de cenários alternativos com o recálculo da carteira inteira por cenário, em JSON.
+
+Uso: python -m benchmarks.benchmark_cenarios [--operacoes N] [--cenarios N] [--repeticoes N] [--saida ARQUIVO]
+
+Uma carteira sintética é o prefixo comum, e cada cenário é uma cauda com uma compra e uma venda final a um preço
+diferente. A etapa recalculo chama calcular_impostos na carteira inteira de cada cenário; a etapa cenarios chama
+calcular_cenarios, que calcula o prefixo uma única vez.
+"""
+
+import argparse
+from decimal import Decimal
+import json
+import platform
+import sys
+from typing import Dict, List
+
+from benchmarks.benchmark_etapas import medir
+from benchmarks.gerador_carteiras import PerfilCarteira, gerar_linha
+from src.adapters.input.json_parser import JsonParser
+from src.domain.models.operacao import Operacao, TipoOperacao
+from src.domain.services.calcular_imposto_local_service import CalcularImpostoLocalService
+from src.domain.services.calcular_imposto_service import CalcularImpostoService
+
+# Motores medidos.
+MOTORES = {"decimal": CalcularImpostoService, "local": CalcularImpostoLocalService}
+
+
+def gerar_caudas(cenarios: int) -> List[List[Operacao]]:
+    """Gera as caudas dos cenários: uma compra e uma venda final, com preços de venda de R$ 5,00 em diante."""
+    return [
+        [
+            Operacao(TipoOperacao.BUY, Decimal("10.00"), 1000),
+            Operacao(TipoOperacao.SELL, Decimal(500 + 10 * indice).scaleb(-2), 500),
+        ]
+        for indice in range(cenarios)
+    ]
+
+
+def executar(perfil: PerfilCarteira, cenarios: int, repeticoes: int) -> Dict:
+    """Mede o recálculo por cenário e o cálculo de cenários em cada motor, retornando um dicionário serializável."""
+    prefixo = JsonParser.parse_operations(gerar_linha(perfil))
+    caudas = gerar_caudas(cenarios)
+
+    motores = {}
+    for nome, motor in MOTORES.items():
+        service = motor()
+        matriz = service.calcular_cenarios(prefixo, caudas)
+        if matriz != [service.calcular_impostos(prefixo + cauda)[len(prefixo) :] for cauda in caudas]:
+            raise AssertionError(f"Os cenários do motor {nome} diferem do recálculo da carteira inteira")
+
+        recalculo = min(medir(lambda: [service.calcular_impostos(prefixo + cauda) for cauda in caudas], repeticoes))
+        calculo_cenarios = min(medir(lambda: service.calcular_cenarios(prefixo, caudas), repeticoes))
+        motores[nome] = {
+            "recalculo_s": round(recalculo, 6),
+            "cenarios_s": round(calculo_cenarios, 6),
+            "aceleracao": round(recalculo / calculo_cenarios, 1),
+        }
+
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "cenarios": cenarios,
+        "repeticoes": repeticoes,
+        "perfil": perfil.como_dict(),
+        "motores": motores,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Executa o benchmark e escreve os resultados em JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operacoes", type=int, default=PerfilCarteira().operacoes, help="Operações do prefixo.")
+    parser.add_argument("--cenarios", type=int, default=100, help="Quantidade de cenários.")
+    parser.add_argument("--repeticoes", type=int, default=3, help="Quantidade de medições de cada etapa.")
+    parser.add_argument("--semente", type=int, default=PerfilCarteira().semente)
+    parser.add_argument("--saida", help="Arquivo onde os resultados são gravados (padrão: saída padrão).")
+    argumentos = parser.parse_args(argv)
+
+    perfil = PerfilCarteira(operacoes=argumentos.operacoes, semente=argumentos.semente)
+    resultados = executar(perfil, argumentos.cenarios, argumentos.repeticoes)
+
+    saida = json.dumps(resultados, indent=2)
+    if argumentos.saida:
+        with open(argumentos.saida, "w") as arquivo:
+            arquivo.write(saida + "\n")
+    else:
+        print(saida)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Compara a leitura das carteiras pela entrada padrão e por --input (arquivo mapeado em memória), em JSON.
+
+Uso: python -m benchmarks.benchmark_entrada [--operacoes N] [--linhas N] [--repeticoes N] [--saida ARQUIVO]
+
+Um arquivo temporário com as carteiras sintéticas é processado pela CLI (python -m src.main) num processo novo a
+cada repetição, uma vez com o arquivo redirecionado para a entrada padrão e outra com --input. São registrados o tempo
+total e o pico de memória residente do processo.
+"""
+
+import argparse
+from dataclasses import replace
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.gerador_carteiras import PerfilCarteira, gerar_linha
+
+
+def gerar_arquivo(caminho: str, perfil: PerfilCarteira, linhas: int) -> int:
+    """Grava as carteiras sintéticas no arquivo, uma por linha, e retorna o tamanho do arquivo em bytes."""
+    with open(caminho, "w") as arquivo:
+        for indice in range(linhas):
+            arquivo.write(gerar_linha(replace(perfil, semente=perfil.semente + indice)) + "\n")
+    return os.path.getsize(caminho)
+
+
+def medir_processo(comando: List[str], caminho_entrada: str | None = None) -> Dict:
+    """Executa o comando num processo novo e retorna o tempo total, em segundos, e o pico de memória, em KiB."""
+    entrada = open(caminho_entrada, "rb") if caminho_entrada else subprocess.DEVNULL
+    try:
+        inicio = time.perf_counter()
+        processo = subprocess.Popen(comando, stdin=entrada, stdout=subprocess.DEVNULL)
+        _, status, uso = os.wait4(processo.pid, 0)
+        segundos = time.perf_counter() - inicio
+    finally:
+        if caminho_entrada:
+            entrada.close()
+    processo.returncode = os.waitstatus_to_exitcode(status)
+    if processo.returncode:
+        raise subprocess.CalledProcessError(processo.returncode, comando)
+    return {"segundos": segundos, "memoria_kib": uso.ru_maxrss}
+
+
+def _resumir(medicoes: List[Dict]) -> Dict:
+    """Resume as medições de um modo de leitura."""
+    tempos = [medicao["segundos"] for medicao in medicoes]
+    return {
+        "minimo_s": round(min(tempos), 6),
+        "mediana_s": round(statistics.median(tempos), 6),
+        "memoria_maxima_kib": max(medicao["memoria_kib"] for medicao in medicoes),
+    }
+
+
+def executar(perfil: PerfilCarteira, linhas: int, repeticoes: int) -> Dict:
+    """Gera o arquivo, mede os dois modos de leitura e retorna os resultados num dicionário serializável."""
+    comando = [sys.executable, "-m", "src.main"]
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, "carteiras.txt")
+        tamanho = gerar_arquivo(caminho, perfil, linhas)
+        medicoes = {"stdin": [], "input": []}
+        for _ in range(repeticoes):
+            medicoes["stdin"].append(medir_processo(comando, caminho))
+            medicoes["input"].append(medir_processo(comando + ["--input", caminho]))
+
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "linhas": linhas,
+        "tamanho_bytes": tamanho,
+        "repeticoes": repeticoes,
+        "perfil": perfil.como_dict(),
+        "modos": {modo: _resumir(medicoes_modo) for modo, medicoes_modo in medicoes.items()},
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Executa o benchmark e escreve os resultados em JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operacoes", type=int, default=1000, help="Operações por carteira.")
+    parser.add_argument("--linhas", type=int, default=1000, help="Quantidade de carteiras no arquivo.")
+    parser.add_argument("--repeticoes", type=int, default=3, help="Execuções medidas de cada modo.")
+    parser.add_argument("--semente", type=int, default=PerfilCarteira().semente)
+    parser.add_argument("--saida", help="Arquivo onde os resultados são gravados (padrão: saída padrão).")
+    argumentos = parser.parse_args(argv)
+
+    perfil = PerfilCarteira(operacoes=argumentos.operacoes, semente=argumentos.semente)
+    resultados = executar(perfil, argumentos.linhas, argumentos.repeticoes)
+
+    saida = json.dumps(resultados, indent=2)
+    if argumentos.saida:
+        with open(argumentos.saida, "w") as arquivo:
+            arquivo.write(saida + "\n")
+    else:
+        print(saida)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""Mede o tempo de cada etapa do cálculo (leitura, cálculo e formatação) e do fluxo completo, em JSON.
+
+Uso: python -m benchmarks.benchmark_etapas [--operacoes N] [--linhas N] [--saida ARQUIVO] [--referencia ARQUIVO]
+
+Com --referencia, os tempos são comparados aos de uma execução anterior e o comando termina com status 1 se alguma
+etapa ficar mais lenta que a tolerância permitida.
+"""
+
+import argparse
+from dataclasses import replace
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.gerador_carteiras import PerfilCarteira, gerar_linha
+from src.adapters.input.json_parser import JsonParser
+from src.adapters.output.json_formatter import JsonFormatter
+from src.application.container import Container
+from src.application.use_cases.calcular_impostos_use_case import CalcularImpostosUseCase
+
+
+def medir(funcao: Callable[[], object], repeticoes: int) -> List[float]:
+    """Executa a função repetidas vezes, com o coletor de lixo desligado, e retorna os tempos em segundos."""
+    tempos = []
+    coletor_ativo = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            funcao()
+            tempos.append(time.perf_counter() - inicio)
+    finally:
+        if coletor_ativo:
+            gc.enable()
+    return tempos
+
+
+def resumir(tempos: List[float], total_operacoes: int) -> Dict:
+    """Resume os tempos de uma etapa; a vazão usa o menor tempo, o menos afetado por ruído."""
+    minimo = min(tempos)
+    return {
+        "minimo_s": round(minimo, 6),
+        "mediana_s": round(statistics.median(tempos), 6),
+        "maximo_s": round(max(tempos), 6),
+        "operacoes_por_segundo": round(total_operacoes / minimo) if minimo else None,
+    }
+
+
+def executar(perfil: PerfilCarteira, linhas: int, repeticoes: int, motor: str = "decimal") -> Dict:
+    """Gera as carteiras e mede cada etapa do cálculo, retornando os resultados num dicionário serializável."""
+    # Cada linha usa uma semente diferente, derivada da semente do perfil.
+    entradas = [gerar_linha(replace(perfil, semente=perfil.semente + indice)) for indice in range(linhas)]
+    total_operacoes = perfil.operacoes * linhas
+
+    input_port = JsonParser()
+    service = Container.get_service(motor)
+    output_port = JsonFormatter()
+    use_case = CalcularImpostosUseCase(input_port, service, output_port)
+
+    carteiras = [input_port.parse_operations(entrada) for entrada in entradas]
+    impostos = [service.calcular_impostos(operacoes) for operacoes in carteiras]
+
+    etapas = {
+        "leitura": lambda: [input_port.parse_operations(entrada) for entrada in entradas],
+        "leitura_json": lambda: [input_port.parse_operations_json(entrada) for entrada in entradas],
+        "calculo": lambda: [service.calcular_impostos(operacoes) for operacoes in carteiras],
+        "formatacao": lambda: [output_port.formatar_impostos(valores) for valores in impostos],
+        "ponta_a_ponta": lambda: [use_case.execute(entrada) for entrada in entradas],
+    }
+
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "motor": motor,
+        "linhas": linhas,
+        "repeticoes": repeticoes,
+        "perfil": perfil.como_dict(),
+        "etapas": {nome: resumir(medir(etapa, repeticoes), total_operacoes) for nome, etapa in etapas.items()},
+    }
+
+
+def comparar_com_referencia(resultados: Dict, referencia: Dict, tolerancia: float) -> List[str]:
+    """Retorna a descrição das etapas cujo menor tempo piorou mais que a tolerância em relação à referência."""
+    regressoes = []
+    for nome, atual in resultados["etapas"].items():
+        anterior = referencia.get("etapas", {}).get(nome)
+        if not anterior or not anterior["minimo_s"]:
+            continue
+        razao = atual["minimo_s"] / anterior["minimo_s"]
+        if razao > 1 + tolerancia:
+            regressoes.append(f"{nome}: {anterior['minimo_s']}s -> {atual['minimo_s']}s ({razao:.2f}x)")
+    return regressoes
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Executa o benchmark, escreve os resultados em JSON e compara com a referência, se informada."""
+    padrao = PerfilCarteira()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operacoes", type=int, default=padrao.operacoes, help="Operações por linha.")
+    parser.add_argument("--linhas", type=int, default=10, help="Quantidade de linhas (carteiras) geradas.")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Quantidade de medições de cada etapa.")
+    parser.add_argument("--proporcao-compras", type=float, default=padrao.proporcao_compras)
+    parser.add_argument("--probabilidade-prejuizo", type=float, default=padrao.probabilidade_prejuizo)
+    parser.add_argument("--tamanho-sequencia-prejuizos", type=int, default=padrao.tamanho_sequencia_prejuizos)
+    parser.add_argument("--proporcao-acima-limite", type=float, default=padrao.proporcao_acima_limite)
+    parser.add_argument("--semente", type=int, default=padrao.semente)
+    parser.add_argument("--engine", choices=sorted(Container.MOTORES), default="decimal")
+    parser.add_argument("--saida", help="Arquivo onde os resultados são gravados (padrão: saída padrão).")
+    parser.add_argument("--referencia", help="Resultados de uma execução anterior, usados para detectar regressões.")
+    parser.add_argument("--tolerancia", type=float, default=0.2, help="Piora relativa tolerada (padrão: 0.2).")
+    argumentos = parser.parse_args(argv)
+
+    perfil = PerfilCarteira(
+        operacoes=argumentos.operacoes,
+        proporcao_compras=argumentos.proporcao_compras,
+        probabilidade_prejuizo=argumentos.probabilidade_prejuizo,
+        tamanho_sequencia_prejuizos=argumentos.tamanho_sequencia_prejuizos,
+        proporcao_acima_limite=argumentos.proporcao_acima_limite,
+        semente=argumentos.semente,
+    )
+    resultados = executar(perfil, argumentos.linhas, argumentos.repeticoes, argumentos.engine)
+
+    saida = json.dumps(resultados, indent=2)
+    if argumentos.saida:
+        with open(argumentos.saida, "w") as arquivo:
+            arquivo.write(saida + "\n")
+    else:
+        print(saida)
+
+    if argumentos.referencia:
+        with open(argumentos.referencia) as arquivo:
+            regressoes = comparar_com_referencia(resultados, json.load(arquivo), argumentos.tolerancia)
+        for regressao in regressoes:
+            print(f"Regressão de desempenho em {regressao}", file=sys.stderr)
+        if regressoes:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Compara o tamanho e o custo de leitura e formatação dos formatos JSON e binário, em JSON.
+
+Uso: python -m benchmarks.benchmark_formatos [--operacoes N] [--linhas N] [--repeticoes N] [--saida ARQUIVO]
+
+As mesmas carteiras sintéticas são codificadas nos dois formatos. A leitura JSON é medida com o JsonParser (Operacao
+por item) e com o JsonLoteParser (lote compacto, a mesma saída do BinarioParser); a formatação, com o JsonFormatter e
+o BinarioFormatter sobre os impostos calculados.
+"""
+
+import argparse
+from dataclasses import replace
+import json
+import platform
+import sys
+from typing import Dict, List
+
+from benchmarks.benchmark_etapas import medir
+from benchmarks.gerador_carteiras import PerfilCarteira, gerar_linha
+from src.adapters.input.binario_parser import BinarioParser, codificar_operacoes
+from src.adapters.input.json_parser import JsonLoteParser, JsonParser
+from src.adapters.output.binario_formatter import BinarioFormatter
+from src.adapters.output.json_formatter import JsonFormatter
+from src.domain.services.calcular_imposto_service import CalcularImpostoService
+
+
+def executar(perfil: PerfilCarteira, linhas: int, repeticoes: int) -> Dict:
+    """Gera as carteiras nos dois formatos e mede a leitura e a formatação, retornando um dicionário serializável."""
+    entradas_json = [gerar_linha(replace(perfil, semente=perfil.semente + indice)) for indice in range(linhas)]
+    entradas_binarias = [codificar_operacoes(JsonParser.parse_lote(entrada)) for entrada in entradas_json]
+    service = CalcularImpostoService()
+    impostos = [service.calcular_impostos(JsonParser.parse_operations(entrada)) for entrada in entradas_json]
+    saidas_json = [JsonFormatter.formatar_impostos(valores) for valores in impostos]
+    saidas_binarias = [BinarioFormatter.formatar_impostos(valores) for valores in impostos]
+
+    etapas = {
+        "leitura_json": lambda: [JsonParser().iter_operations(entrada) for entrada in entradas_json],
+        "leitura_json_lote": lambda: [JsonLoteParser().iter_operations(entrada) for entrada in entradas_json],
+        "leitura_binaria": lambda: [BinarioParser().iter_operations(entrada) for entrada in entradas_binarias],
+        "formatacao_json": lambda: [JsonFormatter.formatar_impostos(valores) for valores in impostos],
+        "formatacao_binaria": lambda: [BinarioFormatter.formatar_impostos(valores) for valores in impostos],
+    }
+    tempos = {nome: min(medir(etapa, repeticoes)) for nome, etapa in etapas.items()}
+
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "linhas": linhas,
+        "repeticoes": repeticoes,
+        "perfil": perfil.como_dict(),
+        "bytes": {
+            "entrada_json": sum(len(entrada.encode()) + 1 for entrada in entradas_json),
+            "entrada_binaria": sum(len(entrada) for entrada in entradas_binarias),
+            "saida_json": sum(len(saida.encode()) + 1 for saida in saidas_json),
+            "saida_binaria": sum(len(saida) for saida in saidas_binarias),
+        },
+        "minimo_s": {nome: round(segundos, 6) for nome, segundos in tempos.items()},
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Executa o benchmark e escreve os resultados em JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operacoes", type=int, default=PerfilCarteira().operacoes, help="Operações por carteira.")
+    parser.add_argument("--linhas", type=int, default=10, help="Quantidade de carteiras.")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Quantidade de medições de cada etapa.")
+    parser.add_argument("--semente", type=int, default=PerfilCarteira().semente)
+    parser.add_argument("--saida", help="Arquivo onde os resultados são gravados (padrão: saída padrão).")
+    argumentos = parser.parse_args(argv)
+
+    perfil = PerfilCarteira(operacoes=argumentos.operacoes, semente=argumentos.semente)
+    resultados = executar(perfil, argumentos.linhas, argumentos.repeticoes)
+
+    saida = json.dumps(resultados, indent=2)
+    if argumentos.saida:
+        with open(argumentos.saida, "w") as arquivo:
+            arquivo.write(saida + "\n")
+    else:
+        print(saida)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
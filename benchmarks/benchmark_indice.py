@@ -0,0 +1,94 @@
+"""Mede as consultas de estado em pontos aleatórios de uma carteira, com e sem o IndiceEstados, em JSON.
+
+Uso: python -m benchmarks.benchmark_indice [--operacoes N] [--intervalo N] [--consultas N] [--saida ARQUIVO]
+
+A etapa recalculo calcula as operações desde o início da carteira até o ponto consultado; a etapa indice consulta
+o IndiceEstados, que parte do instantâneo anterior mais próximo. Os tempos são médias por consulta, e a construção
+do índice é medida à parte.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from typing import Dict, List
+
+from benchmarks.gerador_carteiras import PerfilCarteira, gerar_linha
+from src.adapters.input.json_parser import JsonParser
+from src.domain.services.calcular_imposto_local_service import CalcularImpostoLocalService
+from src.domain.services.calcular_imposto_service import CalcularImpostoService
+from src.domain.services.indice_estados import IndiceEstados
+
+# Motores medidos.
+MOTORES = {"decimal": CalcularImpostoService, "local": CalcularImpostoLocalService}
+
+
+def executar(perfil: PerfilCarteira, intervalo: int, consultas: int, consultas_recalculo: int) -> Dict:
+    """Mede a construção do índice e as consultas em cada motor, retornando um dicionário serializável."""
+    operacoes = JsonParser.parse_operations(gerar_linha(perfil))
+    pontos = [random.Random(perfil.semente).randint(0, len(operacoes)) for _ in range(consultas)]
+
+    motores = {}
+    for nome, motor in MOTORES.items():
+        service = motor()
+        inicio = time.perf_counter()
+        indice = IndiceEstados(service, operacoes, intervalo)
+        construcao = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        estados = [indice.estado_em(ponto) for ponto in pontos]
+        consulta_indice = (time.perf_counter() - inicio) / consultas
+
+        inicio = time.perf_counter()
+        for ponto, estado in zip(pontos[:consultas_recalculo], estados):
+            if service.calcular_impostos_com_estado(operacoes[:ponto])[1] != estado:
+                raise AssertionError(f"O estado do índice no motor {nome} difere do recálculo na operação {ponto}")
+        consulta_recalculo = (time.perf_counter() - inicio) / min(consultas, consultas_recalculo)
+
+        motores[nome] = {
+            "construcao_s": round(construcao, 6),
+            "consulta_indice_s": round(consulta_indice, 6),
+            "consulta_recalculo_s": round(consulta_recalculo, 6),
+            "aceleracao": round(consulta_recalculo / consulta_indice, 1),
+        }
+
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "intervalo": intervalo,
+        "consultas": consultas,
+        "consultas_recalculo": consultas_recalculo,
+        "perfil": perfil.como_dict(),
+        "motores": motores,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Executa o benchmark e escreve os resultados em JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operacoes", type=int, default=100_000, help="Operações da carteira.")
+    parser.add_argument("--intervalo", type=int, default=1000, help="Operações entre dois instantâneos do índice.")
+    parser.add_argument("--consultas", type=int, default=1000, help="Consultas feitas ao índice.")
+    parser.add_argument(
+        "--consultas-recalculo", type=int, default=10, help="Consultas recalculadas desde o início (as mais lentas)."
+    )
+    parser.add_argument("--semente", type=int, default=PerfilCarteira().semente)
+    parser.add_argument("--saida", help="Arquivo onde os resultados são gravados (padrão: saída padrão).")
+    argumentos = parser.parse_args(argv)
+
+    perfil = PerfilCarteira(operacoes=argumentos.operacoes, semente=argumentos.semente)
+    resultados = executar(perfil, argumentos.intervalo, argumentos.consultas, argumentos.consultas_recalculo)
+
+    saida = json.dumps(resultados, indent=2)
+    if argumentos.saida:
+        with open(argumentos.saida, "w") as arquivo:
+            arquivo.write(saida + "\n")
+    else:
+        print(saida)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
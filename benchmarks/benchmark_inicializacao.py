@@ -0,0 +1,111 @@
+"""Mede a inicialização a frio da CLI e falha se ela passar do orçamento, em JSON.
+
+Uso: python -m benchmarks.benchmark_inicializacao [--repeticoes N] [--orcamento-ms MS] [--saida ARQUIVO]
+
+A importação de src.application.cli.main é medida com python -X importtime num processo novo a cada repetição, e o
+tempo total de python -m src.main com uma carteira pequena é medido como referência. O comando termina com status 1
+se o menor tempo de importação passar de --orcamento-ms ou se algum dos módulos pesados, que só devem ser carregados
+pelas opções que os usam, for importado na configuração padrão.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+# Módulo cuja importação é medida: o ponto de entrada da CLI e tudo o que ele importa.
+MODULO_CLI = "src.application.cli.main"
+
+# Módulos que a configuração padrão da CLI não deve importar.
+MODULOS_PESADOS = ("sqlite3", "multiprocessing", "concurrent.futures", "hashlib")
+
+CARTEIRA = '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}]\n'
+
+
+def medir_importacao(modulo: str = MODULO_CLI) -> Dict:
+    """Importa o módulo num processo novo com -X importtime e retorna o tempo acumulado e os módulos importados."""
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"], capture_output=True, check=True, text=True
+    )
+    modulos = {}
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith("import time:") or "|" not in linha:
+            continue
+        _, acumulado, nome = linha.split("|")
+        if acumulado.strip().isdigit():
+            modulos[nome.strip()] = int(acumulado)
+    return {"microssegundos": modulos[modulo], "modulos": set(modulos)}
+
+
+def medir_execucao() -> float:
+    """Executa a CLI com uma carteira pequena num processo novo e retorna o tempo total, em segundos."""
+    inicio = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "src.main"], input=CARTEIRA, capture_output=True, check=True, text=True)
+    return time.perf_counter() - inicio
+
+
+def executar(repeticoes: int) -> Dict:
+    """Mede a importação e a execução da CLI, retornando os resultados num dicionário serializável."""
+    importacoes = [medir_importacao() for _ in range(repeticoes)]
+    execucoes = [medir_execucao() for _ in range(repeticoes)]
+    tempos_importacao = [importacao["microssegundos"] / 1000 for importacao in importacoes]
+    importados = set().union(*(importacao["modulos"] for importacao in importacoes))
+
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "repeticoes": repeticoes,
+        "importacao_ms": {
+            "minimo": round(min(tempos_importacao), 3),
+            "mediana": round(statistics.median(tempos_importacao), 3),
+        },
+        "execucao_ms": {
+            "minimo": round(1000 * min(execucoes), 3),
+            "mediana": round(1000 * statistics.median(execucoes), 3),
+        },
+        "modulos_pesados_importados": sorted(modulo for modulo in MODULOS_PESADOS if modulo in importados),
+    }
+
+
+def verificar_orcamento(resultados: Dict, orcamento_ms: float) -> List[str]:
+    """Retorna a descrição de cada violação do orçamento de inicialização."""
+    violacoes = []
+    minimo = resultados["importacao_ms"]["minimo"]
+    if minimo > orcamento_ms:
+        violacoes.append(f"importação da CLI em {minimo}ms (orçamento: {orcamento_ms}ms)")
+    for modulo in resultados["modulos_pesados_importados"]:
+        violacoes.append(f"o módulo {modulo} é importado na configuração padrão")
+    return violacoes
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Executa o benchmark, escreve os resultados em JSON e verifica o orçamento."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticoes", type=int, default=10, help="Quantidade de processos medidos.")
+    parser.add_argument(
+        "--orcamento-ms", type=float, default=60, help="Tempo máximo de importação da CLI (padrão: 60 ms)."
+    )
+    parser.add_argument("--saida", help="Arquivo onde os resultados são gravados (padrão: saída padrão).")
+    argumentos = parser.parse_args(argv)
+
+    resultados = executar(argumentos.repeticoes)
+
+    saida = json.dumps(resultados, indent=2)
+    if argumentos.saida:
+        with open(argumentos.saida, "w") as arquivo:
+            arquivo.write(saida + "\n")
+    else:
+        print(saida)
+
+    violacoes = verificar_orcamento(resultados, argumentos.orcamento_ms)
+    for violacao in violacoes:
+        print(f"Orçamento de inicialização excedido: {violacao}", file=sys.stderr)
+    return 1 if violacoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
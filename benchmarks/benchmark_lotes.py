@@ -0,0 +1,84 @@
+"""Mede o cálculo pelo preço médio e pelos lotes FIFO e LIFO em carteiras com muitas compras pequenas, em JSON.
+
+Uso: python -m benchmarks.benchmark_lotes [--lotes N ...] [--repeticoes N] [--saida ARQUIVO]
+
+Cada carteira tem N compras de uma ação, com preços alternados para que nenhuma compra seja somada ao lote anterior,
+uma venda de 50 ações a cada 100 compras e, no final, a venda de todas as ações restantes, que consome de uma vez
+metade dos lotes. Com os lotes numa deque, as operações por segundo devem se manter estáveis com N crescente.
+"""
+
+import argparse
+from decimal import Decimal
+import json
+import platform
+import sys
+from typing import Dict, List
+
+from benchmarks.benchmark_etapas import medir
+from src.domain.models.investimento_lotes import MetodoCusto
+from src.domain.models.operacao import Operacao, TipoOperacao
+from src.domain.services.calcular_imposto_service import CalcularImpostoService
+
+
+def gerar_lotes_pequenos(lotes: int) -> List[Operacao]:
+    """Gera a carteira de compras de uma ação, com as vendas periódicas de 50 ações e a venda final."""
+    precos = [Decimal(1000 + indice).scaleb(-2) for indice in range(997)]
+    operacoes = []
+    restantes = 0
+    for indice in range(1, lotes + 1):
+        operacoes.append(Operacao(TipoOperacao.BUY, precos[indice % 997], 1))
+        restantes += 1
+        if indice % 100 == 0:
+            operacoes.append(Operacao(TipoOperacao.SELL, Decimal("15.00"), 50))
+            restantes -= 50
+    if restantes:
+        operacoes.append(Operacao(TipoOperacao.SELL, Decimal("15.00"), restantes))
+    return operacoes
+
+
+def executar(quantidades_lotes: List[int], repeticoes: int) -> Dict:
+    """Mede o cálculo de cada carteira com cada método de custo, retornando um dicionário serializável."""
+    resultados = {}
+    for lotes in quantidades_lotes:
+        operacoes = gerar_lotes_pequenos(lotes)
+        metodos = {}
+        for metodo in MetodoCusto:
+            service = CalcularImpostoService(metodo)
+            segundos = min(medir(lambda: service.calcular_impostos(operacoes), repeticoes))
+            metodos[metodo.value] = {
+                "minimo_s": round(segundos, 6),
+                "operacoes_por_s": round(len(operacoes) / segundos),
+            }
+        resultados[str(lotes)] = metodos
+
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "repeticoes": repeticoes,
+        "lotes": resultados,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Executa o benchmark e escreve os resultados em JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--lotes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="Quantidades de compras medidas."
+    )
+    parser.add_argument("--repeticoes", type=int, default=3, help="Quantidade de medições de cada método.")
+    parser.add_argument("--saida", help="Arquivo onde os resultados são gravados (padrão: saída padrão).")
+    argumentos = parser.parse_args(argv)
+
+    resultados = executar(argumentos.lotes, argumentos.repeticoes)
+
+    saida = json.dumps(resultados, indent=2)
+    if argumentos.saida:
+        with open(argumentos.saida, "w") as arquivo:
+            arquivo.write(saida + "\n")
+    else:
+        print(saida)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
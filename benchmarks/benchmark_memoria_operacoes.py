@@ -0,0 +1,75 @@
+"""Mede a memória por operação de uma lista de Operacao e de um LoteOperacoes, e o tempo de cálculo de cada um.
+
+Uso: python -m benchmarks.benchmark_memoria_operacoes [--operacoes N]
+
+A memória é medida com tracemalloc em duas formas: os bytes que permanecem vivos após a leitura da linha e o pico
+alocado durante a leitura, que inclui as estruturas temporárias do parser.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Dict
+
+from benchmarks.gerador_carteiras import PerfilCarteira, gerar_linha
+from src.adapters.input.json_parser import JsonParser
+from src.application.container import Container
+
+
+def medir_memoria(funcao, *argumentos):
+    """Executa a função e retorna o resultado, os bytes alocados que permanecem vivos e o pico alocado."""
+    tracemalloc.start()
+    try:
+        resultado = funcao(*argumentos)
+        memoria, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return resultado, memoria, pico
+
+
+def medir_tempo(funcao, *argumentos) -> float:
+    """Retorna o tempo de execução da função, em segundos."""
+    inicio = time.perf_counter()
+    funcao(*argumentos)
+    return time.perf_counter() - inicio
+
+
+def executar(quantidade_operacoes: int) -> Dict:
+    """Mede a leitura de uma linha nas duas representações e o cálculo com cada motor, num dicionário serializável."""
+    linha = gerar_linha(PerfilCarteira(operacoes=quantidade_operacoes))
+    operacoes, memoria_lista, pico_lista = medir_memoria(JsonParser.parse_operations, linha)
+    lote, memoria_lote, pico_lote = medir_memoria(JsonParser.parse_lote, linha)
+
+    resultados = {
+        "operacoes": quantidade_operacoes,
+        "bytes_por_operacao": {
+            "lista_operacao": round(memoria_lista / quantidade_operacoes, 1),
+            "lote_operacoes": round(memoria_lote / quantidade_operacoes, 1),
+        },
+        "bytes_pico_leitura_por_operacao": {
+            "lista_operacao": round(pico_lista / quantidade_operacoes, 1),
+            "lote_operacoes": round(pico_lote / quantidade_operacoes, 1),
+        },
+        "segundos_calculo": {},
+    }
+    for motor in sorted(Container.MOTORES):
+        servico = Container.get_service(motor)
+        resultados["segundos_calculo"][motor] = {
+            "lista_operacao": round(medir_tempo(servico.calcular_impostos, operacoes), 4),
+            "lote_operacoes": round(medir_tempo(servico.calcular_impostos, lote), 4),
+        }
+    return resultados
+
+
+def main() -> None:
+    """Executa o benchmark e imprime os resultados em JSON."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--operacoes", type=int, default=200_000)
+    argumentos = parser.parse_args()
+
+    print(json.dumps(executar(argumentos.operacoes), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Mede a latência e a vazão do servidor de cálculo de impostos com um cliente local, em JSON.
+
+Uso: python -m benchmarks.benchmark_servidor [--operacoes N] [--requisicoes N] [--workers N] [--saida ARQUIVO]
+
+O servidor é iniciado num processo separado, num socket Unix temporário. A latência é medida com uma requisição por
+vez na mesma conexão; a vazão, enviando todas as requisições sem esperar as respostas. Para comparação, também é
+medido o tempo de executar a CLI (python -m src.main) uma vez por carteira, como faria um job sem o servidor.
+"""
+
+import argparse
+import asyncio
+from dataclasses import replace
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.gerador_carteiras import PerfilCarteira, gerar_linha
+
+
+def resumir_latencias(latencias: List[float]) -> Dict:
+    """Resume as latências, em milissegundos, com a mediana e os percentis 90 e 99."""
+    ordenadas = sorted(latencias)
+
+    def percentil(fracao: float) -> float:
+        return round(1000 * ordenadas[min(len(ordenadas) - 1, int(fracao * len(ordenadas)))], 3)
+
+    return {
+        "mediana_ms": round(1000 * statistics.median(ordenadas), 3),
+        "p90_ms": percentil(0.9),
+        "p99_ms": percentil(0.99),
+        "maximo_ms": round(1000 * ordenadas[-1], 3),
+    }
+
+
+async def medir_latencia(caminho_socket: str, linhas: List[str]) -> List[float]:
+    """Envia uma linha por vez, esperando cada resposta, e retorna o tempo de ida e volta de cada uma."""
+    reader, writer = await asyncio.open_unix_connection(caminho_socket)
+    latencias = []
+    try:
+        for linha in linhas:
+            inicio = time.perf_counter()
+            writer.write(linha.encode() + b"\n")
+            await reader.readline()
+            latencias.append(time.perf_counter() - inicio)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    return latencias
+
+
+async def medir_vazao(caminho_socket: str, linhas: List[str]) -> float:
+    """Envia todas as linhas sem esperar as respostas e retorna o tempo até receber a última."""
+    reader, writer = await asyncio.open_unix_connection(caminho_socket)
+
+    async def enviar() -> None:
+        for linha in linhas:
+            writer.write(linha.encode() + b"\n")
+            await writer.drain()
+        writer.write_eof()
+
+    inicio = time.perf_counter()
+    envio = asyncio.create_task(enviar())
+    for _ in linhas:
+        await reader.readline()
+    segundos = time.perf_counter() - inicio
+    await envio
+    writer.close()
+    await writer.wait_closed()
+    return segundos
+
+
+def medir_cli(linhas: List[str]) -> List[float]:
+    """Executa a CLI uma vez por linha e retorna o tempo de cada execução, incluindo a inicialização do Python."""
+    tempos = []
+    for linha in linhas:
+        inicio = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "src.main"], input=linha + "\n", capture_output=True, check=True, text=True
+        )
+        tempos.append(time.perf_counter() - inicio)
+    return tempos
+
+
+def _aguardar_servidor(caminho_socket: str, processo: subprocess.Popen, limite_segundos: float = 30) -> None:
+    """Espera o socket do servidor aparecer, falhando se o processo terminar ou o limite de tempo passar."""
+    prazo = time.monotonic() + limite_segundos
+    while not os.path.exists(caminho_socket):
+        if processo.poll() is not None or time.monotonic() > prazo:
+            raise RuntimeError("O servidor não foi iniciado")
+        time.sleep(0.05)
+
+
+def executar(perfil: PerfilCarteira, requisicoes: int, workers: int, execucoes_cli: int) -> Dict:
+    """Inicia o servidor, mede a latência e a vazão e retorna os resultados num dicionário serializável."""
+    linhas = [gerar_linha(replace(perfil, semente=perfil.semente + indice)) for indice in range(requisicoes)]
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_socket = os.path.join(diretorio, "servidor.sock")
+        comando = [sys.executable, "-m", "src.servidor", "--socket", caminho_socket, "--workers", str(workers)]
+        processo = subprocess.Popen(comando, stderr=subprocess.DEVNULL)
+        try:
+            _aguardar_servidor(caminho_socket, processo)
+            latencias = asyncio.run(medir_latencia(caminho_socket, linhas))
+            segundos_vazao = asyncio.run(medir_vazao(caminho_socket, linhas))
+        finally:
+            processo.terminate()
+            processo.wait()
+
+    resultados = {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "requisicoes": requisicoes,
+        "workers": workers,
+        "perfil": perfil.como_dict(),
+        "latencia": resumir_latencias(latencias),
+        "vazao": {
+            "segundos": round(segundos_vazao, 6),
+            "requisicoes_por_segundo": round(requisicoes / segundos_vazao),
+            "operacoes_por_segundo": round(requisicoes * perfil.operacoes / segundos_vazao),
+        },
+    }
+    if execucoes_cli:
+        resultados["cli_por_requisicao"] = resumir_latencias(medir_cli(linhas[:execucoes_cli]))
+    return resultados
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Executa o benchmark e escreve os resultados em JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operacoes", type=int, default=100, help="Operações por carteira.")
+    parser.add_argument("--requisicoes", type=int, default=1000, help="Quantidade de carteiras enviadas.")
+    parser.add_argument("--workers", type=int, default=0, help="Processos do servidor (padrão: 0).")
+    parser.add_argument("--execucoes-cli", type=int, default=5, help="Execuções da CLI para comparação (0: nenhuma).")
+    parser.add_argument("--semente", type=int, default=PerfilCarteira().semente)
+    parser.add_argument("--saida", help="Arquivo onde os resultados são gravados (padrão: saída padrão).")
+    argumentos = parser.parse_args(argv)
+
+    perfil = PerfilCarteira(operacoes=argumentos.operacoes, semente=argumentos.semente)
+    resultados = executar(perfil, argumentos.requisicoes, argumentos.workers, argumentos.execucoes_cli)
+
+    saida = json.dumps(resultados, indent=2)
+    if argumentos.saida:
+        with open(argumentos.saida, "w") as arquivo:
+            arquivo.write(saida + "\n")
+    else:
+        print(saida)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Mede o custo por operação do cálculo em carteiras com quantidades crescentes de tickers, em JSON.
+
+Uso: python -m benchmarks.benchmark_tickers [--operacoes N] [--tickers N ...] [--repeticoes N] [--saida ARQUIVO]
+
+Cada quantidade de tickers gera uma carteira sintética com o mesmo número de operações, lida uma única vez com o
+JsonParser; só o cálculo é medido, nos motores decimal e local. Com as posições indexadas pelo ticker, as
+operações por segundo devem se manter estáveis da carteira sem ticker até a de 10.000 tickers.
+"""
+
+import argparse
+import json
+import platform
+import sys
+from typing import Dict, List
+
+from benchmarks.benchmark_etapas import medir
+from benchmarks.gerador_carteiras import PerfilCarteira, gerar_linha
+from src.adapters.input.json_parser import JsonParser
+from src.domain.services.calcular_imposto_local_service import CalcularImpostoLocalService
+from src.domain.services.calcular_imposto_service import CalcularImpostoService
+
+# Motores medidos.
+MOTORES = {"decimal": CalcularImpostoService, "local": CalcularImpostoLocalService}
+
+
+def executar(perfil: PerfilCarteira, quantidades_tickers: List[int], repeticoes: int) -> Dict:
+    """Mede o cálculo para cada quantidade de tickers, retornando um dicionário serializável."""
+    resultados = {}
+    for tickers in quantidades_tickers:
+        perfil_tickers = PerfilCarteira(**{**perfil.como_dict(), "tickers": tickers})
+        operacoes = JsonParser.parse_operations(gerar_linha(perfil_tickers))
+
+        motores = {}
+        for nome, motor in MOTORES.items():
+            service = motor()
+            segundos = min(medir(lambda: service.calcular_impostos(operacoes), repeticoes))
+            motores[nome] = {"minimo_s": round(segundos, 6), "operacoes_por_s": round(len(operacoes) / segundos)}
+        resultados[str(tickers)] = motores
+
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "repeticoes": repeticoes,
+        "perfil": perfil.como_dict(),
+        "tickers": resultados,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Executa o benchmark e escreve os resultados em JSON."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operacoes", type=int, default=200_000, help="Operações por carteira.")
+    parser.add_argument(
+        "--tickers", type=int, nargs="+", default=[0, 1, 100, 10_000], help="Quantidades de tickers medidas."
+    )
+    parser.add_argument("--repeticoes", type=int, default=5, help="Quantidade de medições de cada motor.")
+    parser.add_argument("--semente", type=int, default=PerfilCarteira().semente)
+    parser.add_argument("--saida", help="Arquivo onde os resultados são gravados (padrão: saída padrão).")
+    argumentos = parser.parse_args(argv)
+
+    perfil = PerfilCarteira(operacoes=argumentos.operacoes, semente=argumentos.semente)
+    resultados = executar(perfil, argumentos.tickers, argumentos.repeticoes)
+
+    saida = json.dumps(resultados, indent=2)
+    if argumentos.saida:
+        with open(argumentos.saida, "w") as arquivo:
+            arquivo.write(saida + "\n")
+    else:
+        print(saida)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
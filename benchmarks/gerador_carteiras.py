@@ -0,0 +1,95 @@
+"""Gerador determinístico de carteiras sintéticas para os benchmarks."""
+
+from dataclasses import asdict, dataclass
+import json
+import math
+import random
+from typing import Dict, List
+
+# Valor de operação a partir do qual a venda é tributável (CalcularImpostoService.LIMITE_ISENCAO_IMPOSTO).
+LIMITE_ISENCAO = 20000
+
+
+@dataclass(frozen=True)
+class PerfilCarteira:
+    """Parâmetros de uma carteira sintética.
+
+    proporcao_compras é a chance de cada operação ser uma compra (vendas só acontecem com ações em carteira).
+    probabilidade_prejuizo é a chance de uma venda iniciar uma sequência de tamanho_sequencia_prejuizos vendas
+    abaixo do preço médio. proporcao_acima_limite é a fração das vendas cujo valor ultrapassa o limite de isenção.
+    Com tickers maior que zero, cada operação recebe um dos tickers sorteado uniformemente, com a sua própria
+    posição; com zero, as operações não têm ticker. A mesma semente sempre gera a mesma carteira.
+    """
+
+    operacoes: int = 10_000
+    proporcao_compras: float = 0.5
+    probabilidade_prejuizo: float = 0.2
+    tamanho_sequencia_prejuizos: int = 3
+    proporcao_acima_limite: float = 0.5
+    semente: int = 42
+    tickers: int = 0
+
+    def como_dict(self) -> Dict:
+        """Retorna os parâmetros do perfil, para registro nos resultados."""
+        return asdict(self)
+
+
+def gerar_operacoes(perfil: PerfilCarteira) -> List[Dict]:
+    """Gera as operações da carteira no formato de entrada da CLI."""
+    gerador = random.Random(perfil.semente)
+    operacoes = []
+    quantidade_atual = 0
+    preco_medio = 0.0
+    prejuizos_restantes = 0
+    # Posições (quantidade, preço médio) dos tickers fora do ticker atual, cujos valores ficam nas variáveis acima.
+    posicoes = {}
+    ticker_atual = None
+
+    for _ in range(perfil.operacoes):
+        if perfil.tickers:
+            ticker = f"T{gerador.randrange(perfil.tickers):05d}"
+            if ticker != ticker_atual:
+                posicoes[ticker_atual] = (quantidade_atual, preco_medio)
+                quantidade_atual, preco_medio = posicoes.pop(ticker, (0, 0.0))
+                ticker_atual = ticker
+
+        if quantidade_atual == 0 or gerador.random() < perfil.proporcao_compras:
+            preco = round(gerador.uniform(5, 100), 2)
+            quantidade = gerador.randint(100, 2000)
+            preco_medio = (preco_medio * quantidade_atual + preco * quantidade) / (quantidade_atual + quantidade)
+            quantidade_atual += quantidade
+            operacoes.append(_operacao("buy", preco, quantidade, ticker_atual))
+            continue
+
+        if prejuizos_restantes == 0 and gerador.random() < perfil.probabilidade_prejuizo:
+            prejuizos_restantes = perfil.tamanho_sequencia_prejuizos
+        if prejuizos_restantes:
+            prejuizos_restantes -= 1
+            preco = round(max(0.01, preco_medio * gerador.uniform(0.5, 0.95)), 2)
+        else:
+            preco = round(preco_medio * gerador.uniform(1.05, 1.5), 2)
+
+        # A quantidade é escolhida para que o valor da venda fique acima ou abaixo do limite de isenção.
+        if gerador.random() < perfil.proporcao_acima_limite:
+            quantidade = math.floor(LIMITE_ISENCAO / preco) + gerador.randint(1, 500)
+        else:
+            quantidade = gerador.randint(1, max(1, math.floor(LIMITE_ISENCAO / preco)))
+        quantidade = min(quantidade, quantidade_atual)
+
+        quantidade_atual -= quantidade
+        if quantidade_atual == 0:
+            preco_medio = 0.0
+        operacoes.append(_operacao("sell", preco, quantidade, ticker_atual))
+
+    return operacoes
+
+
+def _operacao(tipo: str, preco: float, quantidade: int, ticker: str | None) -> Dict:
+    """Monta uma operação no formato de entrada, com o ticker no início quando houver."""
+    operacao = {"operation": tipo, "unit-cost": preco, "quantity": quantidade}
+    return operacao if ticker is None else {"ticker": ticker, **operacao}
+
+
+def gerar_linha(perfil: PerfilCarteira) -> str:
+    """Gera a carteira como uma linha JSON da entrada da CLI."""
+    return json.dumps(gerar_operacoes(perfil))
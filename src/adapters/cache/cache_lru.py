@@ -0,0 +1,87 @@
+from collections import OrderedDict
+import sys
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    from src.adapters.cache.persistencia_sqlite import PersistenciaSqlite
+
+
+class CacheLru:
+    """Cache de resultados em memória, limitado em bytes, que descarta primeiro os menos usados recentemente.
+
+    O tamanho de cada entrada é o sys.getsizeof da chave e do resultado; quando o total passa de limite_bytes, as
+    entradas mais antigas são removidas. Resultados maiores que o próprio limite não são mantidos em memória. Com uma
+    persistência, as falhas em memória são consultadas no disco e todo resultado guardado também é gravado nele.
+    """
+
+    def __init__(self, limite_bytes: int, persistencia: "PersistenciaSqlite | None" = None):
+        self.limite_bytes = limite_bytes
+        self._persistencia = persistencia
+        self._entradas: OrderedDict[bytes, str] = OrderedDict()
+        self._bytes = 0
+        self.acertos = 0
+        self.acertos_disco = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    @property
+    def persistente(self) -> bool:
+        """Indica se os resultados guardados também são gravados no disco."""
+        return self._persistencia is not None
+
+    def obter(self, chave: bytes) -> str | None:
+        """Retorna o resultado da chave, da memória ou do disco, ou None se ele ainda não foi calculado."""
+        saida = self._entradas.get(chave)
+        if saida is not None:
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            return saida
+
+        if self._persistencia is not None:
+            saida = self._persistencia.obter(chave)
+            if saida is not None:
+                self.acertos_disco += 1
+                self._inserir(chave, saida)
+                return saida
+
+        self.falhas += 1
+        return None
+
+    def guardar(self, chave: bytes, saida: str) -> None:
+        """Guarda o resultado da chave na memória e, se houver, na persistência."""
+        self._inserir(chave, saida)
+        if self._persistencia is not None:
+            self._persistencia.guardar(chave, saida)
+
+    def contadores(self) -> Dict:
+        """Retorna os contadores de acertos, falhas e remoções e a ocupação atual da memória."""
+        return {
+            "acertos": self.acertos,
+            "acertos_disco": self.acertos_disco,
+            "falhas": self.falhas,
+            "remocoes": self.remocoes,
+            "entradas": len(self._entradas),
+            "bytes": self._bytes,
+        }
+
+    def fechar(self) -> None:
+        """Fecha a persistência, se houver."""
+        if self._persistencia is not None:
+            self._persistencia.fechar()
+
+    def _inserir(self, chave: bytes, saida: str) -> None:
+        """Insere a entrada em memória, removendo as menos usadas recentemente até respeitar o limite."""
+        tamanho = sys.getsizeof(chave) + sys.getsizeof(saida)
+        if tamanho > self.limite_bytes:
+            return
+
+        anterior = self._entradas.pop(chave, None)
+        if anterior is not None:
+            self._bytes -= sys.getsizeof(chave) + sys.getsizeof(anterior)
+
+        self._entradas[chave] = saida
+        self._bytes += tamanho
+        while self._bytes > self.limite_bytes:
+            chave_removida, saida_removida = self._entradas.popitem(last=False)
+            self._bytes -= sys.getsizeof(chave_removida) + sys.getsizeof(saida_removida)
+            self.remocoes += 1
@@ -0,0 +1,28 @@
+import sqlite3
+
+
+class PersistenciaSqlite:
+    """Persistência dos resultados em cache num arquivo SQLite, que sobrevive ao reinício do processo.
+
+    Cada resultado é gravado assim que é guardado (em modo WAL, sem sincronizar o disco a cada escrita), então vários
+    processos podem compartilhar o mesmo arquivo e nada se perde se o processo terminar sem chamar fechar.
+    """
+
+    def __init__(self, caminho: str):
+        self._conexao = sqlite3.connect(caminho, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.execute("CREATE TABLE IF NOT EXISTS resultados (chave BLOB PRIMARY KEY, saida TEXT NOT NULL)")
+
+    def obter(self, chave: bytes) -> str | None:
+        """Retorna o resultado gravado para a chave, ou None se não houver."""
+        linha = self._conexao.execute("SELECT saida FROM resultados WHERE chave = ?", (chave,)).fetchone()
+        return linha[0] if linha else None
+
+    def guardar(self, chave: bytes, saida: str) -> None:
+        """Grava o resultado da chave."""
+        self._conexao.execute("INSERT OR REPLACE INTO resultados (chave, saida) VALUES (?, ?)", (chave, saida))
+
+    def fechar(self) -> None:
+        """Fecha a conexão com o arquivo."""
+        self._conexao.close()
@@ -0,0 +1,85 @@
+from array import array
+import struct
+import sys
+from typing import BinaryIO, Iterable, Iterator
+
+from src.domain.exceptions.parse_error import ParseError
+from src.domain.models.lote_operacoes import CODIGO_COMPRA, CODIGO_VENDA, LoteOperacoes
+from src.domain.models.operacao import Operacao
+from src.domain.ports.input.operacoes_input_port import OperacoesInputPort
+
+# Cabeçalho de cada registro: a quantidade de operações (uint32 little-endian).
+CABECALHO = struct.Struct("<I")
+
+# Bytes de cada operação nas colunas: o código do tipo (int8), o preço em centavos (int64) e a quantidade (int64).
+BYTES_POR_OPERACAO = 1 + 8 + 8
+
+# As colunas são gravadas em little-endian; numa máquina big-endian, os arrays são convertidos.
+_INVERTER_BYTES = sys.byteorder == "big"
+
+
+def tamanho_registro(quantidade: int) -> int:
+    """Retorna o tamanho, em bytes, do registro de uma carteira com a quantidade de operações informada."""
+    return CABECALHO.size + quantidade * BYTES_POR_OPERACAO
+
+
+def codificar_operacoes(operacoes: Iterable[Operacao]) -> bytes:
+    """Codifica as operações de uma carteira num registro binário, com os preços em centavos."""
+    lote = operacoes if isinstance(operacoes, LoteOperacoes) else LoteOperacoes.de_operacoes(operacoes)
+    colunas = [array(coluna.typecode, coluna) for coluna in (lote.tipos, lote.precos_centavos, lote.quantidades)]
+    if _INVERTER_BYTES:
+        for coluna in colunas:
+            coluna.byteswap()
+    return CABECALHO.pack(len(lote)) + b"".join(coluna.tobytes() for coluna in colunas)
+
+
+def ler_registros(arquivo: BinaryIO) -> Iterator[bytes]:
+    """Lê os registros binários do arquivo, um por carteira, até o fim do arquivo."""
+    while True:
+        cabecalho = arquivo.read(CABECALHO.size)
+        if not cabecalho:
+            return
+        if len(cabecalho) < CABECALHO.size:
+            raise ParseError("Erro ao processar registro binário: cabeçalho incompleto")
+
+        (quantidade,) = CABECALHO.unpack(cabecalho)
+        colunas = arquivo.read(quantidade * BYTES_POR_OPERACAO)
+        if len(colunas) < quantidade * BYTES_POR_OPERACAO:
+            raise ParseError("Erro ao processar registro binário: registro incompleto")
+        yield cabecalho + colunas
+
+
+class BinarioParser(OperacoesInputPort):
+    """Classe responsável por converter registros binários em colunas num LoteOperacoes.
+
+    Cada registro traz a quantidade de operações da carteira (uint32) seguida de três colunas de largura fixa, em
+    little-endian: os códigos dos tipos (int8, CODIGO_COMPRA ou CODIGO_VENDA), os preços em centavos (int64) e as
+    quantidades (int64). As colunas são copiadas direto para os arrays do lote, sem análise de texto.
+    """
+
+    @staticmethod
+    def parse_operations(data: bytes) -> LoteOperacoes:
+        """Converte um registro binário num lote compacto de operações."""
+        visao = memoryview(data)
+        if len(visao) < CABECALHO.size:
+            raise ParseError("Erro ao processar registro binário: cabeçalho incompleto")
+
+        (quantidade,) = CABECALHO.unpack_from(visao)
+        if len(visao) != tamanho_registro(quantidade):
+            raise ParseError(
+                f"Erro ao processar registro binário: {len(visao)} bytes para {quantidade} operações "
+                f"(esperado: {tamanho_registro(quantidade)})"
+            )
+
+        lote = LoteOperacoes()
+        inicio = CABECALHO.size
+        for coluna, largura in ((lote.tipos, 1), (lote.precos_centavos, 8), (lote.quantidades, 8)):
+            fim = inicio + quantidade * largura
+            coluna.frombytes(visao[inicio:fim])
+            inicio = fim
+            if _INVERTER_BYTES:
+                coluna.byteswap()
+
+        if lote.tipos.count(CODIGO_COMPRA) + lote.tipos.count(CODIGO_VENDA) != quantidade:
+            raise ParseError("Erro ao processar registro binário: código de operação inválido")
+        return lote
@@ -1,30 +1,161 @@
 from decimal import Decimal, InvalidOperation
 import json
-from typing import List
+from typing import List, Tuple
 
+from src.adapters.input.varredura_operacoes import (
+    TIPOS_OPERACAO,
+    OperacaoVarrida,
+    preco_em_centavos,
+    varrer_conta,
+    varrer_id_conta,
+    varrer_operacoes,
+)
 from src.domain.exceptions.parse_error import ParseError
+from src.domain.models.lote_operacoes import LoteOperacoes
 from src.domain.models.operacao import Operacao, TipoOperacao
 from src.domain.ports.input.operacoes_input_port import OperacoesInputPort
 
 
+def criar_operacao(item: dict) -> Operacao:
+    """Instancia uma Operacao a partir de um item JSON já decodificado."""
+    return Operacao(
+        tipo_operacao=TipoOperacao(item["operation"]),
+        preco_unitario=Decimal(str(item["unit-cost"])),
+        quantidade=int(item["quantity"]),
+        ticker=_ler_ticker(item),
+    )
+
+
+def _ler_ticker(item: dict) -> str | None:
+    """Lê o campo opcional ticker de um item JSON já decodificado."""
+    ticker = item.get("ticker")
+    if ticker is not None and not isinstance(ticker, str):
+        raise ValueError(f"ticker inválido: {ticker!r}")
+    return ticker
+
+
+def _ler_conta(dados: dict) -> str:
+    """Lê a conta de um registro JSON já decodificado."""
+    conta = dados["account"]
+    if not isinstance(conta, str):
+        raise ValueError(f"account inválido: {conta!r}")
+    return conta
+
+
+def _criar_operacoes_varridas(varridas: List[OperacaoVarrida]) -> List[Operacao]:
+    """Instancia as operações lidas por varrer_operacoes, com o preço em Decimal direto dos dígitos da entrada."""
+    return [
+        Operacao(TIPOS_OPERACAO[tipo], Decimal(preco), int(quantidade), ticker_final or ticker_inicial or None)
+        for ticker_inicial, tipo, preco, quantidade, ticker_final in varridas
+    ]
+
+
+def _contem_ticker(json_data: str | bytes) -> bool:
+    """Verifica se o JSON contém a chave ticker, com uma busca de texto e sem decodificá-lo."""
+    return (b'"ticker"' if isinstance(json_data, bytes) else '"ticker"') in json_data
+
+
 class JsonParser(OperacoesInputPort):
-    """Classe responsável por converter strings JSON em listas de objetos Operacao."""
+    """Classe responsável por converter strings JSON em listas de objetos Operacao.
+
+    Também aceita o JSON em bytes (por exemplo, uma linha lida de um arquivo mapeado em memória), decodificado
+    pelo próprio json.loads sem a cópia intermediária da camada de texto.
+
+    As linhas no formato exato da entrada são lidas por varrer_operacoes, com os preços convertidos direto dos dígitos
+    para Decimal ou centavos, sem dicionários nem floats. Qualquer outra forma recorre ao json.loads.
+    """
 
     @staticmethod
-    def parse_operations(json_data: str) -> List[Operacao]:
+    def parse_operations(json_data: str | bytes) -> List[Operacao]:
         """Análise o JSON e retorna uma lista de operações instanciadas no objeto Operacao."""
+        varridas = varrer_operacoes(json_data)
+        if varridas is None:
+            return JsonParser.parse_operations_json(json_data)
+        return _criar_operacoes_varridas(varridas)
+
+    @staticmethod
+    def parse_operations_json(json_data: str | bytes) -> List[Operacao]:
+        """Análise o JSON com o json.loads, aceitando qualquer forma válida das operações."""
         try:
-            # Remove quebras de linha e espaços extras
-            json_data = json_data.strip().replace("\n", "").replace("  ", " ")
+            if isinstance(json_data, str):
+                # Remove quebras de linha e espaços extras
+                json_data = json_data.strip().replace("\n", "").replace("  ", " ")
             data = json.loads(json_data)
 
-            return [
-                Operacao(
-                    tipo_operacao=TipoOperacao(item["operation"]),
-                    preco_unitario=Decimal(str(item["unit-cost"])),
-                    quantidade=int(item["quantity"]),
-                )
-                for item in data
-            ]
+            return [criar_operacao(item) for item in data]
         except (json.JSONDecodeError, KeyError, ValueError, InvalidOperation) as exception:
             raise ParseError(f"Erro ao processar JSON: {str(exception)}")
+
+    @staticmethod
+    def parse_conta(json_data: str | bytes) -> Tuple[str, List[Operacao]]:
+        """Análise um registro {"account": ..., "operations": [...]} e retorna a conta e as suas operações."""
+        varrido = varrer_conta(json_data)
+        if varrido is not None:
+            conta, varridas = varrido
+            return conta, _criar_operacoes_varridas(varridas)
+
+        try:
+            dados = json.loads(json_data)
+            return _ler_conta(dados), [criar_operacao(item) for item in dados["operations"]]
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError, InvalidOperation) as exception:
+            raise ParseError(f"Erro ao processar JSON: {str(exception)}")
+
+    @staticmethod
+    def parse_id_conta(json_data: str | bytes) -> str:
+        """Retorna apenas a conta de um registro, lendo só o início da linha quando ela começa pela conta."""
+        conta = varrer_id_conta(json_data)
+        if conta is None:
+            return JsonParser.parse_conta(json_data)[0]
+        return conta
+
+    @staticmethod
+    def parse_lote(json_data: str | bytes) -> LoteOperacoes:
+        """Análise o JSON e preenche um lote compacto de operações, com os preços convertidos para centavos.
+
+        O lote não guarda tickers: carteiras com ticker são rejeitadas com ParseError.
+        """
+        varridas = None if _contem_ticker(json_data) else varrer_operacoes(json_data)
+        if varridas is None:
+            return JsonParser.parse_lote_json(json_data)
+
+        precos_centavos = [preco_em_centavos(preco) for _, _, preco, _, _ in varridas]
+        if None in precos_centavos:
+            # Mais de duas casas decimais: o json.loads produz a mensagem de erro da entrada.
+            return JsonParser.parse_lote_json(json_data)
+
+        lote = LoteOperacoes()
+        try:
+            lote.estender(
+                (TIPOS_OPERACAO[tipo] for _, tipo, _, _, _ in varridas),
+                precos_centavos,
+                (int(quantidade) for _, _, _, quantidade, _ in varridas),
+            )
+        except OverflowError as exception:
+            raise ParseError(f"Erro ao processar JSON: {str(exception)}")
+        return lote
+
+    @staticmethod
+    def parse_lote_json(json_data: str | bytes) -> LoteOperacoes:
+        """Análise o JSON com o json.loads e preenche um lote compacto, aceitando qualquer forma válida."""
+        try:
+            data = json.loads(json_data)
+
+            lote = LoteOperacoes()
+            for item in data:
+                if "ticker" in item:
+                    raise ValueError("o lote compacto não guarda o ticker das operações")
+                centavos = Decimal(str(item["unit-cost"])).scaleb(2)
+                if centavos != centavos.to_integral_value():
+                    raise ValueError(f"unit-cost com mais de duas casas decimais: {item['unit-cost']}")
+                lote.adicionar(TipoOperacao(item["operation"]), int(centavos), int(item["quantity"]))
+            return lote
+        except (json.JSONDecodeError, KeyError, ValueError, InvalidOperation, OverflowError) as exception:
+            raise ParseError(f"Erro ao processar JSON: {str(exception)}")
+
+
+class JsonLoteParser(JsonParser):
+    """Variante do JsonParser que entrega as operações num LoteOperacoes compacto, sem uma Operacao por linha."""
+
+    def iter_operations(self, json_data: str | bytes) -> LoteOperacoes:
+        """Converte o JSON num lote compacto de operações."""
+        return self.parse_lote(json_data)
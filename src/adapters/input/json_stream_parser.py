@@ -0,0 +1,56 @@
+from decimal import InvalidOperation
+import json
+import re
+from typing import Iterator, List
+
+from src.adapters.input.json_parser import criar_operacao
+from src.domain.exceptions.parse_error import ParseError
+from src.domain.models.operacao import Operacao
+from src.domain.ports.input.operacoes_input_port import OperacoesInputPort
+
+_ESPACOS = re.compile(r"[ \t\n\r]*")
+
+
+class JsonStreamParser(OperacoesInputPort):
+    """Classe responsável por converter um array JSON em objetos Operacao, um de cada vez.
+
+    Ao contrário do JsonParser, não cria cópias da linha nem a lista completa de itens decodificados: o array é
+    percorrido elemento a elemento e cada Operacao é entregue assim que o seu objeto JSON termina de ser lido.
+    """
+
+    _decoder = json.JSONDecoder()
+
+    def parse_operations(self, json_data: str) -> List[Operacao]:
+        """Análise o JSON e retorna uma lista de operações instanciadas no objeto Operacao."""
+        return list(self.iter_operations(json_data))
+
+    def iter_operations(self, json_data: str) -> Iterator[Operacao]:
+        """Percorre o array JSON e produz as operações à medida que são lidas."""
+        pular_espacos = _ESPACOS.match
+        posicao = pular_espacos(json_data, 0).end()
+
+        if not json_data.startswith("[", posicao):
+            raise ParseError(f"Erro ao processar JSON: Expecting '[': char {posicao}")
+
+        posicao = pular_espacos(json_data, posicao + 1).end()
+        fechado = json_data.startswith("]", posicao)
+
+        while not fechado:
+            try:
+                item, posicao = self._decoder.raw_decode(json_data, posicao)
+                operacao = criar_operacao(item)
+            except (json.JSONDecodeError, KeyError, ValueError, InvalidOperation) as exception:
+                raise ParseError(f"Erro ao processar JSON: {str(exception)}")
+
+            yield operacao
+
+            posicao = pular_espacos(json_data, posicao).end()
+            if json_data.startswith(",", posicao):
+                posicao = pular_espacos(json_data, posicao + 1).end()
+            elif json_data.startswith("]", posicao):
+                fechado = True
+            else:
+                raise ParseError(f"Erro ao processar JSON: Expecting ',' delimiter: char {posicao}")
+
+        if pular_espacos(json_data, posicao + 1).end() != len(json_data):
+            raise ParseError(f"Erro ao processar JSON: Extra data: char {posicao + 1}")
@@ -0,0 +1,114 @@
+import re
+from typing import List, Tuple
+
+from src.domain.models.operacao import TipoOperacao
+
+_ESPACOS = r"[ \t\n\r]*"
+_INTEIRO = r"-?(?:0|[1-9][0-9]*)"
+
+# Um objeto de operação com as chaves na ordem do formato de entrada e o ticker opcional no início ou no final: <e>
+# marca os espaços permitidos, <n> os números inteiros, <t> o texto do ticker (sem sequências de escape) e <g> os
+# grupos do ticker, do tipo, do preço e da quantidade.
+_OBJETO = (
+    r'\{<e>(?:"ticker"<e>:<e>"<g><t>)"<e>,<e>)?"operation"<e>:<e>"<g>buy|sell)"<e>,<e>"unit-cost"<e>:<e>'
+    r'<g><n>(?:\.[0-9]+)?)<e>,<e>"quantity"<e>:<e><g><n>)<e>(?:,<e>"ticker"<e>:<e>"<g><t>)"<e>)?\}'
+).replace("<e>", _ESPACOS).replace("<n>", _INTEIRO).replace("<t>", r'[^"\\\x00-\x1f]+')
+_OPERACAO = _OBJETO.replace("<g>", "(")
+
+# O array é varrido um objeto por vez: cada casamento vai de um objeto até a vírgula ou o colchete que o segue, então
+# a memória usada pelo regex não cresce com o tamanho do array, ao contrário de um único casamento da linha inteira.
+_ABERTURA = re.compile(rf"{_ESPACOS}\[")
+_ARRAY_VAZIO = re.compile(rf"{_ESPACOS}\]{_ESPACOS}")
+_OPERACOES = re.compile(rf"{_ESPACOS}{_OPERACAO}{_ESPACOS}[,\]]")
+_FIM = re.compile(_ESPACOS)
+
+# Um registro de conta com as chaves account e operations, nessa ordem: o início do registro, até o texto da conta, e
+# o registro inteiro, com o array de operações (validado depois por varrer_operacoes).
+_INICIO_CONTA = rf'{_ESPACOS}\{{{_ESPACOS}"account"{_ESPACOS}:{_ESPACOS}"([^"\\\x00-\x1f]*)"'
+_CONTA = re.compile(_INICIO_CONTA)
+_REGISTRO_CONTA = re.compile(
+    rf'{_INICIO_CONTA}{_ESPACOS},{_ESPACOS}"operations"{_ESPACOS}:{_ESPACOS}(\[.*\]){_ESPACOS}\}}{_ESPACOS}', re.DOTALL
+)
+
+# Tipo de operação de cada texto aceito na varredura.
+TIPOS_OPERACAO = {"buy": TipoOperacao.BUY, "sell": TipoOperacao.SELL}
+
+# Operação varrida: o ticker no início do objeto, o tipo, o preço unitário com os dígitos da entrada, a quantidade e o
+# ticker no final do objeto. Os tickers ausentes são textos vazios.
+OperacaoVarrida = Tuple[str, str, str, str, str]
+
+
+def varrer_operacoes(json_data: str | bytes) -> List[OperacaoVarrida] | None:
+    """Lê um array de operações no formato exato da entrada, sem json.loads, dicionários nem floats.
+
+    Aceita apenas objetos com as chaves operation, unit-cost e quantity, nessa ordem, com o ticker opcional no
+    início ou no final, e números sem expoente. As operações são devolvidas com os textos da entrada, para que o
+    preço seja convertido em Decimal ou centavos sem passar por float. Qualquer outra forma, inclusive JSON inválido,
+    retorna None, e a entrada deve ser lida pelo parser JSON geral.
+    """
+    if isinstance(json_data, bytes):
+        try:
+            json_data = json_data.decode()
+        except UnicodeDecodeError:
+            return None
+    abertura = _ABERTURA.match(json_data)
+    if abertura is None:
+        return None
+    posicao = abertura.end()
+    if _ARRAY_VAZIO.fullmatch(json_data, posicao) is not None:
+        return []
+
+    operacoes = []
+    casar = _OPERACOES.match
+    while True:
+        operacao = casar(json_data, posicao)
+        if operacao is None:
+            return None
+        operacoes.append(operacao.groups(""))
+        posicao = operacao.end()
+        if json_data[posicao - 1] == "]":
+            break
+    if _FIM.fullmatch(json_data, posicao) is None:
+        return None
+    return operacoes
+
+
+def varrer_conta(json_data: str | bytes) -> Tuple[str, List[OperacaoVarrida]] | None:
+    """Lê um registro {"account": ..., "operations": [...]} no formato exato da entrada, sem json.loads.
+
+    Retorna a conta e as operações varridas, ou None se o registro ou as suas operações tiverem outra forma.
+    """
+    if isinstance(json_data, bytes):
+        try:
+            json_data = json_data.decode()
+        except UnicodeDecodeError:
+            return None
+    registro = _REGISTRO_CONTA.fullmatch(json_data)
+    if registro is None:
+        return None
+    operacoes = varrer_operacoes(registro.group(2))
+    if operacoes is None:
+        return None
+    return registro.group(1), operacoes
+
+
+def varrer_id_conta(json_data: str | bytes) -> str | None:
+    """Lê apenas a conta no início de um registro, sem validar o restante da linha, ou retorna None."""
+    if isinstance(json_data, bytes):
+        json_data = json_data.decode(errors="replace")
+    conta = _CONTA.match(json_data)
+    return None if conta is None else conta.group(1)
+
+
+def preco_em_centavos(preco: str) -> int | None:
+    """Converte o preço com os dígitos da entrada em centavos, ou None se ele tiver mais de duas casas decimais."""
+    ponto = preco.find(".")
+    if ponto < 0:
+        return int(preco) * 100
+
+    casas = len(preco) - ponto - 1
+    if casas <= 2:
+        return int(preco[:ponto] + preco[ponto + 1 :]) * 10 ** (2 - casas)
+    if preco[ponto + 3 :].strip("0"):
+        return None
+    return int(preco[:ponto] + preco[ponto + 1 : ponto + 3])
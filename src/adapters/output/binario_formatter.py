@@ -0,0 +1,70 @@
+from array import array
+from decimal import Decimal
+import struct
+import sys
+from typing import BinaryIO, Iterable, Iterator, List, Tuple
+
+from src.domain.ports.output.impostos_output_port import ImpostosOutputPort
+
+# Cabeçalho de cada registro: a quantidade de impostos e o tamanho, em bytes, das mensagens de erro (uint32 cada).
+CABECALHO = struct.Struct("<II")
+
+# Valor da coluna de impostos nas posições com erro, cuja mensagem segue no final do registro.
+CENTAVOS_ERRO = -(1 << 63)
+
+# A coluna é gravada em little-endian; numa máquina big-endian, o array é convertido.
+_INVERTER_BYTES = sys.byteorder == "big"
+
+
+def ler_registro_impostos(arquivo: BinaryIO) -> List[Decimal | str] | None:
+    """Lê o próximo registro de impostos do arquivo, ou None no fim do arquivo.
+
+    Os impostos voltam em Decimal e as posições com erro trazem a mensagem de erro, como no retorno do cálculo.
+    """
+    cabecalho = arquivo.read(CABECALHO.size)
+    if not cabecalho:
+        return None
+
+    quantidade, tamanho_erros = CABECALHO.unpack(cabecalho)
+    centavos = array("q")
+    centavos.frombytes(arquivo.read(8 * quantidade))
+    if _INVERTER_BYTES:
+        centavos.byteswap()
+    erros = iter(arquivo.read(tamanho_erros).decode().split("\n"))
+    return [next(erros) if valor == CENTAVOS_ERRO else Decimal(valor).scaleb(-2) for valor in centavos]
+
+
+class BinarioFormatter(ImpostosOutputPort):
+    """Classe responsável por formatar os impostos de uma carteira num registro binário.
+
+    Cada registro traz a quantidade de impostos e o tamanho das mensagens de erro (uint32 cada), a coluna dos
+    impostos em centavos (int64 little-endian) e, por fim, as mensagens de erro em UTF-8, separadas por quebras de
+    linha. As posições com erro recebem CENTAVOS_ERRO na coluna e a mensagem correspondente, na mesma ordem.
+    """
+
+    @staticmethod
+    def formatar_impostos(impostos: Iterable[Decimal | str]) -> bytes:
+        """Formata os impostos de uma carteira como um registro binário."""
+        centavos, erros = BinarioFormatter._colunas(impostos)
+        mensagens = "\n".join(erros).encode()
+        if _INVERTER_BYTES:
+            centavos.byteswap()
+        return CABECALHO.pack(len(centavos), len(mensagens)) + centavos.tobytes() + mensagens
+
+    @staticmethod
+    def iter_formatar_impostos(impostos: Iterable[Decimal | str]) -> Iterator[bytes]:
+        """Formata os impostos num único registro: o cabeçalho depende da quantidade total de impostos."""
+        return iter([BinarioFormatter.formatar_impostos(impostos)])
+
+    @staticmethod
+    def _colunas(impostos: Iterable[Decimal | str]) -> Tuple[array, List[str]]:
+        """Separa os impostos em centavos e as mensagens de erro."""
+        centavos = array("q")
+        erros = []
+        for imposto in impostos:
+            if isinstance(imposto, str):
+                centavos.append(CENTAVOS_ERRO)
+                erros.append(imposto)
+            else:
+                centavos.append(int(imposto.scaleb(2)))
+        return centavos, erros
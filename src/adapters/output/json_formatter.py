@@ -1,6 +1,6 @@
 from decimal import Decimal
 import json
-from typing import List
+from typing import Iterable, Iterator, List, TextIO
 
 from src.domain.ports.output.impostos_output_port import ImpostosOutputPort
 
@@ -15,11 +15,82 @@ class DecimalEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def formatar_decimal(valor: Decimal) -> str:
+    """Formata um Decimal exatamente como o json.dumps formataria o seu float, sem convertê-lo para float.
+
+    Valores com até 15 dígitos significativos e magnitude entre 1e-4 e 1e16 (todos os impostos quantizados em
+    centavos) são formatados diretamente a partir dos dígitos do Decimal; os demais recorrem à conversão para float.
+    """
+    texto = str(valor)
+    if "E" not in texto and "N" not in texto and "I" not in texto:
+        inteiro, _, fracao = texto.partition(".")
+        fracao = fracao.rstrip("0")
+        digitos_inteiro = inteiro.lstrip("-")
+        significativos = (digitos_inteiro + fracao).lstrip("0")
+        zeros_fracao = len(fracao) - len(fracao.lstrip("0"))
+
+        if len(significativos) <= 15 and len(digitos_inteiro) <= 16:
+            if not significativos or digitos_inteiro != "0" or zeros_fracao < 4:
+                return f"{inteiro}.{fracao or '0'}"
+
+    return json.dumps(float(valor))
+
+
 class JsonFormatter(ImpostosOutputPort):
     """Classe responsável por formatar listas de impostos como JSON."""
 
     @staticmethod
     def formatar_impostos(impostos: List[Decimal]) -> str:
         """Formata lista de impostos como JSON."""
-        result = [{"error": imposto} if isinstance(imposto, str) else {"tax": imposto} for imposto in impostos]
-        return json.dumps(result, cls=DecimalEncoder, separators=(",", ": "))
+        return "".join(JsonFormatter.iter_formatar_impostos(impostos))
+
+    @staticmethod
+    def iter_formatar_impostos(impostos: Iterable[Decimal | str]) -> Iterator[str]:
+        """Formata os impostos como fragmentos de um array JSON, um fragmento por imposto recebido.
+
+        A concatenação dos fragmentos é idêntica ao retorno de formatar_impostos para os mesmos impostos.
+        """
+        separador = "["
+        for imposto in impostos:
+            yield separador + JsonFormatter._formatar_item(imposto)
+            separador = ","
+
+        yield "[]" if separador == "[" else "]"
+
+    @staticmethod
+    def escrever_impostos(impostos: Iterable[Decimal | str], arquivo: TextIO) -> None:
+        """Escreve os impostos como um array JSON diretamente no arquivo, sem montar a saída em memória."""
+        escrever = arquivo.write
+        formatar_item = JsonFormatter._formatar_item
+        separador = "["
+        for imposto in impostos:
+            escrever(separador)
+            escrever(formatar_item(imposto))
+            separador = ","
+
+        escrever("[]" if separador == "[" else "]")
+
+    @staticmethod
+    def formatar_conta(conta: str, saidas: Iterable[str]) -> str:
+        """Formata os impostos de uma conta, reunindo num único array as saídas de formatar_impostos dos registros."""
+        impostos = ",".join(saida[1:-1] for saida in saidas if saida != "[]")
+        return '{"account": ' + json.dumps(conta) + ', "taxes": [' + impostos + "]}"
+
+    @staticmethod
+    def formatar_erro(mensagem: str) -> str:
+        """Formata o registro de erro de uma linha: um objeto JSON, distinto do array de impostos das demais."""
+        return json.dumps({"error": mensagem})
+
+    @staticmethod
+    def eh_registro_erro(saida: str) -> bool:
+        """Verifica se a saída de uma linha é um registro de erro, e não um array de impostos."""
+        return saida.startswith('{"error": ')
+
+    @staticmethod
+    def _formatar_item(imposto: Decimal | str) -> str:
+        """Formata o objeto JSON de um imposto ou de uma mensagem de erro, sem criar dicionários intermediários."""
+        if isinstance(imposto, Decimal):
+            return '{"tax": ' + formatar_decimal(imposto) + "}"
+        if isinstance(imposto, str):
+            return '{"error": ' + json.dumps(imposto) + "}"
+        return '{"tax": ' + json.dumps(imposto, cls=DecimalEncoder) + "}"
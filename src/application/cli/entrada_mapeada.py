@@ -0,0 +1,55 @@
+import mmap
+import os
+from typing import Iterator
+
+# Quantidade de bytes já lidos a partir da qual as páginas do mapeamento são devolvidas ao sistema operacional.
+TAMANHO_DESCARTE = 8 << 20
+
+
+class EntradaMapeada:
+    """Lê as linhas de um arquivo mapeado em memória, como bytes, sem carregá-lo inteiro na RAM.
+
+    As quebras de linha são localizadas diretamente no mapeamento e cada linha é entregue como uma fatia de bytes,
+    lida pelo JsonParser sem passar pela decodificação da camada de texto. As páginas já lidas são devolvidas ao
+    sistema operacional a cada TAMANHO_DESCARTE bytes (onde madvise existir), para que arquivos de vários gigabytes
+    não acumulem as suas páginas na memória do processo.
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self.linhas()
+
+    def linhas(self, inicio: int = 0) -> Iterator[bytes]:
+        """Produz as linhas do arquivo a partir da posição inicio, em bytes, incluindo a quebra de linha."""
+        with open(self.caminho, "rb") as arquivo:
+            tamanho = os.fstat(arquivo.fileno()).st_size
+            if inicio >= tamanho:
+                if inicio > tamanho:
+                    raise ValueError("A entrada não corresponde ao ponto de controle")
+                return
+
+            with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+                yield from self._percorrer(mapa, inicio, tamanho)
+
+    @staticmethod
+    def _percorrer(mapa: mmap.mmap, posicao: int, tamanho: int) -> Iterator[bytes]:
+        """Produz as fatias entre quebras de linha, devolvendo periodicamente as páginas já lidas."""
+        madvise = getattr(mapa, "madvise", None)
+        if madvise is not None and hasattr(mmap, "MADV_SEQUENTIAL"):
+            madvise(mmap.MADV_SEQUENTIAL)
+        descartar = madvise is not None and hasattr(mmap, "MADV_DONTNEED")
+        descartado = 0
+
+        while posicao < tamanho:
+            fim = mapa.find(b"\n", posicao)
+            fim = tamanho if fim < 0 else fim + 1
+            yield mapa[posicao:fim]
+            posicao = fim
+
+            if descartar and posicao - descartado >= TAMANHO_DESCARTE:
+                # O madvise exige um início alinhado à página; as fatias entregues são cópias independentes.
+                limite = posicao - posicao % mmap.PAGESIZE
+                madvise(mmap.MADV_DONTNEED, descartado, limite - descartado)
+                descartado = limite
@@ -0,0 +1,75 @@
+from collections import deque
+from typing import TYPE_CHECKING, BinaryIO, Callable, Deque, Iterable, Iterator
+
+from src.application.cli.saida_bufferizada import SaidaBufferizada
+
+if TYPE_CHECKING:
+    from src.application.cli.ponto_controle import SaidaComPontoControle
+
+
+class LinhasRejeitadas:
+    """Grava num arquivo as linhas de entrada cuja saída foi um registro de erro, contando-as.
+
+    As linhas lidas ficam pendentes até que a sua saída seja conferida, uma vez por linha e na ordem de leitura (a
+    mesma ordem em que os resultados chegam, inclusive com workers). As linhas rejeitadas são gravadas como foram
+    lidas, uma por linha, para que o arquivo possa ser reprocessado diretamente pela CLI. bytes_escritos é a
+    posição no arquivo após a última linha gravada, registrada nos pontos de controle.
+    """
+
+    def __init__(self, arquivo: BinaryIO, eh_registro_erro: Callable[[str], bool], bytes_iniciais: int = 0):
+        self._arquivo = arquivo
+        self._eh_registro_erro = eh_registro_erro
+        self._pendentes: Deque[str | bytes] = deque()
+        self.quantidade = 0
+        self.bytes_escritos = bytes_iniciais
+
+    def acompanhar(self, linhas: Iterable[str | bytes]) -> Iterator[str | bytes]:
+        """Registra cada linha lida como pendente."""
+        for linha in linhas:
+            self._pendentes.append(linha)
+            yield linha
+
+    def conferir(self, saida: str) -> None:
+        """Confere a saída da linha pendente mais antiga, gravando a linha se a saída for um registro de erro."""
+        linha = self._pendentes.popleft()
+        if not self._eh_registro_erro(saida):
+            return
+
+        if isinstance(linha, str):
+            linha = linha.encode()
+        self.bytes_escritos += self._arquivo.write(linha if linha.endswith(b"\n") else linha + b"\n")
+        self.quantidade += 1
+
+    def retomar(self, bytes_rejeitadas: int) -> None:
+        """Descarta do arquivo as linhas gravadas depois da posição do ponto de controle.
+
+        As linhas concluídas depois do ponto de controle são processadas e conferidas de novo na retomada; mantê-las
+        no arquivo as gravaria em duplicidade.
+        """
+        from src.application.cli.ponto_controle import posicionar_saida
+
+        posicionar_saida(self._arquivo, bytes_rejeitadas)
+        self.bytes_escritos = bytes_rejeitadas
+
+    def flush(self) -> None:
+        """Descarrega no arquivo as linhas rejeitadas gravadas até aqui."""
+        self._arquivo.flush()
+
+
+class SaidaComRejeicoes:
+    """Envolve a saída, conferindo nas linhas rejeitadas cada linha de resultado antes de escrevê-la."""
+
+    def __init__(self, saida: "SaidaBufferizada | SaidaComPontoControle", rejeitadas: LinhasRejeitadas):
+        self._saida = saida
+        self._rejeitadas = rejeitadas
+
+    def write(self, texto: str) -> int:
+        return self._saida.write(texto)
+
+    def writelines(self, textos) -> None:
+        self._saida.writelines(textos)
+
+    def escrever_linha(self, texto: str = "") -> None:
+        """Confere e escreve a linha de resultado."""
+        self._rejeitadas.conferir(texto)
+        self._saida.escrever_linha(texto)
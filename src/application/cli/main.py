@@ -1,24 +1,460 @@
 #!/usr/bin/env python3
 
+import argparse
 import sys
+from typing import TYPE_CHECKING, Iterable, Iterator, Sequence
 
+from src.application.cli.saida_bufferizada import SaidaBufferizada
 from src.application.container import Container
 
+# Os módulos usados apenas por opções específicas (workers, pontos de controle, cache e estatísticas) são importados
+# quando a opção é usada, para não pesar na inicialização de cada execução da CLI.
+if TYPE_CHECKING:
+    from src.application.cli.entrada_mapeada import EntradaMapeada
+    from src.application.cli.linhas_rejeitadas import LinhasRejeitadas
+    from src.application.cli.ponto_controle import SaidaComPontoControle
+    from src.application.use_cases.estatisticas_processamento import EstatisticasProcessamento
+    from src.domain.models.regra_imposto import RegraImposto, TabelaRegras
 
-def main() -> None:
-    """Ponto de entrada principal para a aplicação CLI para o cálculo de ganho de capital."""
 
-    _, _, _, use_case = Container.get_dependencies()
+def _inteiro_positivo(valor: str) -> int:
+    """Converte o argumento em um inteiro maior que zero."""
+    try:
+        numero = int(valor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"valor inteiro inválido: {valor!r}")
+
+    if numero < 1:
+        raise argparse.ArgumentTypeError(f"o valor deve ser maior que zero: {valor!r}")
+    return numero
+
+
+def _politica_flush(valor: str) -> int:
+    """Converte a política de descarga da saída na quantidade de linhas entre descargas (0: apenas ao final)."""
+    if valor == "interactive":
+        return 1
+    if valor == "exit":
+        return 0
+    return _inteiro_positivo(valor)
+
+
+def _tabela_regras(arquivo: str) -> "TabelaRegras":
+    """Carrega a tabela de regras do imposto do arquivo JSON."""
+    try:
+        return Container.get_tabela_regras(arquivo)
+    except (OSError, ValueError) as erro:
+        raise argparse.ArgumentTypeError(str(erro))
+
 
-    for line in sys.stdin:
+def _data(valor: str):
+    """Converte o argumento numa data no formato AAAA-MM-DD."""
+    from datetime import date
+
+    try:
+        return date.fromisoformat(valor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"data inválida (use AAAA-MM-DD): {valor!r}")
+
+
+def _criar_parser_argumentos() -> argparse.ArgumentParser:
+    """Cria o parser dos argumentos aceitos pela CLI."""
+    parser = argparse.ArgumentParser(description="Calcula o imposto sobre ganho de capital de operações na bolsa.")
+    parser.add_argument(
+        "--input",
+        metavar="ARQUIVO",
+        help="Lê as carteiras do arquivo, mapeado em memória, em vez da entrada padrão.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=Container.FORMATOS,
+        default="json",
+        help="Formato da entrada e da saída: json (uma carteira por linha) ou binario (registros com colunas de "
+        "largura fixa). O formato binário não pode ser combinado com --stream, --compact, --stats, --cache, "
+        "--cache-file, --prefix-cache nem --checkpoint.",
+    )
+    parser.add_argument(
+        "--accounts",
+        action="store_true",
+        help='Lê registros {"account": CONTA, "operations": [...]}, com os de uma mesma conta intercalados na '
+        "entrada, e escreve ao final uma linha por conta, na ordem em que as contas aparecem. Com --workers, as "
+        "contas são divididas entre os processos pelo hash da conta. Não pode ser combinado com --format binario, "
+        "--stream, --compact, --stats, --cache, --cache-file, --prefix-cache nem --checkpoint.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=_inteiro_positivo,
+        default=1,
+        help="Quantidade de processos usados para calcular linhas independentes em paralelo (padrão: 1).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_inteiro_positivo,
+        default=256,
+        help="Quantidade de linhas enviadas a cada worker por vez quando --workers > 1 (padrão: 256).",
+    )
+    modo_entrada = parser.add_mutually_exclusive_group()
+    modo_entrada.add_argument(
+        "--stream",
+        action="store_true",
+        help="Lê, calcula e escreve as operações de cada linha de forma incremental, sem listas completas em memória.",
+    )
+    modo_entrada.add_argument(
+        "--compact",
+        action="store_true",
+        help="Lê as operações de cada linha num lote compacto em colunas, com os preços em centavos.",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=sorted(Container.MOTORES),
+        default="decimal",
+        help="Motor de cálculo dos impostos (padrão: decimal).",
+    )
+    parser.add_argument(
+        "--cost-basis",
+        choices=Container.METODOS_CUSTO,
+        default="medio",
+        help="Custo das ações vendidas: medio (preço médio ponderado, o padrão) ou os lotes comprados, consumidos "
+        "em ordem fifo ou lifo. O custo por lotes requer --engine decimal e não pode ser combinado com --accounts, "
+        "--cache-file nem --prefix-cache.",
+    )
+    parser.add_argument(
+        "--tax-rules",
+        type=_tabela_regras,
+        metavar="ARQUIVO",
+        help='Lê de ARQUIVO a tabela de regras do imposto, {"regras": [{"vigencia": "AAAA-MM-DD", "aliquota": '
+        '"0.20", "limite_isencao": "20000.00"}, ...]}, e calcula com a regra vigente em --tax-date. Não pode ser '
+        "combinado com --cache-file.",
+    )
+    parser.add_argument(
+        "--tax-date",
+        type=_data,
+        metavar="AAAA-MM-DD",
+        help="Data usada para escolher a regra da tabela de --tax-rules (padrão: a data atual).",
+    )
+    parser.add_argument(
+        "--stats",
+        nargs="?",
+        const="-",
+        metavar="ARQUIVO",
+        help="Mede o tempo de leitura, cálculo e formatação, as operações e os bytes de cada linha. Sem ARQUIVO, "
+        "imprime um resumo na saída de erro; com ARQUIVO, grava as medições em JSON.",
+    )
+    parser.add_argument(
+        "--cache",
+        type=_inteiro_positivo,
+        metavar="MIB",
+        help="Reaproveita a saída de linhas repetidas, mantendo até MIB mebibytes de resultados em memória.",
+    )
+    parser.add_argument(
+        "--cache-file",
+        metavar="ARQUIVO",
+        help="Arquivo SQLite onde os resultados do cache são persistidos entre execuções.",
+    )
+    parser.add_argument(
+        "--prefix-cache",
+        type=_inteiro_positivo,
+        metavar="N",
+        help="Guarda o estado final das N últimas carteiras e, quando uma delas é reenviada com novas operações no "
+        "final, calcula apenas as novas operações. Não pode ser combinado com --stream nem --stats.",
+    )
+    parser.add_argument(
+        "--flush",
+        type=_politica_flush,
+        metavar="POLITICA",
+        help="Quando descarregar a saída: interactive (a cada linha; com --stream, a cada imposto), exit (apenas ao "
+        "final) ou um inteiro N (a cada N linhas). Padrão: interactive em um terminal, exit caso contrário.",
+    )
+    parser.add_argument(
+        "--rejects",
+        metavar="ARQUIVO",
+        help='Não interrompe o processamento numa linha com erro: escreve na saída {"error": MENSAGEM} no lugar dos '
+        "impostos da linha, grava a linha original em ARQUIVO, para ser reprocessada, e informa ao final na saída de "
+        "erro a quantidade de linhas rejeitadas. Não pode ser combinado com --format binario, --stream nem "
+        "--accounts.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        metavar="ARQUIVO",
+        help="Grava periodicamente em ARQUIVO as posições na entrada e na saída das linhas já concluídas.",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=_inteiro_positivo,
+        default=1000,
+        metavar="N",
+        help="Quantidade de linhas concluídas entre dois pontos de controle (padrão: 1000).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Retoma a partir do ponto de controle de --checkpoint, pulando a entrada já processada e descartando "
+        "de um arquivo de saída o que foi escrito depois dele. Requer a mesma entrada da execução interrompida.",
+    )
+    return parser
+
+
+def _ler_linhas(entrada: Iterable[str | bytes]) -> Iterator[str | bytes]:
+    """Lê as linhas de entrada até encontrar uma linha vazia."""
+    for line in entrada:
         if not line.strip():
             break
+        yield line
+
+
+def _abrir_entrada(argumentos: argparse.Namespace) -> "Iterable[str] | EntradaMapeada":
+    """Retorna a entrada escolhida: o arquivo de --input, mapeado em memória, ou a entrada padrão."""
+    if argumentos.input:
+        from src.application.cli.entrada_mapeada import EntradaMapeada
+
+        return EntradaMapeada(argumentos.input)
+    return sys.stdin
+
+
+def _opcoes_dependencias(argumentos: argparse.Namespace) -> dict:
+    """Monta as opções repassadas ao Container.get_dependencies a partir dos argumentos da CLI."""
+    return {
+        "streaming": argumentos.stream,
+        "motor": argumentos.engine,
+        "compacto": argumentos.compact,
+        "limite_cache_bytes": (argumentos.cache or 0) * 1024 * 1024,
+        "arquivo_cache": argumentos.cache_file,
+        "limite_prefixos": argumentos.prefix_cache or 0,
+        "formato": argumentos.format,
+        "contas": argumentos.accounts,
+        "tolerante": bool(argumentos.rejects),
+        "metodo_custo": argumentos.cost_basis,
+        "regra": _regra_imposto(argumentos),
+    }
+
+
+def _regra_imposto(argumentos: argparse.Namespace) -> "RegraImposto | None":
+    """Retorna a regra da tabela de --tax-rules vigente em --tax-date, ou None sem tabela."""
+    if argumentos.tax_rules is None:
+        return None
+    if argumentos.tax_date is None:
+        from datetime import date
+
+        return argumentos.tax_rules.regra_em(date.today())
+    return argumentos.tax_rules.regra_em(argumentos.tax_date)
+
+
+def _processar_linhas(
+    argumentos: argparse.Namespace,
+    linhas: Iterable[str | bytes],
+    saida: "SaidaBufferizada | SaidaComPontoControle",
+    estatisticas: "EstatisticasProcessamento | None" = None,
+    rejeitadas: "LinhasRejeitadas | None" = None,
+) -> None:
+    """Processa as linhas de entrada conforme o modo escolhido e escreve os resultados na saída.
+
+    Com rejeitadas, as linhas respondidas com um registro de erro são gravadas no arquivo de linhas rejeitadas.
+    """
+    if rejeitadas is not None:
+        from src.application.cli.linhas_rejeitadas import SaidaComRejeicoes
+
+        linhas = rejeitadas.acompanhar(linhas)
+        saida = SaidaComRejeicoes(saida, rejeitadas)
+    if argumentos.input and (argumentos.stream or argumentos.prefix_cache):
+        # As linhas do arquivo mapeado são bytes; a leitura incremental e a retomada de prefixos trabalham com texto.
+        linhas = (linha.decode() for linha in linhas)
+
+    if argumentos.accounts:
+        from src.application.cli.processamento_contas import processar_contas
+
+        for resultado in processar_contas(
+            linhas, argumentos.workers, argumentos.chunk_size, _opcoes_dependencias(argumentos)
+        ):
+            saida.escrever_linha(resultado)
+        return
+
+    if argumentos.workers > 1:
+        from src.application.cli.processamento_paralelo import processar_em_paralelo
 
+        resultados = processar_em_paralelo(
+            linhas, argumentos.workers, argumentos.chunk_size, _opcoes_dependencias(argumentos), estatisticas
+        )
+        for resultado in resultados:
+            saida.escrever_linha(resultado)
+        return
+
+    _, _, _, use_case = Container.get_dependencies(**_opcoes_dependencias(argumentos), estatisticas=estatisticas)
+
+    try:
+        if argumentos.stream:
+            # Cada imposto é entregue à saída assim que a operação correspondente é processada.
+            for line in linhas:
+                use_case.execute_to_file(line, saida)
+                saida.escrever_linha()
+        else:
+            for line in linhas:
+                saida.escrever_linha(use_case.execute(line))
+    finally:
+        if argumentos.cache or argumentos.cache_file:
+            use_case.cache.fechar()
+            if estatisticas is not None:
+                estatisticas.contadores_cache = use_case.cache.contadores()
+
+
+def _processar_registros(argumentos: argparse.Namespace, registros_por_flush: int) -> None:
+    """Processa os registros binários da entrada, escrevendo um registro de impostos por carteira."""
+    from src.adapters.input.binario_parser import ler_registros
+
+    saida = sys.stdout.buffer
+    entrada = open(argumentos.input, "rb") if argumentos.input else sys.stdin.buffer
+    try:
+        registros = ler_registros(entrada)
+        if argumentos.workers > 1:
+            from src.application.cli.processamento_paralelo import processar_em_paralelo
+
+            resultados = processar_em_paralelo(
+                registros, argumentos.workers, argumentos.chunk_size, _opcoes_dependencias(argumentos)
+            )
+        else:
+            _, _, _, use_case = Container.get_dependencies(**_opcoes_dependencias(argumentos))
+            resultados = map(use_case.execute, registros)
+
+        for quantidade, resultado in enumerate(resultados, 1):
+            saida.write(resultado)
+            if registros_por_flush and quantidade % registros_por_flush == 0:
+                saida.flush()
+    finally:
+        saida.flush()
+        if argumentos.input:
+            entrada.close()
+
+
+def _criar_saida(argumentos: argparse.Namespace, linhas_por_flush: int) -> SaidaBufferizada:
+    """Cria a saída bufferizada da saída padrão.
+
+    Com --stream e descarga a cada linha, cada imposto é descarregado assim que é escrito, e não apenas ao fim da
+    carteira.
+    """
+    return SaidaBufferizada(
+        sys.stdout, linhas_por_flush, descarregar_fragmentos=argumentos.stream and linhas_por_flush == 1
+    )
+
+
+def _processar_com_ponto_controle(
+    argumentos: argparse.Namespace,
+    linhas_por_flush: int,
+    estatisticas: "EstatisticasProcessamento | None",
+    rejeitadas: "LinhasRejeitadas | None" = None,
+) -> None:
+    """Processa a entrada gravando pontos de controle e, com --resume, retomando do último ponto gravado."""
+    from src.application.cli.ponto_controle import (
+        EntradaRetomavel,
+        PontoControle,
+        SaidaComPontoControle,
+        ler_ponto_controle,
+        posicionar_saida,
+    )
+
+    inicial = ler_ponto_controle(argumentos.checkpoint) if argumentos.resume else PontoControle()
+    if argumentos.resume:
+        posicionar_saida(sys.stdout, inicial.bytes_saida)
+        if rejeitadas is not None:
+            rejeitadas.retomar(inicial.bytes_rejeitadas)
+
+    entrada = EntradaRetomavel(_abrir_entrada(argumentos), inicial.bytes_entrada)
+    with _criar_saida(argumentos, linhas_por_flush) as saida_bufferizada:
+        saida = SaidaComPontoControle(
+            saida_bufferizada, entrada, argumentos.checkpoint, argumentos.checkpoint_every, inicial, rejeitadas
+        )
+        # Um ponto de controle de uma execução anterior não vale para esta, mesmo que ela falhe antes do primeiro.
+        saida.gravar()
+        _processar_linhas(argumentos, _ler_linhas(entrada), saida, estatisticas, rejeitadas)
+        saida.gravar()
+
+
+def _emitir_estatisticas(estatisticas: "EstatisticasProcessamento", destino: str) -> None:
+    """Imprime o resumo das estatísticas na saída de erro ("-") ou grava as medições em JSON no arquivo destino."""
+    if destino == "-":
+        sys.stderr.write(estatisticas.resumo() + "\n")
+        return
+
+    import json
+
+    with open(destino, "w") as arquivo:
+        json.dump(estatisticas.como_dict(), arquivo, indent=2)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Ponto de entrada principal para a aplicação CLI para o cálculo de ganho de capital."""
+
+    parser = _criar_parser_argumentos()
+    argumentos = parser.parse_args(argv or [])
+    if argumentos.prefix_cache and (argumentos.stream or argumentos.stats):
+        parser.error("--prefix-cache não pode ser combinado com --stream nem --stats")
+    if argumentos.resume and not argumentos.checkpoint:
+        parser.error("--resume requer --checkpoint")
+    incompativeis_binario = ("stream", "compact", "stats", "cache", "cache_file", "prefix_cache", "checkpoint")
+    if argumentos.format == "binario" and any(getattr(argumentos, opcao) for opcao in incompativeis_binario):
+        parser.error(
+            "--format binario não pode ser combinado com --stream, --compact, --stats, --cache, --cache-file, "
+            "--prefix-cache nem --checkpoint"
+        )
+    if argumentos.accounts and (
+        argumentos.format != "json" or any(getattr(argumentos, opcao) for opcao in incompativeis_binario)
+    ):
+        parser.error(
+            "--accounts não pode ser combinado com --format binario, --stream, --compact, --stats, --cache, "
+            "--cache-file, --prefix-cache nem --checkpoint"
+        )
+    if argumentos.rejects and (argumentos.format != "json" or argumentos.stream or argumentos.accounts):
+        parser.error("--rejects não pode ser combinado com --format binario, --stream nem --accounts")
+    if argumentos.cost_basis != "medio" and (
+        argumentos.engine != "decimal" or argumentos.accounts or argumentos.cache_file or argumentos.prefix_cache
+    ):
+        parser.error(
+            "--cost-basis fifo ou lifo requer --engine decimal e não pode ser combinado com --accounts, --cache-file "
+            "nem --prefix-cache"
+        )
+    if argumentos.tax_date and not argumentos.tax_rules:
+        parser.error("--tax-date requer --tax-rules")
+    if argumentos.tax_rules and argumentos.cache_file:
+        parser.error("--tax-rules não pode ser combinado com --cache-file")
+    if argumentos.tax_rules:
         try:
-            print(use_case.execute(line))
-        except Exception as exception:
-            raise SystemExit(f"Erro ao processar entrada: {str(exception)}")
+            _regra_imposto(argumentos)
+        except ValueError as erro:
+            parser.error(str(erro))
+    estatisticas = None
+    if argumentos.stats:
+        from src.application.use_cases.estatisticas_processamento import EstatisticasProcessamento
+
+        # O resumo na saída de erro só usa os totais; as medições de cada linha só são guardadas para o JSON.
+        estatisticas = EstatisticasProcessamento(guardar_linhas=argumentos.stats != "-")
+    linhas_por_flush = argumentos.flush
+    if linhas_por_flush is None:
+        linhas_por_flush = 1 if sys.stdout.isatty() else 0
+
+    rejeitadas = None
+    try:
+        if argumentos.rejects:
+            from src.application.cli.linhas_rejeitadas import LinhasRejeitadas
+
+            # Na retomada, as linhas rejeitadas até o ponto de controle são mantidas no arquivo.
+            arquivo_rejeitadas = open(argumentos.rejects, "ab" if argumentos.resume else "wb")
+            rejeitadas = LinhasRejeitadas(arquivo_rejeitadas, Container.get_output_port().eh_registro_erro)
+        if argumentos.format == "binario":
+            _processar_registros(argumentos, linhas_por_flush)
+        elif argumentos.checkpoint:
+            _processar_com_ponto_controle(argumentos, linhas_por_flush, estatisticas, rejeitadas)
+        else:
+            # Os resultados já produzidos são descarregados mesmo que uma linha seguinte falhe.
+            with _criar_saida(argumentos, linhas_por_flush) as saida:
+                _processar_linhas(argumentos, _ler_linhas(_abrir_entrada(argumentos)), saida, estatisticas, rejeitadas)
+    except Exception as exception:
+        raise SystemExit(f"Erro ao processar entrada: {str(exception)}")
+    finally:
+        if rejeitadas is not None:
+            arquivo_rejeitadas.close()
+
+    if estatisticas is not None:
+        _emitir_estatisticas(estatisticas, argumentos.stats)
+    if rejeitadas is not None:
+        sys.stderr.write(f"Linhas rejeitadas: {rejeitadas.quantidade} (gravadas em {argumentos.rejects})\n")
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
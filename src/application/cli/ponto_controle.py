@@ -0,0 +1,215 @@
+from collections import deque
+from dataclasses import asdict, dataclass
+import io
+import json
+import os
+import stat
+from typing import TYPE_CHECKING, BinaryIO, Deque, Dict, Iterable, Iterator, TextIO
+
+from src.application.cli.entrada_mapeada import EntradaMapeada
+from src.application.cli.saida_bufferizada import SaidaBufferizada
+
+if TYPE_CHECKING:
+    from src.application.cli.linhas_rejeitadas import LinhasRejeitadas
+
+# Tamanho dos blocos lidos e descartados ao pular uma entrada que não permite seek.
+TAMANHO_BLOCO_DESCARTE = 1 << 20
+
+
+@dataclass(frozen=True)
+class PontoControle:
+    """Posição de um processamento em lote após a última linha concluída e escrita na saída.
+
+    Cada linha é uma carteira independente, então não há estado de Investimento nem prejuízo acumulado entre
+    linhas: as posições na entrada, na saída e no arquivo de linhas rejeitadas bastam para retomar o processamento.
+
+    Args:
+        bytes_entrada: Bytes da entrada consumidos pelas linhas concluídas
+        bytes_saida: Bytes da saída escritos para as linhas concluídas
+        linhas: Quantidade de linhas concluídas
+        bytes_rejeitadas: Bytes do arquivo de linhas rejeitadas escritos para as linhas concluídas
+    """
+
+    bytes_entrada: int = 0
+    bytes_saida: int = 0
+    linhas: int = 0
+    bytes_rejeitadas: int = 0
+
+    def como_dict(self) -> Dict:
+        """Serializa o ponto de controle num dicionário compatível com JSON."""
+        return asdict(self)
+
+    @classmethod
+    def de_dict(cls, dados: Dict) -> "PontoControle":
+        """Restaura o ponto de controle serializado por como_dict."""
+        return cls(
+            bytes_entrada=int(dados["bytes_entrada"]),
+            bytes_saida=int(dados["bytes_saida"]),
+            linhas=int(dados["linhas"]),
+            # Pontos de controle gravados antes do arquivo de linhas rejeitadas não trazem a sua posição.
+            bytes_rejeitadas=int(dados.get("bytes_rejeitadas", 0)),
+        )
+
+
+def ler_ponto_controle(caminho: str) -> PontoControle:
+    """Lê o ponto de controle gravado no arquivo, ou o início do processamento se o arquivo não existir."""
+    try:
+        with open(caminho) as arquivo:
+            return PontoControle.de_dict(json.load(arquivo))
+    except FileNotFoundError:
+        return PontoControle()
+
+
+def gravar_ponto_controle(caminho: str, ponto: PontoControle) -> None:
+    """Grava o ponto de controle de forma atômica: num arquivo temporário sincronizado e depois renomeado."""
+    temporario = caminho + ".tmp"
+    with open(temporario, "w") as arquivo:
+        json.dump(ponto.como_dict(), arquivo)
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+    os.replace(temporario, caminho)
+
+
+def posicionar_saida(arquivo: TextIO | BinaryIO, bytes_saida: int) -> None:
+    """Descarta de um arquivo regular de saída (ou de linhas rejeitadas) o que foi escrito depois do ponto de controle.
+
+    Saídas que não são arquivos regulares (pipes, terminais) não podem ser reposicionadas: a retomada apenas escreve
+    nelas as linhas restantes.
+    """
+    try:
+        descritor = arquivo.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return
+    if not stat.S_ISREG(os.fstat(descritor).st_mode):
+        return
+
+    arquivo.flush()
+    if os.fstat(descritor).st_size < bytes_saida:
+        raise ValueError("A saída possui menos bytes do que o ponto de controle registra")
+    os.ftruncate(descritor, bytes_saida)
+    getattr(arquivo, "buffer", arquivo).seek(bytes_saida)
+
+
+class EntradaRetomavel:
+    """Lê as linhas de uma entrada a partir de uma posição em bytes, contando os bytes de cada linha lida.
+
+    As linhas podem ser lidas antes de serem concluídas (por exemplo, pelos workers), então os tamanhos ficam
+    pendentes até que confirmar seja chamado, uma vez por linha e na ordem de leitura. bytes_confirmados é a posição
+    na entrada logo após a última linha confirmada. Um arquivo mapeado em memória (EntradaMapeada) é lido
+    diretamente a partir da posição inicial, e as suas linhas são entregues em bytes.
+    """
+
+    def __init__(self, entrada: TextIO | EntradaMapeada, bytes_iniciais: int = 0):
+        self._entrada = entrada
+        self._binario = getattr(entrada, "buffer", None)
+        self._codificacao = getattr(entrada, "encoding", None) or "utf-8"
+        self._pendentes: Deque[int] = deque()
+        self.bytes_confirmados = bytes_iniciais
+        self._bytes_iniciais = bytes_iniciais
+
+    def __iter__(self) -> Iterator[str | bytes]:
+        if isinstance(self._entrada, EntradaMapeada):
+            yield from self._contar(self._entrada.linhas(self._bytes_iniciais))
+            return
+        if self._binario is None:
+            yield from self._ler_texto()
+            return
+
+        self._pular(self._binario, self._bytes_iniciais)
+        for linha in self._contar(self._binario):
+            yield linha.decode(self._codificacao)
+
+    def _contar(self, linhas: Iterable[bytes]) -> Iterator[bytes]:
+        """Registra o tamanho de cada linha em bytes como pendente."""
+        for linha in linhas:
+            self._pendentes.append(len(linha))
+            yield linha
+
+    def _ler_texto(self) -> Iterator[str]:
+        """Lê as linhas de um arquivo sem camada binária, calculando o tamanho de cada uma em bytes."""
+        pular = self._bytes_iniciais
+        for linha in self._entrada:
+            tamanho = len(linha.encode(self._codificacao))
+            if pular > 0:
+                pular -= tamanho
+                if pular < 0:
+                    raise ValueError("A entrada não corresponde ao ponto de controle")
+                continue
+            self._pendentes.append(tamanho)
+            yield linha
+
+    @staticmethod
+    def _pular(binario, quantidade: int) -> None:
+        """Avança a entrada binária em quantidade bytes, com seek quando possível."""
+        if not quantidade:
+            return
+        if binario.seekable():
+            binario.seek(quantidade, io.SEEK_CUR)
+            return
+
+        while quantidade > 0:
+            bloco = binario.read(min(quantidade, TAMANHO_BLOCO_DESCARTE))
+            if not bloco:
+                raise ValueError("A entrada não corresponde ao ponto de controle")
+            quantidade -= len(bloco)
+
+    def confirmar(self) -> None:
+        """Confirma a linha lida mais antiga ainda pendente."""
+        self.bytes_confirmados += self._pendentes.popleft()
+
+
+class SaidaComPontoControle:
+    """Envolve a saída bufferizada, gravando um ponto de controle a cada linhas_por_ponto linhas concluídas.
+
+    Cada chamada de escrever_linha conclui uma linha da entrada. Antes de gravar o ponto de controle, a saída e o
+    arquivo de linhas rejeitadas são descarregados, para que os bytes registrados já estejam nos arquivos.
+    """
+
+    def __init__(
+        self,
+        saida: SaidaBufferizada,
+        entrada: EntradaRetomavel,
+        caminho: str,
+        linhas_por_ponto: int,
+        inicial: PontoControle = PontoControle(),
+        rejeitadas: "LinhasRejeitadas | None" = None,
+    ):
+        self._saida = saida
+        self._rejeitadas = rejeitadas
+        self._entrada = entrada
+        self._caminho = caminho
+        self._linhas_por_ponto = linhas_por_ponto
+        self._bytes_saida_iniciais = inicial.bytes_saida
+        self._linhas_iniciais = inicial.linhas
+        self._linhas = 0
+
+    def write(self, texto: str) -> int:
+        return self._saida.write(texto)
+
+    def writelines(self, textos) -> None:
+        self._saida.writelines(textos)
+
+    def escrever_linha(self, texto: str = "") -> None:
+        """Escreve a linha de resultado e grava o ponto de controle quando chega a vez."""
+        self._saida.escrever_linha(texto)
+        self._entrada.confirmar()
+        self._linhas += 1
+        if self._linhas % self._linhas_por_ponto == 0:
+            self.gravar()
+
+    def gravar(self) -> None:
+        """Descarrega a saída e grava o ponto de controle das linhas concluídas até aqui."""
+        self._saida.flush()
+        bytes_rejeitadas = 0
+        if self._rejeitadas is not None:
+            self._rejeitadas.flush()
+            bytes_rejeitadas = self._rejeitadas.bytes_escritos
+        gravar_ponto_controle(
+            self._caminho,
+            PontoControle(
+                bytes_entrada=self._entrada.bytes_confirmados,
+                bytes_saida=self._bytes_saida_iniciais + self._saida.bytes_escritos,
+                linhas=self._linhas_iniciais + self._linhas,
+                bytes_rejeitadas=bytes_rejeitadas,
+            ),
+        )
@@ -0,0 +1,100 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Dict, Iterable, Iterator, List, Mapping
+import zlib
+
+from src.application.container import Container
+
+# Caso de uso da fatia atendida pelo processo worker, com os estados das suas contas (ver _inicializar_worker).
+_use_case = None
+
+
+def fatia_da_conta(conta: str, fatias: int) -> int:
+    """Retorna a fatia de uma conta: o CRC32 do seu texto, que não varia entre processos, módulo fatias."""
+    return zlib.crc32(conta.encode()) % fatias
+
+
+def _inicializar_worker(opcoes_dependencias: Mapping) -> None:
+    """Monta o caso de uso por conta uma única vez no processo worker da fatia."""
+    global _use_case
+    _, _, _, _use_case = Container.get_dependencies(**opcoes_dependencias)
+
+
+def _processar_bloco(linhas: List[str | bytes]) -> None:
+    """Processa, na ordem de entrada, um bloco de registros de contas da fatia do worker."""
+    for linha in linhas:
+        _use_case.execute(linha)
+
+
+def _concluir() -> Dict[str, str]:
+    """Retorna as saídas das contas da fatia do worker."""
+    return _use_case.concluir()
+
+
+def processar_contas(
+    linhas: Iterable[str | bytes],
+    workers: int,
+    tamanho_bloco: int,
+    opcoes_dependencias: Mapping | None = None,
+) -> Iterator[str]:
+    """Processa registros de contas intercalados na entrada e devolve uma saída por conta.
+
+    As contas são divididas em `workers` fatias pelo hash da conta, e cada fatia é atendida sempre pelo mesmo
+    processo, que guarda os estados das suas contas: os registros de uma conta são calculados em ordem, no mesmo
+    processo, e fatias diferentes avançam em paralelo. O processo principal lê apenas a conta de cada registro e envia
+    blocos de tamanho_bloco registros a cada fatia, com no máximo dois blocos em voo por fatia. As saídas são
+    devolvidas ao final, na ordem em que cada conta apareceu pela primeira vez na entrada.
+    """
+    if workers < 1:
+        raise ValueError("Quantidade de workers deve ser maior que zero")
+    if tamanho_bloco < 1:
+        raise ValueError("Tamanho do bloco deve ser maior que zero")
+
+    opcoes = {**(opcoes_dependencias or {}), "contas": True}
+    if workers == 1:
+        _, _, _, use_case = Container.get_dependencies(**opcoes)
+        for linha in linhas:
+            use_case.execute(linha)
+        yield from use_case.concluir().values()
+        return
+
+    input_port = Container.get_input_port()
+    # Um executor de um único processo por fatia: os blocos de uma fatia são executados em ordem, no mesmo processo.
+    executores = [
+        ProcessPoolExecutor(max_workers=1, initializer=_inicializar_worker, initargs=(opcoes,)) for _ in range(workers)
+    ]
+    blocos: List[List[str | bytes]] = [[] for _ in range(workers)]
+    pendentes: List[Deque[Future]] = [deque() for _ in range(workers)]
+    ordem: Dict[str, None] = {}
+
+    def enviar_bloco(fatia: int) -> None:
+        pendentes[fatia].append(executores[fatia].submit(_processar_bloco, blocos[fatia]))
+        blocos[fatia] = []
+        if len(pendentes[fatia]) > 2:
+            pendentes[fatia].popleft().result()
+
+    try:
+        for linha in linhas:
+            conta = input_port.parse_id_conta(linha)
+            ordem.setdefault(conta)
+            fatia = fatia_da_conta(conta, workers)
+            blocos[fatia].append(linha)
+            if len(blocos[fatia]) >= tamanho_bloco:
+                enviar_bloco(fatia)
+
+        for fatia in range(workers):
+            if blocos[fatia]:
+                enviar_bloco(fatia)
+        conclusoes = [executor.submit(_concluir) for executor in executores]
+
+        saidas: Dict[str, str] = {}
+        for fatia in range(workers):
+            while pendentes[fatia]:
+                pendentes[fatia].popleft().result()
+            saidas.update(conclusoes[fatia].result())
+    finally:
+        for executor in executores:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    for conta in ordem:
+        yield saidas[conta]
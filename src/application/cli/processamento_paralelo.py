@@ -0,0 +1,79 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Mapping, Tuple
+
+from src.application.container import Container
+from src.application.use_cases.estatisticas_processamento import EstatisticasProcessamento
+
+# Caso de uso e estatísticas construídos uma única vez por processo worker (ver _inicializar_worker).
+_use_case = None
+_estatisticas: EstatisticasProcessamento | None = None
+
+
+def _inicializar_worker(
+    opcoes_dependencias: Mapping, instrumentado: bool = False, guardar_linhas: bool = True
+) -> None:
+    """Monta as dependências da aplicação uma única vez em cada processo worker."""
+    global _use_case, _estatisticas
+    _estatisticas = EstatisticasProcessamento(guardar_linhas) if instrumentado else None
+    _, _, _, _use_case = Container.get_dependencies(**opcoes_dependencias, estatisticas=_estatisticas)
+
+
+def _processar_bloco(linhas: List[str]) -> Tuple[List[str], EstatisticasProcessamento | None]:
+    """Processa um bloco de linhas no processo worker, preservando a ordem de entrada.
+
+    Retorna também as estatísticas do bloco, se o worker estiver instrumentado.
+    """
+    resultados = [_use_case.execute(linha) for linha in linhas]
+    return resultados, _estatisticas.esvaziar() if _estatisticas is not None else None
+
+
+def processar_em_paralelo(
+    linhas: Iterable[str],
+    workers: int,
+    tamanho_bloco: int,
+    opcoes_dependencias: Mapping | None = None,
+    estatisticas: EstatisticasProcessamento | None = None,
+) -> Iterator[str]:
+    """Distribui blocos de linhas independentes entre processos e devolve os resultados na ordem de entrada.
+
+    Cada linha é uma simulação independente, então os blocos podem ser processados em qualquer worker. Apenas
+    `2 * workers` blocos ficam em voo ao mesmo tempo, o que mantém o consumo de memória limitado mesmo quando a
+    entrada possui milhões de linhas. As opcoes_dependencias são repassadas ao Container.get_dependencies de cada
+    worker. Se estatisticas for informado, as medições de cada bloco são acrescentadas a ele na ordem de entrada.
+    """
+    if workers < 1:
+        raise ValueError("Quantidade de workers deve ser maior que zero")
+    if tamanho_bloco < 1:
+        raise ValueError("Tamanho do bloco deve ser maior que zero")
+
+    linhas = iter(linhas)
+    blocos = iter(lambda: list(islice(linhas, tamanho_bloco)), [])
+    pendentes: Deque[Future] = deque()
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_inicializar_worker,
+        initargs=(
+            dict(opcoes_dependencias or {}),
+            estatisticas is not None,
+            estatisticas is not None and estatisticas.guardar_linhas,
+        ),
+    )
+
+    def concluir_bloco() -> List[str]:
+        resultados, estatisticas_bloco = pendentes.popleft().result()
+        if estatisticas is not None:
+            estatisticas.combinar(estatisticas_bloco)
+        return resultados
+
+    try:
+        for bloco in blocos:
+            pendentes.append(executor.submit(_processar_bloco, bloco))
+            if len(pendentes) >= 2 * workers:
+                yield from concluir_bloco()
+
+        while pendentes:
+            yield from concluir_bloco()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
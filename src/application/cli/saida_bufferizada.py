@@ -0,0 +1,89 @@
+from typing import Iterable, List, TextIO
+
+# Tamanho do buffer de saída, em caracteres (1 Mi).
+TAMANHO_BUFFER = 1 << 20
+
+
+class SaidaBufferizada:
+    """Escreve a saída em blocos grandes diretamente na camada binária do arquivo.
+
+    Os textos escritos são acumulados e, quando somam tamanho_buffer caracteres, são unidos, codificados e escritos
+    de uma só vez, sem passar pela camada de texto a cada linha. Além disso, a saída é descarregada a cada
+    linhas_por_flush linhas (0: apenas ao final). Com descarregar_fragmentos, cada texto é descarregado assim que é
+    escrito, para que a saída incremental de uma linha chegue ao leitor antes do fim da linha. Arquivos sem camada
+    binária recebem o texto unido.
+
+    bytes_escritos conta os bytes já entregues ao arquivo, sem incluir o que ainda está acumulado.
+    """
+
+    def __init__(
+        self,
+        arquivo: TextIO,
+        linhas_por_flush: int = 0,
+        tamanho_buffer: int = TAMANHO_BUFFER,
+        descarregar_fragmentos: bool = False,
+    ):
+        self._arquivo = arquivo
+        self._binario = getattr(arquivo, "buffer", None)
+        self._codificacao = getattr(arquivo, "encoding", None) or "utf-8"
+        self._linhas_por_flush = linhas_por_flush
+        self._tamanho_buffer = tamanho_buffer
+        self._descarregar_fragmentos = descarregar_fragmentos
+        self._partes: List[str] = []
+        self._tamanho = 0
+        self._linhas_pendentes = 0
+        self.bytes_escritos = 0
+
+        if self._binario is not None:
+            # O que já foi escrito na camada de texto precisa sair antes dos bytes escritos diretamente no buffer.
+            arquivo.flush()
+
+    def write(self, texto: str) -> int:
+        """Acumula o texto e escreve o buffer no arquivo quando ele enche, ou já com descarregar_fragmentos."""
+        self._partes.append(texto)
+        self._tamanho += len(texto)
+        if self._descarregar_fragmentos:
+            self._descarregar()
+            (self._binario or self._arquivo).flush()
+        elif self._tamanho >= self._tamanho_buffer:
+            self._descarregar()
+        return len(texto)
+
+    def writelines(self, textos: Iterable[str]) -> None:
+        """Acumula cada um dos textos."""
+        for texto in textos:
+            self.write(texto)
+
+    def escrever_linha(self, texto: str = "") -> None:
+        """Escreve o texto seguido de uma quebra de linha, aplicando a política de descarga."""
+        self.write(texto + "\n")
+        self._linhas_pendentes += 1
+        if self._linhas_por_flush and self._linhas_pendentes >= self._linhas_por_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Escreve o conteúdo acumulado e descarrega o arquivo."""
+        self._descarregar()
+        self._linhas_pendentes = 0
+        (self._binario or self._arquivo).flush()
+
+    def _descarregar(self) -> None:
+        """Escreve o conteúdo acumulado no arquivo, sem descarregá-lo."""
+        if not self._partes:
+            return
+
+        texto = "".join(self._partes)
+        self._partes = []
+        self._tamanho = 0
+        dados = texto.encode(self._codificacao)
+        self.bytes_escritos += len(dados)
+        if self._binario is not None:
+            self._binario.write(dados)
+        else:
+            self._arquivo.write(texto)
+
+    def __enter__(self) -> "SaidaBufferizada":
+        return self
+
+    def __exit__(self, *excecao) -> None:
+        self.flush()
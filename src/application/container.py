@@ -1,35 +1,203 @@
-from src.adapters.input.json_parser import JsonParser
-from src.adapters.output.json_formatter import JsonFormatter
-from src.application.use_cases.calcular_impostos_use_case import CalcularImpostosUseCase
+import importlib
+from typing import TYPE_CHECKING
+
 from src.domain.ports.input.operacoes_input_port import OperacoesInputPort
 from src.domain.ports.output.impostos_output_port import ImpostosOutputPort
-from src.domain.services.calcular_imposto_service import CalcularImpostoService
+from src.domain.ports.services.calcular_imposto_service_port import CalcularImpostoServicePort
+
+if TYPE_CHECKING:
+    from src.adapters.cache.cache_lru import CacheLru
+    from src.application.use_cases.estatisticas_processamento import EstatisticasProcessamento
+    from src.domain.models.regra_imposto import RegraImposto, TabelaRegras
 
 
 class Container:
-    """Container para gerenciar dependências da aplicação."""
+    """Container para gerenciar dependências da aplicação.
+
+    Os adaptadores, casos de uso e motores de cálculo são importados apenas quando pedidos, para que a inicialização
+    da CLI carregue somente o que a configuração escolhida usa: o SQLite e os casos de uso opcionais ficam fora da
+    configuração padrão.
+    """
+
+    # Motores de cálculo disponíveis, selecionados pelo nome em get_service: o módulo e a classe de cada serviço.
+    MOTORES = {
+        "decimal": ("src.domain.services.calcular_imposto_service", "CalcularImpostoService"),
+        "local": ("src.domain.services.calcular_imposto_local_service", "CalcularImpostoLocalService"),
+    }
+
+    # Métodos de apuração do custo das ações vendidas: o preço médio, aceito por todos os motores, e os lotes
+    # consumidos em ordem FIFO ou LIFO, apenas no motor decimal.
+    METODOS_CUSTO = ("medio", "fifo", "lifo")
+
+    # Formatos de entrada e saída disponíveis: o JSON, uma carteira por linha, e os registros binários em colunas.
+    FORMATOS = ("json", "binario")
 
     @classmethod
-    def get_dependencies(cls):
-        """Retorna as dependências configuradas para a aplicação."""
-        input_port = cls.get_input_port()
-        output_port = cls.get_output_port()
-        service = cls.get_service()
-        use_case = CalcularImpostosUseCase(input_port, service, output_port)
+    def get_dependencies(
+        cls,
+        streaming: bool = False,
+        motor: str = "decimal",
+        compacto: bool = False,
+        estatisticas: "EstatisticasProcessamento | None" = None,
+        limite_cache_bytes: int = 0,
+        arquivo_cache: str | None = None,
+        limite_prefixos: int = 0,
+        formato: str = "json",
+        contas: bool = False,
+        tolerante: bool = False,
+        metodo_custo: str = "medio",
+        regra: "RegraImposto | None" = None,
+    ):
+        """Retorna as dependências configuradas para a aplicação.
+
+        Quando estatisticas é informado, o caso de uso registra nele as medições de cada linha processada. Com
+        limite_prefixos, o caso de uso retoma o cálculo de carteiras reenviadas com novas operações no final (não pode
+        ser combinado com estatisticas). Com limite_cache_bytes ou arquivo_cache, o caso de uso é envolvido por um
+        cache das saídas de linhas repetidas, com chaves que incluem o motor e o método de custo. O formato escolhe os
+        adaptadores de entrada e de saída. Com contas, o caso de uso lê registros com a conta e acumula o estado de
+        cada conta (apenas com o JSON não incremental e sem estatísticas, prefixos, cache nem tolerância). Com
+        tolerante, uma linha com erro é respondida com um registro de erro, sem interromper o processamento. O
+        metodo_custo escolhe como o custo das ações vendidas é apurado; o custo por lotes não pode ser retomado de um
+        estado salvo nem guardado no cache persistente. A regra substitui a alíquota e o limite de isenção padrão do
+        motor e também não pode ser combinada com o cache persistente, cujas saídas não registram a regra usada.
+        """
+        input_port = cls.get_input_port(streaming, compacto, formato)
+        output_port = cls.get_output_port(formato)
+        service = cls.get_service(motor, metodo_custo, regra)
+        if regra is not None and arquivo_cache:
+            raise ValueError("A regra do imposto não pode ser combinada com o cache em arquivo")
+        if estatisticas is not None and limite_prefixos:
+            raise ValueError("As estatísticas não podem ser combinadas com a retomada de prefixos")
+        if metodo_custo != "medio" and (limite_prefixos or contas or arquivo_cache):
+            raise ValueError(
+                "O custo por lotes não pode ser combinado com a retomada de prefixos, as contas nem o cache em arquivo"
+            )
+        if contas:
+            if streaming or compacto or formato != "json":
+                raise ValueError("O processamento por conta requer o formato JSON sem leitura incremental ou compacta")
+            if estatisticas is not None or limite_prefixos or limite_cache_bytes or arquivo_cache or tolerante:
+                raise ValueError(
+                    "O processamento por conta não pode ser combinado com estatísticas, prefixos, cache nem tolerância"
+                )
+            from src.application.use_cases.calcular_impostos_contas_use_case import CalcularImpostosContasUseCase
+
+            return input_port, service, output_port, CalcularImpostosContasUseCase(input_port, service, output_port)
+        if estatisticas is not None:
+            from src.application.use_cases.calcular_impostos_instrumentado_use_case import (
+                CalcularImpostosInstrumentadoUseCase,
+            )
+
+            use_case = CalcularImpostosInstrumentadoUseCase(input_port, service, output_port, estatisticas)
+        elif limite_prefixos:
+            from src.application.use_cases.calcular_impostos_incremental_use_case import (
+                CalcularImpostosIncrementalUseCase,
+            )
+
+            use_case = CalcularImpostosIncrementalUseCase(input_port, service, output_port, limite_prefixos)
+        else:
+            from src.application.use_cases.calcular_impostos_use_case import CalcularImpostosUseCase
+
+            use_case = CalcularImpostosUseCase(input_port, service, output_port)
+        if limite_cache_bytes or arquivo_cache:
+            from src.application.use_cases.calcular_impostos_cache_use_case import CalcularImpostosCacheUseCase
+
+            use_case = CalcularImpostosCacheUseCase(
+                use_case, cls.get_cache(limite_cache_bytes, arquivo_cache), f"{motor}|{metodo_custo}"
+            )
+        if tolerante:
+            from src.application.use_cases.calcular_impostos_tolerante_use_case import (
+                CalcularImpostosToleranteUseCase,
+            )
+
+            use_case = CalcularImpostosToleranteUseCase(use_case, output_port)
 
         return input_port, service, output_port, use_case
 
     @classmethod
-    def get_input_port(cls) -> OperacoesInputPort:
-        """Retorna o adaptador de entrada configurado."""
+    def get_input_port(
+        cls, streaming: bool = False, compacto: bool = False, formato: str = "json"
+    ) -> OperacoesInputPort:
+        """Retorna o adaptador de entrada configurado.
+
+        O formato binário já entrega as operações num lote compacto e não tem leitura incremental.
+        """
+        if formato == "binario":
+            if streaming:
+                raise ValueError("O formato binário não pode ser lido de forma incremental")
+            from src.adapters.input.binario_parser import BinarioParser
+
+            return BinarioParser()
+        if formato != "json":
+            raise ValueError(f"Formato desconhecido: {formato}")
+        if streaming:
+            from src.adapters.input.json_stream_parser import JsonStreamParser
+
+            return JsonStreamParser()
+        if compacto:
+            from src.adapters.input.json_parser import JsonLoteParser
+
+            return JsonLoteParser()
+        from src.adapters.input.json_parser import JsonParser
+
         return JsonParser()
 
     @classmethod
-    def get_output_port(cls) -> ImpostosOutputPort:
+    def get_output_port(cls, formato: str = "json") -> ImpostosOutputPort:
         """Retorna o adaptador de saída configurado."""
+        if formato == "binario":
+            from src.adapters.output.binario_formatter import BinarioFormatter
+
+            return BinarioFormatter()
+        if formato != "json":
+            raise ValueError(f"Formato desconhecido: {formato}")
+        from src.adapters.output.json_formatter import JsonFormatter
+
         return JsonFormatter()
 
     @classmethod
-    def get_service(cls):
-        """Retorna o serviço de cálculo de impostos."""
-        return CalcularImpostoService()
+    def get_cache(cls, limite_bytes: int = 0, arquivo: str | None = None) -> "CacheLru":
+        """Retorna o cache de resultados, limitado a limite_bytes em memória e persistido no arquivo, se informado."""
+        from src.adapters.cache.cache_lru import CacheLru
+
+        persistencia = None
+        if arquivo:
+            from src.adapters.cache.persistencia_sqlite import PersistenciaSqlite
+
+            persistencia = PersistenciaSqlite(arquivo)
+        return CacheLru(limite_bytes, persistencia)
+
+    @classmethod
+    def get_service(
+        cls, motor: str = "decimal", metodo_custo: str = "medio", regra: "RegraImposto | None" = None
+    ) -> CalcularImpostoServicePort:
+        """Retorna o serviço de cálculo de impostos do motor, do método de custo e da regra do imposto informados."""
+        try:
+            modulo, classe = cls.MOTORES[motor]
+        except KeyError:
+            raise ValueError(f"Motor de cálculo desconhecido: {motor}")
+        if metodo_custo not in cls.METODOS_CUSTO:
+            raise ValueError(f"Método de custo desconhecido: {metodo_custo}")
+        if metodo_custo == "medio":
+            return getattr(importlib.import_module(modulo), classe)(regra=regra)
+        if motor != "decimal":
+            raise ValueError("O custo por lotes (FIFO ou LIFO) requer o motor decimal")
+
+        from src.domain.models.investimento_lotes import MetodoCusto
+        from src.domain.services.calcular_imposto_service import CalcularImpostoService
+
+        return CalcularImpostoService(MetodoCusto(metodo_custo), regra)
+
+    @classmethod
+    def get_tabela_regras(cls, arquivo: str) -> "TabelaRegras":
+        """Carrega a tabela de regras do imposto de um arquivo JSON, lido e validado uma única vez."""
+        from decimal import Decimal
+        import json
+
+        from src.domain.models.regra_imposto import TabelaRegras
+
+        with open(arquivo) as entrada:
+            try:
+                dados = json.load(entrada, parse_float=Decimal)
+            except json.JSONDecodeError as erro:
+                raise ValueError(f"Tabela de regras do imposto inválida: {erro}")
+        return TabelaRegras.de_dict(dados)
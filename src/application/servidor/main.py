@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import signal
+import sys
+from typing import Sequence
+
+from src.application.container import Container
+from src.application.servidor.servidor_impostos import TAMANHO_MAXIMO_LINHA, ServidorImpostos
+
+
+def _inteiro_nao_negativo(valor: str) -> int:
+    """Converte o argumento em um inteiro maior ou igual a zero."""
+    try:
+        numero = int(valor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"valor inteiro inválido: {valor!r}")
+
+    if numero < 0:
+        raise argparse.ArgumentTypeError(f"o valor não pode ser negativo: {valor!r}")
+    return numero
+
+
+def _inteiro_positivo(valor: str) -> int:
+    """Converte o argumento em um inteiro maior que zero."""
+    numero = _inteiro_nao_negativo(valor)
+    if numero == 0:
+        raise argparse.ArgumentTypeError(f"o valor deve ser maior que zero: {valor!r}")
+    return numero
+
+
+def _criar_parser_argumentos() -> argparse.ArgumentParser:
+    """Cria o parser dos argumentos aceitos pelo servidor."""
+    parser = argparse.ArgumentParser(
+        description="Servidor que calcula o imposto sobre ganho de capital de carteiras recebidas por socket, uma "
+        "carteira em JSON por linha."
+    )
+    parser.add_argument("--socket", metavar="CAMINHO", help="Socket Unix onde o servidor aceita conexões.")
+    parser.add_argument("--host", default="127.0.0.1", help="Endereço TCP, quando --socket não é informado.")
+    parser.add_argument(
+        "--port", type=_inteiro_nao_negativo, default=8765, help="Porta TCP, quando --socket não é informado."
+    )
+    parser.add_argument(
+        "--workers",
+        type=_inteiro_nao_negativo,
+        default=0,
+        help="Quantidade de processos que calculam os blocos de linhas (padrão: 0, no próprio processo).",
+    )
+    parser.add_argument(
+        "--max-line-bytes",
+        type=_inteiro_positivo,
+        default=TAMANHO_MAXIMO_LINHA,
+        help="Tamanho máximo de uma linha, em bytes; uma linha maior é respondida com um erro e encerra a conexão "
+        f"(padrão: {TAMANHO_MAXIMO_LINHA}).",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=sorted(Container.MOTORES),
+        default="decimal",
+        help="Motor de cálculo dos impostos (padrão: decimal).",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Lê as operações de cada linha num lote compacto em colunas, com os preços em centavos.",
+    )
+    return parser
+
+
+async def _servir(servidor: ServidorImpostos, argumentos: argparse.Namespace) -> None:
+    """Aceita conexões até o processo receber SIGINT ou SIGTERM."""
+    servidor_socket = await servidor.iniciar(argumentos.socket, argumentos.host, argumentos.port)
+    encerrar = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sinal in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sinal, encerrar.set)
+
+    enderecos = ", ".join(str(escuta.getsockname()) for escuta in servidor_socket.sockets)
+    sys.stderr.write(f"Servidor aguardando conexões em {enderecos}\n")
+    async with servidor_socket:
+        await encerrar.wait()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Ponto de entrada do servidor de cálculo de ganho de capital."""
+    argumentos = _criar_parser_argumentos().parse_args(argv or [])
+    opcoes_dependencias = {"motor": argumentos.engine, "compacto": argumentos.compact}
+
+    servidor = ServidorImpostos(
+        opcoes_dependencias, argumentos.workers, tamanho_maximo_linha=argumentos.max_line_bytes
+    )
+    try:
+        asyncio.run(_servir(servidor, argumentos))
+    finally:
+        servidor.fechar()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,214 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+from typing import AsyncIterator, List, Mapping
+
+from src.application.container import Container
+from src.application.use_cases.calcular_impostos_cache_use_case import CalcularImpostosCacheUseCase
+from src.application.use_cases.calcular_impostos_use_case import CalcularImpostosUseCase
+from src.domain.ports.output.impostos_output_port import ImpostosOutputPort
+
+# Quantidade de bytes lidos da conexão por vez; as linhas completas de cada leitura formam um bloco.
+TAMANHO_LEITURA = 1 << 16
+# Tamanho máximo padrão de uma linha, em bytes, guardada em memória até a sua quebra de linha chegar.
+TAMANHO_MAXIMO_LINHA = 64 << 20
+
+# Caso de uso e porta de saída construídos uma única vez por processo worker (ver _inicializar_worker).
+_use_case = None
+_impostos_output = None
+
+
+def _inicializar_worker(opcoes_dependencias: Mapping) -> None:
+    """Monta as dependências da aplicação uma única vez em cada processo worker."""
+    global _use_case, _impostos_output
+    _, _, _impostos_output, _use_case = Container.get_dependencies(**opcoes_dependencias)
+
+
+def _worker_pronto() -> None:
+    """Tarefa vazia usada para iniciar os workers antes da primeira conexão."""
+
+
+def _resposta_erro(impostos_output: ImpostosOutputPort, exception: Exception) -> str:
+    """Formata, com a porta de saída, a resposta de uma linha cujo cálculo falhou."""
+    return impostos_output.formatar_erro(f"Erro ao processar entrada: {str(exception)}")
+
+
+def responder_linhas(
+    use_case: CalcularImpostosUseCase | CalcularImpostosCacheUseCase,
+    linhas: List[str],
+    impostos_output: ImpostosOutputPort,
+) -> bytes:
+    """Calcula a resposta de cada linha, uma por linha da saída.
+
+    Uma linha inválida é respondida com o registro de erro da porta de saída, sem afetar as demais nem encerrar a
+    conexão.
+    """
+    respostas = []
+    for linha in linhas:
+        try:
+            respostas.append(use_case.execute(linha))
+        except Exception as exception:
+            respostas.append(_resposta_erro(impostos_output, exception))
+    respostas.append("")
+    return "\n".join(respostas).encode()
+
+
+def _responder_bloco(linhas: List[str]) -> bytes:
+    """Calcula as respostas de um bloco de linhas no processo worker."""
+    return responder_linhas(_use_case, linhas, _impostos_output)
+
+
+def _linha_muito_longa(tamanho_maximo_linha: int) -> ValueError:
+    """Cria o erro de uma linha que passou do tamanho máximo."""
+    return ValueError(f"Linha excede o tamanho máximo de {tamanho_maximo_linha} bytes")
+
+
+async def ler_blocos(
+    reader: asyncio.StreamReader, tamanho_maximo_linha: int = TAMANHO_MAXIMO_LINHA
+) -> AsyncIterator[List[str]]:
+    """Lê a conexão em blocos grandes e produz, a cada leitura, as linhas completas recebidas até ali.
+
+    Linhas vazias são ignoradas. Uma linha sem quebra de linha no final é entregue quando a conexão é encerrada.
+
+    Raises:
+        ValueError: Se uma linha passar de tamanho_maximo_linha bytes, assim que isso é percebido; as linhas
+            completas anteriores a ela já foram entregues
+    """
+    pendentes: List[bytes] = []
+    tamanho_pendente = 0
+    while dados := await reader.read(TAMANHO_LEITURA):
+        fim = dados.rfind(b"\n") + 1
+        if not fim:
+            # Uma linha grande chega em várias leituras; os pedaços só são unidos quando ela termina, e a memória
+            # guardada por ela é limitada pelo tamanho máximo.
+            tamanho_pendente += len(dados)
+            if tamanho_pendente > tamanho_maximo_linha:
+                raise _linha_muito_longa(tamanho_maximo_linha)
+            pendentes.append(dados)
+            continue
+
+        pendentes.append(dados[:fim])
+        bloco = b"".join(pendentes)
+        pendentes = [dados[fim:]] if fim < len(dados) else []
+        tamanho_pendente = len(dados) - fim
+        if len(bloco) > tamanho_maximo_linha:
+            # Só um bloco maior que o tamanho máximo pode conter uma linha acima dele.
+            linhas_bloco = bloco.split(b"\n")
+            for indice, linha in enumerate(linhas_bloco):
+                if len(linha) > tamanho_maximo_linha:
+                    anteriores = [anterior.decode() for anterior in linhas_bloco[:indice] if anterior.strip()]
+                    if anteriores:
+                        yield anteriores
+                    raise _linha_muito_longa(tamanho_maximo_linha)
+        linhas = [linha for linha in bloco.decode().splitlines() if linha.strip()]
+        if linhas:
+            yield linhas
+
+    if tamanho_pendente > tamanho_maximo_linha:
+        raise _linha_muito_longa(tamanho_maximo_linha)
+    restante = b"".join(pendentes).decode()
+    if restante.strip():
+        yield [restante]
+
+
+class ServidorImpostos:
+    """Servidor assíncrono que mantém as dependências montadas e calcula as carteiras recebidas por socket.
+
+    Cada conexão envia carteiras em JSON, uma por linha, e recebe uma resposta por linha, na mesma ordem. O cliente
+    não precisa esperar a resposta para enviar a próxima linha: as linhas completas de cada leitura formam um bloco,
+    calculado enquanto as próximas são recebidas. Sem workers, os blocos são calculados no próprio processo, numa
+    única thread separada, para que o cálculo não bloqueie o laço de eventos; com workers, em um pool de processos.
+    Em ambos os casos, há no máximo blocos_em_voo blocos pendentes por conexão. Uma linha acima de
+    tamanho_maximo_linha bytes é respondida com um registro de erro e encerra a conexão, sem ser lida até o fim.
+    """
+
+    def __init__(
+        self,
+        opcoes_dependencias: Mapping | None = None,
+        workers: int = 0,
+        blocos_em_voo: int = 0,
+        tamanho_maximo_linha: int = TAMANHO_MAXIMO_LINHA,
+    ):
+        if workers < 0:
+            raise ValueError("Quantidade de workers não pode ser negativa")
+        if tamanho_maximo_linha < 1:
+            raise ValueError("Tamanho máximo da linha deve ser maior que zero")
+
+        opcoes_dependencias = dict(opcoes_dependencias or {})
+        self._blocos_em_voo = blocos_em_voo or 2 * max(workers, 1)
+        self._tamanho_maximo_linha = tamanho_maximo_linha
+        self._use_case = None
+        _, _, self._impostos_output, use_case = Container.get_dependencies(**opcoes_dependencias)
+        if workers:
+            # Com fork, os workers criados depois de uma conexão aceita herdariam o socket dela, e o cliente não
+            # veria o fim da conexão quando o servidor a fechasse; com spawn, nenhum descritor é herdado.
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_inicializar_worker,
+                initargs=(opcoes_dependencias,),
+            )
+            # Os workers só são criados na primeira tarefa; iniciá-los aqui tira da primeira requisição o custo de
+            # criar os processos e montar as dependências em cada um.
+            for futuro in [self._executor.submit(_worker_pronto) for _ in range(workers)]:
+                futuro.result()
+        else:
+            # Uma única thread: os blocos de todas as conexões usam o mesmo caso de uso, um de cada vez.
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="calculo")
+            self._use_case = use_case
+
+    async def iniciar(self, caminho_socket: str | None = None, host: str = "127.0.0.1", porta: int = 0):
+        """Começa a aceitar conexões no socket Unix informado ou, sem ele, em host e porta TCP."""
+        if caminho_socket:
+            return await asyncio.start_unix_server(self._atender, path=caminho_socket)
+        return await asyncio.start_server(self._atender, host, porta)
+
+    def fechar(self) -> None:
+        """Encerra o pool de processos ou a thread de cálculo."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _calcular(self, linhas: List[str]) -> asyncio.Future:
+        """Agenda o cálculo das respostas de um bloco de linhas fora do laço de eventos."""
+        loop = asyncio.get_running_loop()
+        if self._use_case is None:
+            return loop.run_in_executor(self._executor, _responder_bloco, linhas)
+        return loop.run_in_executor(self._executor, responder_linhas, self._use_case, linhas, self._impostos_output)
+
+    async def _atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Atende uma conexão: lê os blocos de linhas e escreve as respostas na ordem em que chegaram."""
+        respostas: asyncio.Queue = asyncio.Queue(maxsize=self._blocos_em_voo)
+        escritor = asyncio.create_task(self._escrever_respostas(respostas, writer))
+        try:
+            async for linhas in ler_blocos(reader, self._tamanho_maximo_linha):
+                await respostas.put((self._calcular(linhas), len(linhas)))
+        except ConnectionError:
+            pass
+        except ValueError as exception:
+            # A linha acima do tamanho máximo (ou com bytes que não são UTF-8) recebe o registro de erro, depois das
+            # respostas das linhas anteriores, e a conexão é encerrada sem ler o restante.
+            erro = asyncio.get_running_loop().create_future()
+            erro.set_exception(exception)
+            await respostas.put((erro, 1))
+        finally:
+            await respostas.put(None)
+            await escritor
+            writer.close()
+
+    async def _escrever_respostas(self, respostas: asyncio.Queue, writer: asyncio.StreamWriter) -> None:
+        """Escreve as respostas de cada bloco assim que ficam prontas, respeitando a ordem dos blocos."""
+        conectado = True
+        while (pendente := await respostas.get()) is not None:
+            futuro, quantidade_linhas = pendente
+            try:
+                resposta = await futuro
+            except Exception as exception:
+                # Uma falha do bloco todo (por exemplo, um worker encerrado) é respondida em cada uma das suas linhas.
+                resposta = ((_resposta_erro(self._impostos_output, exception) + "\n") * quantidade_linhas).encode()
+            if not conectado:
+                # O cliente desconectou: os blocos restantes só são consumidos, para a leitura não ficar bloqueada.
+                continue
+            try:
+                writer.write(resposta)
+                await writer.drain()
+            except ConnectionError:
+                conectado = False
@@ -0,0 +1,120 @@
+import hashlib
+from typing import Iterable, Iterator, List, TextIO
+
+from src.adapters.cache.cache_lru import CacheLru
+from src.application.use_cases.calcular_impostos_use_case import CalcularImpostosUseCase
+
+# Tamanho máximo, em caracteres, da cópia de uma saída incremental quando o cache grava no disco: a saída pode passar
+# do limite da memória (zero quando só --cache-file é usado) e ainda assim ser persistida.
+LIMITE_COPIA_PERSISTIDA = 64 * 1024 * 1024
+
+
+def chave_entrada(input_data: str | bytes, configuracao: str = "") -> bytes:
+    """Calcula a chave de cache de uma linha de entrada: o hash BLAKE2b da configuração e da linha sem espaços nas
+    extremidades.
+
+    A mesma linha em texto ou em bytes UTF-8 gera a mesma chave. A configuração do cálculo (o motor e o método de
+    custo) separa as saídas da mesma linha calculadas de formas diferentes num arquivo de cache reaproveitado.
+    """
+    dados = input_data.strip()
+    if isinstance(dados, str):
+        dados = dados.encode()
+    hash_entrada = hashlib.blake2b(configuracao.encode(), digest_size=16)
+    hash_entrada.update(b"\n")
+    hash_entrada.update(dados)
+    return hash_entrada.digest()
+
+
+class _CopiaLimitada:
+    """Acumula uma cópia dos fragmentos de saída enquanto eles somarem até `limite` caracteres."""
+
+    def __init__(self, limite: int):
+        self._limite = limite
+        self._tamanho = 0
+        self.partes: List[str] | None = []
+
+    def copiar(self, texto: str) -> None:
+        if self.partes is None:
+            return
+        self._tamanho += len(texto)
+        if self._tamanho > self._limite:
+            self.partes = None
+        else:
+            self.partes.append(texto)
+
+
+class _ArquivoComCopia:
+    """Envolve um arquivo de texto guardando uma cópia limitada do que é escrito nele."""
+
+    def __init__(self, arquivo: TextIO, copia: _CopiaLimitada):
+        self._arquivo = arquivo
+        self._copia = copia
+
+    def write(self, texto: str) -> int:
+        self._copia.copiar(texto)
+        return self._arquivo.write(texto)
+
+    def writelines(self, textos: Iterable[str]) -> None:
+        for texto in textos:
+            self.write(texto)
+
+
+class CalcularImpostosCacheUseCase:
+    """Envolve um caso de uso de cálculo de impostos, reaproveitando a saída de linhas já processadas.
+
+    Linhas idênticas (reprocessamentos, novas tentativas e carteiras modelo) são identificadas pelo hash do seu
+    conteúdo e respondidas com a saída formatada guardada no cache, sem ler, calcular nem formatar de novo. Linhas com
+    erro não são guardadas. As chaves incluem a configuração do cálculo, para que um arquivo de cache reaproveitado
+    com outro motor não responda com as saídas da configuração anterior. No modo incremental (execute_to_file e
+    iter_execute), a saída de uma falha é copiada enquanto é produzida e só é guardada se couber no limite do cache,
+    para não acumular saídas gigantes em memória; com o cache persistido no disco, o limite da cópia é o maior entre o
+    da memória e LIMITE_COPIA_PERSISTIDA.
+    """
+
+    def __init__(self, use_case: CalcularImpostosUseCase, cache: CacheLru, configuracao: str = ""):
+        self._use_case = use_case
+        self.cache = cache
+        self._configuracao = configuracao
+
+    def _criar_copia(self) -> _CopiaLimitada:
+        """Cria a cópia da saída incremental, limitada ao maior resultado que o cache consegue guardar."""
+        if self.cache.persistente:
+            return _CopiaLimitada(max(self.cache.limite_bytes, LIMITE_COPIA_PERSISTIDA))
+        return _CopiaLimitada(self.cache.limite_bytes)
+
+    def execute(self, input_data: str | bytes) -> str:
+        """Retorna a saída guardada para a linha ou executa o caso de uso e guarda a saída."""
+        chave = chave_entrada(input_data, self._configuracao)
+        saida = self.cache.obter(chave)
+        if saida is None:
+            saida = self._use_case.execute(input_data)
+            self.cache.guardar(chave, saida)
+        return saida
+
+    def iter_execute(self, input_data: str) -> Iterator[str]:
+        """Produz a saída guardada para a linha ou a saída incremental do caso de uso, guardando-a ao final."""
+        chave = chave_entrada(input_data, self._configuracao)
+        saida = self.cache.obter(chave)
+        if saida is not None:
+            yield saida
+            return
+
+        copia = self._criar_copia()
+        for fragmento in self._use_case.iter_execute(input_data):
+            copia.copiar(fragmento)
+            yield fragmento
+        if copia.partes is not None:
+            self.cache.guardar(chave, "".join(copia.partes))
+
+    def execute_to_file(self, input_data: str, arquivo: TextIO) -> None:
+        """Escreve no arquivo a saída guardada para a linha ou a saída incremental do caso de uso, guardando-a."""
+        chave = chave_entrada(input_data, self._configuracao)
+        saida = self.cache.obter(chave)
+        if saida is not None:
+            arquivo.write(saida)
+            return
+
+        copia = self._criar_copia()
+        self._use_case.execute_to_file(input_data, _ArquivoComCopia(arquivo, copia))
+        if copia.partes is not None:
+            self.cache.guardar(chave, "".join(copia.partes))
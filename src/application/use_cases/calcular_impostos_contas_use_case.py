@@ -0,0 +1,40 @@
+from typing import Dict, List, Tuple
+
+from src.domain.models.estado_calculo import EstadoCalculo
+from src.domain.ports.input.operacoes_input_port import OperacoesInputPort
+from src.domain.ports.output.impostos_output_port import ImpostosOutputPort
+from src.domain.ports.services.calcular_imposto_service_port import CalcularImpostoServicePort
+
+
+class CalcularImpostosContasUseCase:
+    """Caso de uso que calcula os impostos de várias contas, com os registros de uma mesma conta intercalados.
+
+    Cada registro traz a conta e uma parte das suas operações. O EstadoCalculo de cada conta (posições e prejuízo
+    acumulado) fica num dicionário indexado pela conta, então um registro é calculado a partir do estado deixado pelo
+    registro anterior da mesma conta, como se as operações da conta estivessem numa única linha. As saídas de cada
+    registro são guardadas e reunidas por conta em concluir.
+    """
+
+    def __init__(
+        self,
+        operacoes_input: OperacoesInputPort,
+        imposto_service: CalcularImpostoServicePort,
+        impostos_output: ImpostosOutputPort,
+    ):
+        self._operacoes_input = operacoes_input
+        self._imposto_service = imposto_service
+        self._impostos_output = impostos_output
+        self._contas: Dict[str, Tuple[EstadoCalculo, List[str]]] = {}
+
+    def execute(self, input_data: str | bytes) -> None:
+        """Calcula as operações de um registro a partir do estado da sua conta e guarda a saída formatada."""
+        conta, operacoes = self._operacoes_input.parse_conta(input_data)
+        estado, saidas = self._contas.get(conta, (None, []))
+        impostos, estado = self._imposto_service.calcular_impostos_com_estado(operacoes, estado)
+        saidas.append(self._impostos_output.formatar_impostos(impostos))
+        self._contas[conta] = (estado, saidas)
+
+    def concluir(self) -> Dict[str, str]:
+        """Retorna a saída de cada conta, na ordem em que as contas apareceram, e descarta os estados guardados."""
+        contas, self._contas = self._contas, {}
+        return {conta: self._impostos_output.formatar_conta(conta, saidas) for conta, (_, saidas) in contas.items()}
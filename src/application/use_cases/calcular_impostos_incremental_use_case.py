@@ -0,0 +1,112 @@
+from collections import Counter, OrderedDict
+import hashlib
+from typing import Iterable, Tuple
+
+from src.application.use_cases.calcular_impostos_use_case import CalcularImpostosUseCase
+from src.domain.models.estado_calculo import EstadoCalculo
+from src.domain.ports.input.operacoes_input_port import OperacoesInputPort
+from src.domain.ports.output.impostos_output_port import ImpostosOutputPort
+from src.domain.ports.services.calcular_imposto_service_port import CalcularImpostoServicePort
+
+
+def _hash_prefixo(prefixo: str) -> bytes:
+    """Calcula o hash BLAKE2b do texto de um prefixo de carteira."""
+    return hashlib.blake2b(prefixo.encode(), digest_size=16).digest()
+
+
+class CalcularImpostosIncrementalUseCase(CalcularImpostosUseCase):
+    """Caso de uso que retoma o cálculo de carteiras reenviadas com novas operações no final.
+
+    Para cada linha processada, guarda o EstadoCalculo final e a saída formatada, identificados pelo texto da linha
+    até o último objeto (o tamanho e o hash desse prefixo). Quando uma nova linha começa com o mesmo texto seguido de
+    mais operações, apenas essas operações são lidas e calculadas a partir do estado guardado, e os seus impostos são
+    acrescentados à saída anterior: o custo é proporcional às operações acrescentadas, não ao histórico.
+
+    O prefixo precisa ser textualmente idêntico ao da linha anterior. Os estados das limite_prefixos linhas usadas
+    mais recentemente são mantidos em memória. Apenas execute reaproveita os prefixos; os modos incrementais
+    (iter_execute e execute_to_file) processam a linha inteira.
+    """
+
+    def __init__(
+        self,
+        operacoes_input: OperacoesInputPort,
+        imposto_service: CalcularImpostoServicePort,
+        impostos_output: ImpostosOutputPort,
+        limite_prefixos: int,
+    ):
+        super().__init__(operacoes_input, imposto_service, impostos_output)
+        self._limite_prefixos = limite_prefixos
+        self._prefixos: OrderedDict[Tuple[int, bytes], Tuple[EstadoCalculo, str]] = OrderedDict()
+        # Quantidade de prefixos guardados com cada tamanho, para testar apenas as posições que podem coincidir.
+        self._tamanhos: Counter = Counter()
+        self.prefixos_reaproveitados = 0
+
+    def execute(self, input_data: str) -> str:
+        """Executa o fluxo de cálculo, retomando do estado de um prefixo já processado quando houver."""
+        linha = input_data.strip()
+        encontrado = self._buscar_prefixo(linha)
+
+        if encontrado is None:
+            operacoes = self._operacoes_input.iter_operations(linha)
+            impostos, estado = self._imposto_service.calcular_impostos_com_estado(operacoes)
+            saida = self._impostos_output.formatar_impostos(impostos)
+        else:
+            tamanho, estado, saida = encontrado
+            self.prefixos_reaproveitados += 1
+            resto = linha[tamanho:].lstrip()
+            if resto.startswith(","):
+                # A cauda "[op, op, ...]" é lida e calculada a partir do estado do prefixo.
+                cauda = self._operacoes_input.iter_operations("[" + resto[1:])
+                impostos, estado = self._imposto_service.calcular_impostos_com_estado(cauda, estado)
+                if impostos:
+                    saida_cauda = self._impostos_output.formatar_impostos(impostos)
+                    saida = saida[:-1] + "," + saida_cauda[1:]
+
+        self._guardar(linha, estado, saida)
+        return saida
+
+    def _buscar_prefixo(self, linha: str) -> Tuple[int, EstadoCalculo, str] | None:
+        """Procura o maior prefixo guardado com que a linha começa, seguido de mais operações ou do fim do array."""
+        if not self._prefixos:
+            return None
+
+        for tamanho in self._posicoes_candidatas(linha):
+            chave = (tamanho, _hash_prefixo(linha[:tamanho]))
+            guardado = self._prefixos.get(chave)
+            if guardado is not None and linha[tamanho:].lstrip()[:1] in (",", "]"):
+                self._prefixos.move_to_end(chave)
+                estado, saida = guardado
+                return tamanho, estado, saida
+        return None
+
+    def _posicoes_candidatas(self, linha: str) -> Iterable[int]:
+        """Produz, da maior para a menor, as posições logo após um "}" com algum prefixo guardado desse tamanho."""
+        if len(self._tamanhos) < linha.count("}"):
+            for tamanho in sorted(self._tamanhos, reverse=True):
+                if tamanho <= len(linha) and linha[tamanho - 1] == "}":
+                    yield tamanho
+            return
+
+        posicao = linha.rfind("}")
+        while posicao >= 0:
+            if posicao + 1 in self._tamanhos:
+                yield posicao + 1
+            posicao = linha.rfind("}", 0, posicao)
+
+    def _guardar(self, linha: str, estado: EstadoCalculo, saida: str) -> None:
+        """Guarda o estado e a saída da linha, identificados pelo texto até o último objeto."""
+        tamanho = linha.rfind("}") + 1
+        if not tamanho or linha[tamanho:].strip() != "]":
+            return
+
+        chave = (tamanho, _hash_prefixo(linha[:tamanho]))
+        if chave not in self._prefixos:
+            self._tamanhos[tamanho] += 1
+        self._prefixos[chave] = (estado, saida)
+        self._prefixos.move_to_end(chave)
+
+        while len(self._prefixos) > self._limite_prefixos:
+            (tamanho_removido, _), _ = self._prefixos.popitem(last=False)
+            self._tamanhos[tamanho_removido] -= 1
+            if not self._tamanhos[tamanho_removido]:
+                del self._tamanhos[tamanho_removido]
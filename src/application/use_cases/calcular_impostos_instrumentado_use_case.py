@@ -0,0 +1,164 @@
+from collections.abc import Sized
+from time import perf_counter
+from typing import Iterable, Iterator, TextIO
+
+from src.application.use_cases.calcular_impostos_use_case import CalcularImpostosUseCase
+from src.application.use_cases.estatisticas_processamento import EstatisticasLinha, EstatisticasProcessamento
+from src.domain.models.lote_operacoes import CODIGO_COMPRA, LoteOperacoes
+from src.domain.models.operacao import Operacao, TipoOperacao
+from src.domain.ports.input.operacoes_input_port import OperacoesInputPort
+from src.domain.ports.output.impostos_output_port import ImpostosOutputPort
+from src.domain.ports.services.calcular_imposto_service_port import CalcularImpostoServicePort
+
+
+def _contar_compras(operacoes: Iterable[Operacao] | LoteOperacoes) -> int:
+    """Conta as operações de compra de uma lista de operações ou de um lote compacto."""
+    if isinstance(operacoes, LoteOperacoes):
+        return operacoes.tipos.count(CODIGO_COMPRA)
+    return sum(1 for operacao in operacoes if operacao.tipo_operacao is TipoOperacao.BUY)
+
+
+def _tamanho_em_bytes(input_data: str | bytes) -> int:
+    """Retorna o tamanho da linha de entrada em bytes UTF-8."""
+    return len(input_data) if isinstance(input_data, bytes) else len(input_data.encode())
+
+
+class _IteradorCronometrado:
+    """Iterador que acumula o tempo gasto para obter cada item do iterável envolvido."""
+
+    def __init__(self, iteravel: Iterable):
+        self._iterador = iter(iteravel)
+        self.segundos = 0.0
+
+    def __iter__(self) -> Iterator:
+        return self
+
+    def __next__(self):
+        inicio = perf_counter()
+        try:
+            return next(self._iterador)
+        finally:
+            self.segundos += perf_counter() - inicio
+
+
+class _OperacoesCronometradas(_IteradorCronometrado):
+    """Iterador cronometrado de operações que também conta as compras e as vendas."""
+
+    def __init__(self, operacoes: Iterable[Operacao]):
+        super().__init__(operacoes)
+        self.compras = 0
+        self.vendas = 0
+
+    def __next__(self) -> Operacao:
+        operacao = super().__next__()
+        if operacao.tipo_operacao is TipoOperacao.BUY:
+            self.compras += 1
+        else:
+            self.vendas += 1
+        return operacao
+
+
+class _ArquivoContador:
+    """Envolve um arquivo de texto contando os bytes UTF-8 escritos nele."""
+
+    def __init__(self, arquivo: TextIO):
+        self._arquivo = arquivo
+        self.bytes = 0
+
+    def write(self, texto: str) -> int:
+        self.bytes += len(texto.encode())
+        return self._arquivo.write(texto)
+
+    def writelines(self, textos: Iterable[str]) -> None:
+        for texto in textos:
+            self.write(texto)
+
+
+class CalcularImpostosInstrumentadoUseCase(CalcularImpostosUseCase):
+    """Caso de uso para cálculo de impostos que registra as medições de cada linha processada.
+
+    Para cada chamada de execute ou execute_to_file, registra em `estatisticas` o tempo de leitura, cálculo e
+    formatação, a quantidade de compras e vendas e os bytes de entrada e saída. No modo incremental as etapas são
+    intercaladas, então o tempo de cada uma é obtido cronometrando os iteradores entre elas. O Container só usa
+    esta classe quando as estatísticas são pedidas; sem elas, o CalcularImpostosUseCase não tem nenhum custo extra.
+    """
+
+    def __init__(
+        self,
+        operacoes_input: OperacoesInputPort,
+        imposto_service: CalcularImpostoServicePort,
+        impostos_output: ImpostosOutputPort,
+        estatisticas: EstatisticasProcessamento,
+    ):
+        super().__init__(operacoes_input, imposto_service, impostos_output)
+        self.estatisticas = estatisticas
+
+    def execute(self, input_data: str | bytes) -> str:
+        """Executa o fluxo completo de cálculo de impostos, medindo cada etapa."""
+        inicio = perf_counter()
+        operacoes = self._operacoes_input.iter_operations(input_data)
+        if not isinstance(operacoes, Sized):
+            # Leitores incrementais só leem de fato ao serem percorridos; a lista separa a leitura do cálculo.
+            operacoes = list(operacoes)
+        fim_leitura = perf_counter()
+        impostos = self._imposto_service.calcular_impostos(operacoes)
+        fim_calculo = perf_counter()
+        saida = self._impostos_output.formatar_impostos(impostos)
+        fim = perf_counter()
+
+        compras = _contar_compras(operacoes)
+        self.estatisticas.registrar(
+            EstatisticasLinha(
+                segundos_leitura=fim_leitura - inicio,
+                segundos_calculo=fim_calculo - fim_leitura,
+                segundos_formatacao=fim - fim_calculo,
+                compras=compras,
+                vendas=len(operacoes) - compras,
+                bytes_entrada=_tamanho_em_bytes(input_data),
+                bytes_saida=len(saida.encode()),
+            )
+        )
+        return saida
+
+    def execute_to_file(self, input_data: str, arquivo: TextIO) -> None:
+        """Executa o fluxo completo de forma incremental, escrevendo no arquivo e medindo cada etapa."""
+        inicio = perf_counter()
+        operacoes = self._operacoes_input.iter_operations(input_data)
+        segundos_leitura = perf_counter() - inicio
+
+        if isinstance(operacoes, Sized):
+            operacoes_cronometradas = None
+            compras = _contar_compras(operacoes)
+            vendas = len(operacoes) - compras
+        else:
+            operacoes = operacoes_cronometradas = _OperacoesCronometradas(operacoes)
+
+        inicio = perf_counter()
+        impostos = _IteradorCronometrado(self._imposto_service.iter_impostos(operacoes))
+        segundos_calculo = perf_counter() - inicio
+
+        arquivo_contador = _ArquivoContador(arquivo)
+        inicio = perf_counter()
+        self._impostos_output.escrever_impostos(impostos, arquivo_contador)
+        segundos_escrita = perf_counter() - inicio
+
+        # Cada etapa incremental puxa itens da anterior: o tempo de cada uma exclui o das etapas que ela consome.
+        segundos_calculo += impostos.segundos
+        segundos_formatacao = segundos_escrita - impostos.segundos
+        if operacoes_cronometradas is not None:
+            segundos_leitura += operacoes_cronometradas.segundos
+            segundos_calculo -= operacoes_cronometradas.segundos
+            compras = operacoes_cronometradas.compras
+            vendas = operacoes_cronometradas.vendas
+
+        self.estatisticas.registrar(
+            EstatisticasLinha(
+                segundos_leitura=segundos_leitura,
+                segundos_calculo=segundos_calculo,
+                segundos_formatacao=segundos_formatacao,
+                compras=compras,
+                vendas=vendas,
+                bytes_entrada=_tamanho_em_bytes(input_data),
+                bytes_saida=arquivo_contador.bytes,
+            )
+        )
@@ -0,0 +1,27 @@
+from src.domain.ports.output.impostos_output_port import ImpostosOutputPort
+
+
+class CalcularImpostosToleranteUseCase:
+    """Envolve um caso de uso de cálculo de impostos, respondendo uma linha com erro com um registro de erro.
+
+    Uma linha que gere exceção (JSON mal formado, campos ausentes, valores inválidos) recebe na saída o registro de
+    erro formatado pelo adaptador de saída, com a mesma mensagem que interromperia a CLI, e as linhas seguintes
+    continuam sendo processadas. Apenas execute é tolerante: os modos incrementais já podem ter escrito parte da saída
+    quando o erro acontece.
+    """
+
+    def __init__(self, use_case, impostos_output: ImpostosOutputPort):
+        self._use_case = use_case
+        self._impostos_output = impostos_output
+
+    @property
+    def cache(self):
+        """Cache do caso de uso envolvido, quando houver."""
+        return self._use_case.cache
+
+    def execute(self, input_data: str | bytes) -> str:
+        """Executa o caso de uso envolvido ou, se ele falhar, retorna o registro de erro da linha."""
+        try:
+            return self._use_case.execute(input_data)
+        except Exception as exception:
+            return self._impostos_output.formatar_erro(f"Erro ao processar entrada: {str(exception)}")
@@ -1,3 +1,5 @@
+from typing import Iterator, TextIO
+
 from src.domain.ports.input.operacoes_input_port import OperacoesInputPort
 from src.domain.ports.output.impostos_output_port import ImpostosOutputPort
 from src.domain.ports.services.calcular_imposto_service_port import CalcularImpostoServicePort
@@ -16,8 +18,27 @@ class CalcularImpostosUseCase:
         self._imposto_service = imposto_service
         self._impostos_output = impostos_output
 
-    def execute(self, input_data: str) -> str:
-        """Executa o fluxo completo de cálculo de impostos com entrada e saída formatadas."""
-        operacoes = self._operacoes_input.parse_operations(input_data)
+    def execute(self, input_data: str | bytes) -> str:
+        """Executa o fluxo completo de cálculo de impostos com entrada e saída formatadas.
+
+        A entrada pode estar em bytes quando o adaptador de entrada aceita bytes (como o JsonParser).
+        """
+        operacoes = self._operacoes_input.iter_operations(input_data)
         impostos = self._imposto_service.calcular_impostos(operacoes)
         return self._impostos_output.formatar_impostos(impostos)
+
+    def iter_execute(self, input_data: str) -> Iterator[str]:
+        """Executa o fluxo completo de forma incremental, produzindo a saída formatada em fragmentos.
+
+        Cada operação é lida, calculada e formatada antes da próxima, então nenhuma lista completa é mantida em
+        memória e o primeiro resultado fica disponível sem esperar o processamento da carteira inteira.
+        """
+        operacoes = self._operacoes_input.iter_operations(input_data)
+        impostos = self._imposto_service.iter_impostos(operacoes)
+        return self._impostos_output.iter_formatar_impostos(impostos)
+
+    def execute_to_file(self, input_data: str, arquivo: TextIO) -> None:
+        """Executa o fluxo completo de forma incremental, escrevendo a saída formatada diretamente no arquivo."""
+        operacoes = self._operacoes_input.iter_operations(input_data)
+        impostos = self._imposto_service.iter_impostos(operacoes)
+        self._impostos_output.escrever_impostos(impostos, arquivo)
@@ -0,0 +1,137 @@
+from dataclasses import asdict, dataclass
+from typing import Dict, List
+
+
+@dataclass(frozen=True)
+class EstatisticasLinha:
+    """Medições do processamento de uma linha de entrada.
+
+    Args:
+        segundos_leitura: Tempo gasto lendo as operações da entrada
+        segundos_calculo: Tempo gasto calculando os impostos
+        segundos_formatacao: Tempo gasto formatando (e escrevendo) a saída
+        compras: Quantidade de operações de compra
+        vendas: Quantidade de operações de venda
+        bytes_entrada: Tamanho da linha de entrada, em bytes UTF-8
+        bytes_saida: Tamanho da saída produzida, em bytes UTF-8
+    """
+
+    segundos_leitura: float
+    segundos_calculo: float
+    segundos_formatacao: float
+    compras: int
+    vendas: int
+    bytes_entrada: int
+    bytes_saida: int
+
+    @property
+    def operacoes(self) -> int:
+        """Quantidade total de operações da linha."""
+        return self.compras + self.vendas
+
+
+class EstatisticasProcessamento:
+    """Acumula as medições de cada linha processada e produz o resumo agregado.
+
+    Os totais são mantidos incrementalmente, então o consumo de memória não cresce com a quantidade de linhas. As
+    medições de cada linha só são guardadas se guardar_linhas for verdadeiro, como quando o JSON é gravado em arquivo.
+    Quando um cache de resultados é usado, contadores_cache recebe os seus contadores, incluídos no resumo e no JSON.
+    As medições de cada linha só são registradas nas falhas do cache, quando a linha é de fato processada.
+    """
+
+    def __init__(self, guardar_linhas: bool = True):
+        """Inicializa sem nenhuma linha registrada."""
+        self.guardar_linhas = guardar_linhas
+        self.linhas: List[EstatisticasLinha] = []
+        self.contadores_cache: Dict | None = None
+        self._zerar_totais()
+
+    def _zerar_totais(self) -> None:
+        """Zera os totais acumulados."""
+        self.quantidade_linhas = 0
+        self.compras = 0
+        self.vendas = 0
+        self.bytes_entrada = 0
+        self.bytes_saida = 0
+        self.segundos_leitura = 0.0
+        self.segundos_calculo = 0.0
+        self.segundos_formatacao = 0.0
+
+    def registrar(self, linha: EstatisticasLinha) -> None:
+        """Registra as medições de uma linha."""
+        self.quantidade_linhas += 1
+        self.compras += linha.compras
+        self.vendas += linha.vendas
+        self.bytes_entrada += linha.bytes_entrada
+        self.bytes_saida += linha.bytes_saida
+        self.segundos_leitura += linha.segundos_leitura
+        self.segundos_calculo += linha.segundos_calculo
+        self.segundos_formatacao += linha.segundos_formatacao
+        if self.guardar_linhas:
+            self.linhas.append(linha)
+
+    def combinar(self, outras: "EstatisticasProcessamento") -> None:
+        """Acrescenta os totais e as linhas registradas em outro acumulador (por exemplo, de um processo worker)."""
+        self.quantidade_linhas += outras.quantidade_linhas
+        self.compras += outras.compras
+        self.vendas += outras.vendas
+        self.bytes_entrada += outras.bytes_entrada
+        self.bytes_saida += outras.bytes_saida
+        self.segundos_leitura += outras.segundos_leitura
+        self.segundos_calculo += outras.segundos_calculo
+        self.segundos_formatacao += outras.segundos_formatacao
+        if self.guardar_linhas:
+            self.linhas.extend(outras.linhas)
+
+    def esvaziar(self) -> "EstatisticasProcessamento":
+        """Retorna um novo acumulador com os totais e as linhas registradas até aqui e limpa este."""
+        extraidas = EstatisticasProcessamento(self.guardar_linhas)
+        extraidas.combinar(self)
+        self.linhas = []
+        self._zerar_totais()
+        return extraidas
+
+    def totais(self) -> Dict:
+        """Retorna os totais de todas as linhas registradas."""
+        return {
+            "linhas": self.quantidade_linhas,
+            "operacoes": self.compras + self.vendas,
+            "compras": self.compras,
+            "vendas": self.vendas,
+            "razao_vendas_compras": round(self.vendas / self.compras, 4) if self.compras else None,
+            "bytes_entrada": self.bytes_entrada,
+            "bytes_saida": self.bytes_saida,
+            "segundos_leitura": round(self.segundos_leitura, 6),
+            "segundos_calculo": round(self.segundos_calculo, 6),
+            "segundos_formatacao": round(self.segundos_formatacao, 6),
+            "segundos_total": round(self.segundos_leitura + self.segundos_calculo + self.segundos_formatacao, 6),
+        }
+
+    def como_dict(self) -> Dict:
+        """Retorna os totais e as medições de cada linha, prontos para serializar em JSON."""
+        dados = {
+            "totais": self.totais(),
+            "linhas": [{**asdict(linha), "operacoes": linha.operacoes} for linha in self.linhas],
+        }
+        if self.contadores_cache is not None:
+            dados["cache"] = self.contadores_cache
+        return dados
+
+    def resumo(self) -> str:
+        """Formata os totais em um resumo legível, com a participação de cada etapa no tempo total."""
+        totais = self.totais()
+        segundos_total = totais["segundos_total"]
+        partes = [
+            f"linhas: {totais['linhas']}",
+            f"operações: {totais['operacoes']} (compras: {totais['compras']}, vendas: {totais['vendas']},"
+            f" vendas/compras: {totais['razao_vendas_compras']})",
+            f"bytes: {totais['bytes_entrada']} de entrada, {totais['bytes_saida']} de saída",
+        ]
+        for etapa in ("leitura", "calculo", "formatacao"):
+            segundos = totais[f"segundos_{etapa}"]
+            participacao = 100 * segundos / segundos_total if segundos_total else 0
+            partes.append(f"{etapa}: {segundos:.6f}s ({participacao:.1f}%)")
+        partes.append(f"total: {segundos_total:.6f}s")
+        if self.contadores_cache is not None:
+            partes.append("cache: " + ", ".join(f"{nome}: {valor}" for nome, valor in self.contadores_cache.items()))
+        return "\n".join(partes)
@@ -0,0 +1,49 @@
+from decimal import Decimal
+from typing import Dict, NamedTuple, Tuple
+
+# Posição de um ticker: o código, a quantidade de ações e o preço médio.
+PosicaoTicker = Tuple[str, int, Decimal]
+
+
+class EstadoCalculo(NamedTuple):
+    """Estado do cálculo de impostos após processar as primeiras operações de uma carteira.
+
+    Permite retomar o cálculo a partir das operações seguintes, sem reprocessar o histórico.
+
+    Args:
+        quantidade: Quantidade de ações em carteira das operações sem ticker
+        preco_medio: Preço médio ponderado das ações em carteira das operações sem ticker
+        prejuizo_acumulado: Prejuízo ainda não compensado, compartilhado por todos os tickers
+        operacoes_processadas: Quantidade de operações já processadas
+        posicoes: Posições (ticker, quantidade, preço médio) das operações com ticker
+    """
+
+    quantidade: int = 0
+    preco_medio: Decimal = Decimal("0")
+    prejuizo_acumulado: Decimal = Decimal("0")
+    operacoes_processadas: int = 0
+    posicoes: Tuple[PosicaoTicker, ...] = ()
+
+    def como_dict(self) -> Dict:
+        """Serializa o estado num dicionário compatível com JSON, com os valores Decimal como texto exato."""
+        return {
+            "quantidade": self.quantidade,
+            "preco_medio": str(self.preco_medio),
+            "prejuizo_acumulado": str(self.prejuizo_acumulado),
+            "operacoes_processadas": self.operacoes_processadas,
+            "posicoes": [[ticker, quantidade, str(preco_medio)] for ticker, quantidade, preco_medio in self.posicoes],
+        }
+
+    @classmethod
+    def de_dict(cls, dados: Dict) -> "EstadoCalculo":
+        """Restaura o estado serializado por como_dict."""
+        return cls(
+            quantidade=int(dados["quantidade"]),
+            preco_medio=Decimal(dados["preco_medio"]),
+            prejuizo_acumulado=Decimal(dados["prejuizo_acumulado"]),
+            operacoes_processadas=int(dados["operacoes_processadas"]),
+            posicoes=tuple(
+                (ticker, int(quantidade), Decimal(preco_medio))
+                for ticker, quantidade, preco_medio in dados.get("posicoes", ())
+            ),
+        )
@@ -9,6 +9,17 @@ class Investimento:
         self._quantidade: int = 0
         self._preco_medio: Decimal = Decimal("0")
 
+    @classmethod
+    def restaurar(cls, quantidade: int, preco_medio: Decimal) -> "Investimento":
+        """Cria um investimento com a quantidade e o preço médio de um estado salvo."""
+        if quantidade < 0:
+            raise ValueError("Quantidade não pode ser negativa")
+
+        investimento = cls()
+        investimento._quantidade = quantidade
+        investimento._preco_medio = preco_medio if quantidade else Decimal("0")
+        return investimento
+
     @property
     def quantidade(self) -> int:
         """Retorna a quantidade atual de ações investidas."""
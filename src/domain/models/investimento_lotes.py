@@ -0,0 +1,107 @@
+from collections import deque
+from decimal import Decimal
+from enum import Enum
+from typing import Deque, List, Tuple
+
+
+class MetodoCusto(Enum):
+    """Enum para representar o método de apuração do custo das ações vendidas."""
+
+    MEDIO = "medio"
+    FIFO = "fifo"
+    LIFO = "lifo"
+
+
+class InvestimentoLotes:
+    """Representa um investimento em ações com o custo de cada lote comprado.
+
+    Cada compra é um lote [quantidade, preço unitário] numa deque; compras seguidas com o mesmo preço formam um único
+    lote. Uma venda consome os lotes mais antigos (FIFO) ou mais recentes (LIFO), e o último lote consumido pode ser
+    consumido em parte. Cada lote entra e sai da deque uma única vez, então o custo de uma venda é O(1) amortizado
+    por lote consumido, mesmo com milhões de compras pequenas. O preço médio é derivado do custo total dos lotes
+    restantes, mantido a cada compra e venda.
+    """
+
+    def __init__(self, metodo: MetodoCusto):
+        """Inicializa o investimento sem lotes, consumidos na venda na ordem do método informado."""
+        if metodo not in (MetodoCusto.FIFO, MetodoCusto.LIFO):
+            raise ValueError("Método de custo por lotes deve ser FIFO ou LIFO")
+
+        self._fifo = metodo is MetodoCusto.FIFO
+        self._lotes: Deque[List] = deque()
+        self._quantidade: int = 0
+        self._valor_total: Decimal = Decimal("0")
+
+    @property
+    def quantidade(self) -> int:
+        """Retorna a quantidade atual de ações investidas."""
+        return self._quantidade
+
+    @property
+    def preco_medio(self) -> Decimal:
+        """Retorna o preço médio das ações dos lotes restantes."""
+        if self._quantidade == 0:
+            return Decimal("0")
+        return self._valor_total / self._quantidade
+
+    @property
+    def valor_total(self) -> Decimal:
+        """Retorna o custo total dos lotes restantes."""
+        return self._valor_total
+
+    @property
+    def lotes(self) -> Tuple[Tuple[int, Decimal], ...]:
+        """Retorna os lotes restantes (quantidade, preço unitário), do mais antigo para o mais recente."""
+        return tuple((quantidade, preco_unitario) for quantidade, preco_unitario in self._lotes)
+
+    def adicionar_acao(self, quantidade: int, preco_unitario: Decimal) -> None:
+        """Adiciona um lote de ações ao investimento, ou soma a quantidade ao último lote se o preço for o mesmo."""
+        if quantidade <= 0:
+            raise ValueError("Quantidade deve ser maior que zero")
+
+        if self._lotes and self._lotes[-1][1] == preco_unitario:
+            self._lotes[-1][0] += quantidade
+        else:
+            self._lotes.append([quantidade, preco_unitario])
+        self._quantidade += quantidade
+        self._valor_total += preco_unitario * quantidade
+
+    def remover_acao(self, quantidade: int) -> None:
+        """Remove uma quantidade de ações do investimento, consumindo os lotes na ordem do método."""
+        if quantidade <= 0:
+            raise ValueError("Quantidade deve ser maior que zero")
+
+        self._quantidade -= quantidade
+        if self._quantidade == 0:
+            self._lotes.clear()
+            self._valor_total = Decimal("0")
+            return
+
+        retirar = self._lotes.popleft if self._fifo else self._lotes.pop
+        lote = self._lotes[0] if self._fifo else self._lotes[-1]
+        while lote[0] <= quantidade:
+            retirar()
+            quantidade -= lote[0]
+            self._valor_total -= lote[1] * lote[0]
+            lote = self._lotes[0] if self._fifo else self._lotes[-1]
+        lote[0] -= quantidade
+        self._valor_total -= lote[1] * quantidade
+
+    def calcular_custo(self, quantidade: int) -> Decimal:
+        """Retorna o custo dos lotes que uma venda da quantidade consumiria, sem removê-los."""
+        lotes = self._lotes if self._fifo else reversed(self._lotes)
+        custo = Decimal("0")
+        for quantidade_lote, preco_unitario in lotes:
+            if quantidade_lote >= quantidade:
+                return custo + preco_unitario * quantidade
+            custo += preco_unitario * quantidade_lote
+            quantidade -= quantidade_lote
+        return custo
+
+    def verifica_se_pode_remover_acao(self, quantidade: int) -> str | None:
+        """Verifica se é possível remover uma quantidade de ações do investimento."""
+        if quantidade <= 0:
+            return "Quantidade deve ser maior que zero"
+
+        if quantidade > self._quantidade:
+            return "Can't sell more stocks than you have"
@@ -0,0 +1,82 @@
+from array import array
+from decimal import Decimal
+from typing import Iterable, Iterator, Tuple
+
+from src.domain.models.operacao import Operacao, TipoOperacao
+
+CODIGO_COMPRA = 0
+CODIGO_VENDA = 1
+
+_CODIGOS = {TipoOperacao.BUY: CODIGO_COMPRA, TipoOperacao.SELL: CODIGO_VENDA}
+_TIPOS = {CODIGO_COMPRA: TipoOperacao.BUY, CODIGO_VENDA: TipoOperacao.SELL}
+
+
+class LoteOperacoes:
+    """Lote compacto de operações, armazenado em colunas paralelas de array.array.
+
+    Cada operação ocupa 17 bytes: o código do tipo (1 byte), o preço unitário em centavos (8 bytes) e a quantidade
+    (8 bytes), cerca de 18 bytes medidos com a sobra de alocação dos arrays. Uma lista de Operacao (a instância
+    com __slots__, o Decimal do preço e a referência na lista) ocupa cerca de 200 bytes por operação, então 10 milhões
+    de operações ficam em 180 MB em vez de 2 GB depois de lidas. A leitura da linha tem um pico maior, de cerca de 300
+    bytes por operação no lote (3 GB para 10 milhões de operações) e 450 na lista, com as operações varridas do texto
+    ainda vivas (ver benchmarks/benchmark_memoria_operacoes.py).
+
+    Os serviços de cálculo reconhecem o lote e percorrem as colunas diretamente, sem criar uma Operacao por linha.
+    Iterar o lote como uma sequência comum produz objetos Operacao sob demanda, para compatibilidade.
+    """
+
+    __slots__ = ("tipos", "precos_centavos", "quantidades")
+
+    def __init__(self):
+        """Inicializa o lote com as colunas vazias."""
+        self.tipos = array("b")
+        self.precos_centavos = array("q")
+        self.quantidades = array("q")
+
+    @classmethod
+    def de_operacoes(cls, operacoes: Iterable[Operacao]) -> "LoteOperacoes":
+        """Cria um lote a partir de operações sem ticker e com preços de até duas casas decimais."""
+        lote = cls()
+        for operacao in operacoes:
+            if operacao.ticker is not None:
+                raise ValueError("O lote compacto não guarda o ticker das operações")
+            centavos = operacao.preco_unitario.scaleb(2)
+            if centavos != centavos.to_integral_value():
+                raise ValueError(f"Preço com mais de duas casas decimais: {operacao.preco_unitario}")
+            lote.adicionar(operacao.tipo_operacao, int(centavos), operacao.quantidade)
+        return lote
+
+    def adicionar(self, tipo_operacao: TipoOperacao, preco_centavos: int, quantidade: int) -> None:
+        """Adiciona uma operação ao final do lote."""
+        self.tipos.append(_CODIGOS[tipo_operacao])
+        self.precos_centavos.append(preco_centavos)
+        self.quantidades.append(quantidade)
+
+    def estender(
+        self, tipos_operacao: Iterable[TipoOperacao], precos_centavos: Iterable[int], quantidades: Iterable[int]
+    ) -> None:
+        """Adiciona ao final do lote as operações informadas coluna a coluna, na mesma ordem em cada coluna."""
+        self.tipos.extend(_CODIGOS[tipo_operacao] for tipo_operacao in tipos_operacao)
+        self.precos_centavos.extend(precos_centavos)
+        self.quantidades.extend(quantidades)
+
+    def iter_colunas(self) -> Iterator[Tuple[int, int, int]]:
+        """Percorre as operações como tuplas (código do tipo, preço em centavos, quantidade)."""
+        return zip(self.tipos, self.precos_centavos, self.quantidades)
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de operações do lote."""
+        return len(self.tipos)
+
+    def __getitem__(self, indice: int) -> Operacao:
+        """Materializa a operação da posição informada."""
+        return Operacao(
+            tipo_operacao=_TIPOS[self.tipos[indice]],
+            preco_unitario=Decimal(self.precos_centavos[indice]).scaleb(-2),
+            quantidade=self.quantidades[indice],
+        )
+
+    def __iter__(self) -> Iterator[Operacao]:
+        """Materializa as operações do lote, uma de cada vez."""
+        for indice in range(len(self)):
+            yield self[indice]
@@ -10,19 +10,21 @@ class TipoOperacao(Enum):
     SELL = "sell"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Operacao:
-    """Classe para representar uma operação.
+    """Classe imutável para representar uma operação.
 
     Args:
         tipo_operacao: Se a operação é uma operação de compra (buy) ou venda (sell)
         preco_unitario: Preço unitário da ação em uma moeda com duas casas decimais
         quantidade: Quantidade de ações negociadas
+        ticker: Código da ação negociada; operações sem ticker formam uma única posição
     """
 
     tipo_operacao: TipoOperacao
     preco_unitario: Decimal
     quantidade: int
+    ticker: str | None = None
 
     @property
     def valor_total(self) -> Decimal:
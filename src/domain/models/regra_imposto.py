@@ -0,0 +1,84 @@
+from bisect import bisect_right
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+
+class RegraImposto(NamedTuple):
+    """Regra do imposto vigente a partir de uma data.
+
+    Args:
+        vigencia: Data a partir da qual a regra vale, até a vigência da regra seguinte
+        aliquota: Fração do lucro líquido devida como imposto, entre 0 e 1
+        limite_isencao: Valor da venda até o qual não há imposto
+    """
+
+    vigencia: date
+    aliquota: Decimal
+    limite_isencao: Decimal
+
+    def como_dict(self) -> Dict:
+        """Serializa a regra num dicionário compatível com JSON, com a data em ISO 8601 e os valores como texto."""
+        return {
+            "vigencia": self.vigencia.isoformat(),
+            "aliquota": str(self.aliquota),
+            "limite_isencao": str(self.limite_isencao),
+        }
+
+    @classmethod
+    def de_dict(cls, dados: Dict) -> "RegraImposto":
+        """Restaura a regra serializada por como_dict; os valores podem vir como texto ou número."""
+        return cls(
+            vigencia=date.fromisoformat(dados["vigencia"]),
+            aliquota=Decimal(str(dados["aliquota"])),
+            limite_isencao=Decimal(str(dados["limite_isencao"])),
+        )
+
+
+class TabelaRegras:
+    """Tabela das regras do imposto, indexada pela data de início da vigência de cada regra.
+
+    As regras são validadas e ordenadas uma única vez, na criação da tabela; a regra vigente numa data é encontrada
+    por busca binária sobre as datas de vigência.
+    """
+
+    def __init__(self, regras: Iterable[RegraImposto]):
+        self._regras: List[RegraImposto] = sorted(regras)
+        self._vigencias: List[date] = [regra.vigencia for regra in self._regras]
+        if not self._regras:
+            raise ValueError("A tabela de regras do imposto deve ter ao menos uma regra")
+        if len(set(self._vigencias)) < len(self._vigencias):
+            raise ValueError("A tabela de regras do imposto tem duas regras com a mesma vigência")
+        for regra in self._regras:
+            if not 0 <= regra.aliquota <= 1:
+                raise ValueError(f"Alíquota deve estar entre 0 e 1: {regra.aliquota}")
+            if regra.limite_isencao < 0:
+                raise ValueError(f"Limite de isenção não pode ser negativo: {regra.limite_isencao}")
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de regras da tabela."""
+        return len(self._regras)
+
+    @property
+    def regras(self) -> Tuple[RegraImposto, ...]:
+        """Retorna as regras da tabela, em ordem de vigência."""
+        return tuple(self._regras)
+
+    def regra_em(self, data: date) -> RegraImposto:
+        """Retorna a regra vigente na data: a de vigência mais recente até a data, inclusive."""
+        indice = bisect_right(self._vigencias, data) - 1
+        if indice < 0:
+            raise ValueError(f"Nenhuma regra do imposto vigente em {data.isoformat()}")
+        return self._regras[indice]
+
+    def como_dict(self) -> Dict:
+        """Serializa a tabela num dicionário compatível com JSON."""
+        return {"regras": [regra.como_dict() for regra in self._regras]}
+
+    @classmethod
+    def de_dict(cls, dados: Dict) -> "TabelaRegras":
+        """Restaura a tabela serializada por como_dict."""
+        try:
+            return cls(RegraImposto.de_dict(regra) for regra in dados["regras"])
+        except (KeyError, TypeError, InvalidOperation) as erro:
+            raise ValueError(f"Tabela de regras do imposto inválida: {erro!r}")
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterable, List, Tuple
 
 from src.domain.models.operacao import Operacao
 
@@ -9,3 +9,19 @@ class OperacoesInputPort:
     def parse_operations(self, data: str) -> List[Operacao]:
         """Método para converter dados externos em operações do domínio."""
         pass
+
+    def iter_operations(self, data: str) -> Iterable[Operacao]:
+        """Método para converter dados externos em operações do domínio sob demanda.
+
+        Por padrão delega para parse_operations; adaptadores capazes de ler a entrada de forma incremental
+        sobrescrevem este método para produzir uma operação de cada vez.
+        """
+        return self.parse_operations(data)
+
+    def parse_conta(self, data: str) -> Tuple[str, List[Operacao]]:
+        """Método para converter um registro de conta na conta e nas suas operações do domínio."""
+        pass
+
+    def parse_id_conta(self, data: str) -> str:
+        """Método para ler apenas a conta de um registro, usada para escolher a fatia que o processa."""
+        pass
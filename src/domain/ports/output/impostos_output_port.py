@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import List
+from typing import Iterable, Iterator, List, TextIO
 
 
 class ImpostosOutputPort:
@@ -8,3 +8,27 @@ class ImpostosOutputPort:
     def formatar_impostos(self, impostos: List[Decimal]) -> str:
         """Método para formatar impostos para saída."""
         pass
+
+    def iter_formatar_impostos(self, impostos: Iterable[Decimal | str]) -> Iterator[str]:
+        """Método para formatar impostos para saída em fragmentos, à medida que são produzidos.
+
+        Por padrão delega para formatar_impostos; adaptadores capazes de formatar de forma incremental
+        sobrescrevem este método para entregar cada fragmento assim que o imposto correspondente chega.
+        """
+        return iter([self.formatar_impostos(list(impostos))])
+
+    def escrever_impostos(self, impostos: Iterable[Decimal | str], arquivo: TextIO) -> None:
+        """Método para escrever os impostos formatados diretamente em um arquivo, à medida que são produzidos."""
+        arquivo.writelines(self.iter_formatar_impostos(impostos))
+
+    def formatar_conta(self, conta: str, saidas: Iterable[str]) -> str:
+        """Método para reunir numa única saída da conta as saídas de formatar_impostos dos seus registros."""
+        pass
+
+    def formatar_erro(self, mensagem: str) -> str:
+        """Método para formatar o registro de erro de uma linha que não pôde ser processada."""
+        pass
+
+    def eh_registro_erro(self, saida: str) -> bool:
+        """Método para reconhecer, numa saída formatada, o registro de erro produzido por formatar_erro."""
+        pass
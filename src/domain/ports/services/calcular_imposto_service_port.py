@@ -1,12 +1,51 @@
+from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import List
+from typing import Iterable, Iterator, List, Sequence, Tuple
 
+from src.domain.models.estado_calculo import EstadoCalculo
 from src.domain.models.operacao import Operacao
 
 
-class CalcularImpostoServicePort:
-    """Interface para serviço de cálculo de impostos."""
+class CalcularImpostoServicePort(ABC):
+    """Interface para serviço de cálculo de impostos.
 
-    def calcular_impostos(self, operacoes: List[Operacao]) -> List[Decimal]:
-        """Calcula os impostos para uma lista de operações."""
+    Todo motor de cálculo implementa calcular_impostos_com_estado, usado pela retomada de prefixos, pelos cenários,
+    pelo índice de estados e pelo processamento por conta.
+    """
+
+    def calcular_impostos(self, operacoes: Iterable[Operacao]) -> List[Decimal]:
+        """Calcula os impostos para uma sequência de operações."""
         pass
+
+    def iter_impostos(self, operacoes: Iterable[Operacao]) -> Iterator[Decimal | str]:
+        """Produz os impostos das operações à medida que são calculados.
+
+        Por padrão delega para calcular_impostos; implementações capazes de calcular de forma incremental
+        sobrescrevem este método para entregar cada imposto assim que a operação é processada.
+        """
+        return iter(self.calcular_impostos(operacoes))
+
+    @abstractmethod
+    def calcular_impostos_com_estado(
+        self, operacoes: Iterable[Operacao], estado: EstadoCalculo | None = None
+    ) -> Tuple[List[Decimal | str], EstadoCalculo]:
+        """Calcula os impostos das operações a partir de um estado salvo e retorna também o estado final.
+
+        Com o estado das primeiras N operações de uma carteira, apenas as operações seguintes precisam ser informadas
+        e o custo é proporcional a elas. Sem estado, o cálculo começa de uma carteira vazia.
+
+        Raises:
+            ValueError: Se a configuração do serviço não puder ser representada num EstadoCalculo
+        """
+
+    def calcular_cenarios(
+        self, prefixo: Iterable[Operacao], caudas: Iterable[Sequence[Operacao]]
+    ) -> List[List[Decimal | str]]:
+        """Calcula os impostos de caudas alternativas para a mesma carteira, a partir do estado do prefixo.
+
+        O prefixo é calculado uma única vez e cada cauda (por exemplo, as vendas finais com outros preços ou
+        quantidades) parte do seu estado, então o custo é proporcional ao prefixo mais a soma das caudas, e não ao
+        número de cenários vezes a carteira inteira. Retorna uma linha de impostos por cauda, na ordem recebida.
+        """
+        _, estado = self.calcular_impostos_com_estado(prefixo)
+        return [self.calcular_impostos_com_estado(cauda, estado)[0] for cauda in caudas]
@@ -0,0 +1,175 @@
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, Generator, Iterable, Iterator, List, Sequence, Tuple
+
+from src.domain.models.estado_calculo import EstadoCalculo
+from src.domain.models.lote_operacoes import LoteOperacoes
+from src.domain.models.operacao import Operacao, TipoOperacao
+from src.domain.ports.services.calcular_imposto_service_port import CalcularImpostoServicePort
+from src.domain.services.calcular_imposto_service import CalcularImpostoService, apurar_venda
+
+if TYPE_CHECKING:
+    from src.domain.models.regra_imposto import RegraImposto
+
+# Constante construída uma única vez, e não a cada operação.
+_ZERO = Decimal("0")
+
+
+class CalcularImpostoLocalService(CalcularImpostoServicePort):
+    """Serviço de cálculo de impostos com todo o estado em variáveis locais do laço.
+
+    Quantidade, preço médio ponderado e prejuízo acumulado ficam em variáveis locais, sem Investimento nem chamadas
+    de método por operação. As contas são as mesmas do CalcularImpostoService, na mesma ordem e no mesmo contexto do
+    Decimal (28 dígitos significativos, arredondados a cada passo), e cada venda é apurada pela mesma função
+    apurar_venda, então os impostos são idênticos aos dele para quaisquer preços e quantidades.
+
+    Numa carteira com vários tickers, a quantidade e o preço médio do ticker da operação atual ficam nas variáveis
+    do laço; as dos demais ficam num dicionário indexado pelo ticker e só são trocadas quando o ticker muda.
+    """
+
+    ALIQUOTA_IMPOSTO = CalcularImpostoService.ALIQUOTA_IMPOSTO
+    LIMITE_ISENCAO_IMPOSTO = CalcularImpostoService.LIMITE_ISENCAO_IMPOSTO
+
+    def __init__(self, regra: "RegraImposto | None" = None):
+        """Guarda a alíquota e o limite de isenção, das constantes da classe ou da regra informada."""
+        self._aliquota = self.ALIQUOTA_IMPOSTO if regra is None else regra.aliquota
+        self._limite_isencao = self.LIMITE_ISENCAO_IMPOSTO if regra is None else regra.limite_isencao
+
+    def calcular_impostos(self, operacoes: Iterable[Operacao] | LoteOperacoes) -> List[Decimal]:
+        """Calcula o imposto para uma sequência de operações, consumida uma única vez e na ordem."""
+        return list(self.iter_impostos(operacoes))
+
+    def iter_impostos(self, operacoes: Iterable[Operacao] | LoteOperacoes) -> Iterator[Decimal | str]:
+        """Produz o imposto (ou a mensagem de erro) de cada operação assim que ela é processada."""
+        return self._iter_impostos_valores(self._iter_valores(operacoes))
+
+    def calcular_impostos_com_estado(
+        self, operacoes: Iterable[Operacao] | LoteOperacoes, estado: EstadoCalculo | None = None
+    ) -> Tuple[List[Decimal | str], EstadoCalculo]:
+        """Calcula os impostos das operações a partir de um estado salvo e retorna também o estado final."""
+        estado = estado or EstadoCalculo()
+        posicoes = {None: (estado.quantidade, estado.preco_medio if estado.quantidade else _ZERO)}
+        for ticker, quantidade, preco_medio in estado.posicoes:
+            posicoes[ticker] = (quantidade, preco_medio if quantidade else _ZERO)
+        impostos_valores = self._iter_impostos_valores(
+            self._iter_valores(operacoes), posicoes, estado.prejuizo_acumulado
+        )
+
+        # O gerador retorna o prejuízo acumulado final ao terminar; as posições são atualizadas no lugar.
+        prejuizo_final = []
+
+        def produzir() -> Iterator[Decimal | str]:
+            prejuizo_final.append((yield from impostos_valores))
+
+        impostos = list(produzir())
+        quantidade, preco_medio = posicoes.pop(None)
+        return impostos, EstadoCalculo(
+            quantidade=quantidade,
+            preco_medio=preco_medio,
+            prejuizo_acumulado=prejuizo_final[0],
+            operacoes_processadas=estado.operacoes_processadas + len(impostos),
+            posicoes=tuple(
+                (ticker, quantidade, preco_medio)
+                for ticker, (quantidade, preco_medio) in posicoes.items()
+                if quantidade
+            ),
+        )
+
+    def calcular_cenarios(
+        self, prefixo: Iterable[Operacao] | LoteOperacoes, caudas: Iterable[Sequence[Operacao]]
+    ) -> List[List[Decimal | str]]:
+        """Calcula os impostos de caudas alternativas a partir do estado do prefixo, calculado uma única vez.
+
+        O estado do prefixo fica nas variáveis do laço: cada cauda parte de uma cópia rasa das posições e do prejuízo
+        acumulado, sem passar pelo EstadoCalculo a cada cenário.
+        """
+        posicoes: Dict[str | None, Tuple[int, Decimal]] = {}
+        impostos_prefixo = self._iter_impostos_valores(self._iter_valores(prefixo), posicoes)
+        while True:
+            try:
+                next(impostos_prefixo)
+            except StopIteration as fim:
+                prejuizo_acumulado = fim.value
+                break
+
+        iter_valores = self._iter_valores
+        iter_impostos_valores = self._iter_impostos_valores
+        return [
+            list(iter_impostos_valores(iter_valores(cauda), dict(posicoes), prejuizo_acumulado)) for cauda in caudas
+        ]
+
+    @staticmethod
+    def _iter_valores(
+        operacoes: Iterable[Operacao] | LoteOperacoes,
+    ) -> Iterator[Tuple[bool, Decimal, int, str | None]]:
+        """Converte as operações em tuplas (é compra, preço unitário, quantidade, ticker)."""
+        if isinstance(operacoes, LoteOperacoes):
+            return CalcularImpostoService._iter_valores_lote(operacoes)
+
+        compra = TipoOperacao.BUY
+        return (
+            (operacao.tipo_operacao is compra, operacao.preco_unitario, operacao.quantidade, operacao.ticker)
+            for operacao in operacoes
+        )
+
+    def _iter_impostos_valores(
+        self,
+        valores: Iterable[Tuple[bool, Decimal, int, str | None]],
+        posicoes: Dict[str | None, Tuple[int, Decimal]] | None = None,
+        prejuizo_acumulado: Decimal = _ZERO,
+    ) -> Generator[Decimal | str, None, Decimal]:
+        """Calcula os impostos a partir de tuplas (é compra, preço unitário, quantidade, ticker).
+
+        Parte das posições (quantidade e preço médio por ticker, None para as operações sem ticker) e do prejuízo
+        acumulado informados (por padrão, uma carteira vazia), atualiza as posições no lugar e, ao terminar,
+        retorna o prejuízo acumulado final.
+        """
+        aliquota = self._aliquota
+        limite_isencao = self._limite_isencao
+
+        if posicoes is None:
+            posicoes = {}
+        ticker_atual = None
+        quantidade, preco_medio = posicoes.get(None, (0, _ZERO))
+
+        for compra, preco, quantidade_operacao, ticker in valores:
+            if ticker != ticker_atual:
+                posicoes[ticker_atual] = (quantidade, preco_medio)
+                quantidade, preco_medio = posicoes.get(ticker, (0, _ZERO))
+                ticker_atual = ticker
+
+            if compra:
+                if quantidade_operacao <= 0:
+                    raise ValueError("Quantidade deve ser maior que zero")
+
+                if quantidade == 0:
+                    preco_medio = preco
+                    quantidade = quantidade_operacao
+                else:
+                    quantidade_total = quantidade + quantidade_operacao
+                    preco_medio = (preco_medio * quantidade + preco * quantidade_operacao) / quantidade_total
+                    quantidade = quantidade_total
+                yield _ZERO
+                continue
+
+            if quantidade_operacao <= 0:
+                yield "Quantidade deve ser maior que zero"
+                continue
+            if quantidade_operacao > quantidade:
+                yield "Can't sell more stocks than you have"
+                continue
+
+            imposto, prejuizo_acumulado = apurar_venda(
+                (preco - preco_medio) * quantidade_operacao,
+                preco * quantidade_operacao,
+                prejuizo_acumulado,
+                aliquota,
+                limite_isencao,
+            )
+
+            quantidade -= quantidade_operacao
+            if quantidade == 0:
+                preco_medio = _ZERO
+            yield imposto
+
+        posicoes[ticker_atual] = (quantidade, preco_medio)
+        return prejuizo_acumulado
@@ -1,58 +1,201 @@
 from decimal import Decimal
-from typing import List
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Generator, Iterable, Iterator, List, Tuple
 
+from src.domain.models.estado_calculo import EstadoCalculo
 from src.domain.models.investimento import Investimento
+from src.domain.models.investimento_lotes import InvestimentoLotes, MetodoCusto
+from src.domain.models.lote_operacoes import CODIGO_COMPRA, LoteOperacoes
 from src.domain.models.operacao import Operacao, TipoOperacao
 from src.domain.ports.services.calcular_imposto_service_port import CalcularImpostoServicePort
 
+if TYPE_CHECKING:
+    from src.domain.models.regra_imposto import RegraImposto
+
+# Limite de preços distintos convertidos e memorizados ao percorrer um lote compacto.
+_LIMITE_CACHE_PRECOS = 65536
+
+# Constantes construídas uma única vez, e não a cada operação.
+_ZERO = Decimal("0")
+_CENTAVO = Decimal("0.01")
+
+
+def apurar_venda(
+    lucro_ou_prejuizo: Decimal,
+    valor_operacao: Decimal,
+    prejuizo_acumulado: Decimal,
+    aliquota: Decimal,
+    limite_isencao: Decimal,
+) -> Tuple[Decimal, Decimal]:
+    """Aplica as regras do imposto a uma venda e retorna o imposto e o prejuízo acumulado depois dela.
+
+    O prejuízo da venda é somado ao acumulado. O lucro de uma venda acima do limite de isenção é tributado depois de
+    deduzido o prejuízo acumulado, que é consumido por ele; o lucro de uma venda isenta não consome o prejuízo.
+    """
+    if lucro_ou_prejuizo < 0:
+        return _ZERO, prejuizo_acumulado - lucro_ou_prejuizo
+    if lucro_ou_prejuizo == 0 or valor_operacao <= limite_isencao:
+        return _ZERO, prejuizo_acumulado
+
+    lucro_liquido = lucro_ou_prejuizo - prejuizo_acumulado
+    imposto = ((lucro_liquido if lucro_liquido > 0 else _ZERO) * aliquota).quantize(_CENTAVO)
+    return imposto, max(_ZERO, prejuizo_acumulado - lucro_ou_prejuizo)
+
 
 class CalcularImpostoService(CalcularImpostoServicePort):
-    """Serviço para calcular o imposto a ser pago sobre lucros ou prejuízos de operações no mercado financeiro."""
+    """Serviço para calcular o imposto a ser pago sobre lucros ou prejuízos de operações no mercado financeiro.
+
+    Uma carteira pode negociar vários tickers: cada ticker tem o seu Investimento, e o prejuízo acumulado é
+    compartilhado entre todos eles.
+
+    O método de custo escolhe como o custo das ações vendidas é apurado: pelo preço médio ponderado (o padrão, com
+    um Investimento por ticker) ou pelos lotes comprados, consumidos em ordem FIFO ou LIFO (com um InvestimentoLotes
+    por ticker). O EstadoCalculo guarda apenas a quantidade e o preço médio de cada posição, então o custo por lotes
+    não pode ser retomado de um estado salvo.
+
+    A alíquota e o limite de isenção são os das constantes da classe, ou os de uma RegraImposto informada na criação
+    do serviço, guardados em atributos da instância.
+    """
 
     ALIQUOTA_IMPOSTO = Decimal("0.20")
     LIMITE_ISENCAO_IMPOSTO = Decimal("20000.00")
 
-    def calcular_impostos(self, operacoes: List[Operacao]) -> List[Decimal]:
-        """Calcula o imposto para uma lista de operações."""
-        impostos = []
-        investimento = Investimento()
-        prejuizo_acumulado = Decimal("0")
+    def __init__(self, metodo_custo: MetodoCusto = MetodoCusto.MEDIO, regra: "RegraImposto | None" = None):
+        """Configura o método de custo, a classe das posições de cada ticker e a regra do imposto."""
+        self._aliquota = self.ALIQUOTA_IMPOSTO if regra is None else regra.aliquota
+        self._limite_isencao = self.LIMITE_ISENCAO_IMPOSTO if regra is None else regra.limite_isencao
+        self._metodo_custo = metodo_custo
+        self._criar_posicao = (
+            Investimento if metodo_custo is MetodoCusto.MEDIO else partial(InvestimentoLotes, metodo_custo)
+        )
+
+    @property
+    def metodo_custo(self) -> MetodoCusto:
+        """Retorna o método de apuração do custo das ações vendidas."""
+        return self._metodo_custo
+
+    def calcular_impostos(self, operacoes: Iterable[Operacao] | LoteOperacoes) -> List[Decimal]:
+        """Calcula o imposto para uma sequência de operações, consumida uma única vez e na ordem."""
+        return list(self.iter_impostos(operacoes))
+
+    def iter_impostos(self, operacoes: Iterable[Operacao] | LoteOperacoes) -> Iterator[Decimal | str]:
+        """Produz o imposto (ou a mensagem de erro) de cada operação assim que ela é processada."""
+        return self._iter_impostos_valores(self._iter_valores(operacoes))
+
+    def calcular_impostos_com_estado(
+        self, operacoes: Iterable[Operacao] | LoteOperacoes, estado: EstadoCalculo | None = None
+    ) -> Tuple[List[Decimal | str], EstadoCalculo]:
+        """Calcula os impostos das operações a partir de um estado salvo e retorna também o estado final."""
+        if self._metodo_custo is not MetodoCusto.MEDIO:
+            raise ValueError("O estado do cálculo não guarda os lotes do custo FIFO ou LIFO")
+
+        estado = estado or EstadoCalculo()
+        posicoes = {None: Investimento.restaurar(estado.quantidade, estado.preco_medio)}
+        for ticker, quantidade, preco_medio in estado.posicoes:
+            posicoes[ticker] = Investimento.restaurar(quantidade, preco_medio)
+        impostos_valores = self._iter_impostos_valores(
+            self._iter_valores(operacoes), posicoes, estado.prejuizo_acumulado
+        )
 
-        for operacao in operacoes:
-            if operacao.tipo_operacao == TipoOperacao.BUY:
-                investimento.adicionar_acao(operacao.quantidade, operacao.preco_unitario)
-                impostos.append(Decimal("0"))
+        # O gerador retorna o prejuízo acumulado final ao terminar; as posições são atualizadas no lugar.
+        prejuizo_final = []
+
+        def produzir() -> Iterator[Decimal | str]:
+            prejuizo_final.append((yield from impostos_valores))
+
+        impostos = list(produzir())
+        sem_ticker = posicoes.pop(None)
+        return impostos, EstadoCalculo(
+            quantidade=sem_ticker.quantidade,
+            preco_medio=sem_ticker.preco_medio,
+            prejuizo_acumulado=prejuizo_final[0],
+            operacoes_processadas=estado.operacoes_processadas + len(impostos),
+            posicoes=tuple(
+                (ticker, investimento.quantidade, investimento.preco_medio)
+                for ticker, investimento in posicoes.items()
+                if investimento.quantidade
+            ),
+        )
+
+    def _iter_valores(
+        self, operacoes: Iterable[Operacao] | LoteOperacoes
+    ) -> Iterator[Tuple[bool, Decimal, int, str | None]]:
+        """Converte as operações em tuplas (é compra, preço unitário, quantidade, ticker)."""
+        if isinstance(operacoes, LoteOperacoes):
+            return self._iter_valores_lote(operacoes)
+
+        return (
+            (operacao.tipo_operacao == TipoOperacao.BUY, operacao.preco_unitario, operacao.quantidade, operacao.ticker)
+            for operacao in operacoes
+        )
+
+    @staticmethod
+    def _iter_valores_lote(lote: LoteOperacoes) -> Iterator[Tuple[bool, Decimal, int, None]]:
+        """Percorre as colunas do lote compacto sem criar uma Operacao por linha."""
+        # Os preços se repetem muito num lote; cada valor em centavos é convertido para Decimal uma única vez.
+        precos = {}
+        for codigo, centavos, quantidade in lote.iter_colunas():
+            preco_unitario = precos.get(centavos)
+            if preco_unitario is None:
+                if len(precos) >= _LIMITE_CACHE_PRECOS:
+                    precos.clear()
+                preco_unitario = precos[centavos] = Decimal(centavos).scaleb(-2)
+            yield codigo == CODIGO_COMPRA, preco_unitario, quantidade, None
+
+    def _iter_impostos_valores(
+        self,
+        valores: Iterable[Tuple[bool, Decimal, int, str | None]],
+        posicoes: Dict[str | None, Investimento | InvestimentoLotes] | None = None,
+        prejuizo_acumulado: Decimal = _ZERO,
+    ) -> Generator[Decimal | str, None, Decimal]:
+        """Calcula os impostos a partir de tuplas (é compra, preço unitário, quantidade, ticker).
+
+        As posições são indexadas pelo ticker (None para as operações sem ticker) num dicionário, então cada
+        operação custa O(1) independentemente da quantidade de tickers. Parte das posições e do prejuízo acumulado
+        informados (por padrão, uma carteira vazia), atualiza as posições no lugar e, ao terminar, retorna o
+        prejuízo acumulado final.
+        """
+        if posicoes is None:
+            posicoes = {}
+        aliquota = self._aliquota
+        limite_isencao = self._limite_isencao
+
+        for compra, preco_unitario, quantidade, ticker in valores:
+            investimento = posicoes.get(ticker)
+            if investimento is None:
+                investimento = posicoes[ticker] = self._criar_posicao()
+
+            if compra:
+                investimento.adicionar_acao(quantidade, preco_unitario)
+                yield _ZERO
             else:
-                if resultado_verificacao := investimento.verifica_se_pode_remover_acao(operacao.quantidade):
-                    impostos.append(resultado_verificacao)
+                if resultado_verificacao := investimento.verifica_se_pode_remover_acao(quantidade):
+                    yield resultado_verificacao
                     continue
 
-                lucro_ou_prejuizo = self._calcular_lucro_ou_prejuizo(investimento, operacao)
-                imposto = self._calcular_imposto(lucro_ou_prejuizo, prejuizo_acumulado, operacao.valor_total)
+                lucro_ou_prejuizo = self._calcular_lucro_ou_prejuizo(investimento, preco_unitario, quantidade)
+                imposto, prejuizo_acumulado = apurar_venda(
+                    lucro_ou_prejuizo, preco_unitario * quantidade, prejuizo_acumulado, aliquota, limite_isencao
+                )
 
-                if lucro_ou_prejuizo < 0:
-                    prejuizo_acumulado += abs(lucro_ou_prejuizo)
-                elif operacao.valor_total > self.LIMITE_ISENCAO_IMPOSTO and lucro_ou_prejuizo > 0:
-                    prejuizo_acumulado = max(Decimal("0"), prejuizo_acumulado - lucro_ou_prejuizo)
+                investimento.remover_acao(quantidade)
+                yield imposto
 
-                investimento.remover_acao(operacao.quantidade)
-                impostos.append(imposto)
+        return prejuizo_acumulado
 
-        return impostos
-
-    def _calcular_lucro_ou_prejuizo(self, investimento: Investimento, operacao: Operacao) -> Decimal:
+    def _calcular_lucro_ou_prejuizo(
+        self, investimento: Investimento | InvestimentoLotes, preco_unitario: Decimal, quantidade: int
+    ) -> Decimal:
         """Calcula o lucro ou prejuizo de uma operação de venda."""
+        if self._metodo_custo is not MetodoCusto.MEDIO:
+            return preco_unitario * quantidade - investimento.calcular_custo(quantidade)
+
         preco_medio = investimento.preco_medio
-        return (operacao.preco_unitario - preco_medio) * operacao.quantidade
+        return (preco_unitario - preco_medio) * quantidade
 
     def _calcular_imposto(self, lucro_bruto: Decimal, prejuizo_acumulado: Decimal, valor_operacao: Decimal) -> Decimal:
         """Calcula o imposto considerando prejuízos acumulados e o limite de isenção."""
-        if lucro_bruto <= 0:
-            return Decimal("0")
-
-        lucro_liquido = max(Decimal("0"), lucro_bruto - prejuizo_acumulado)
-
-        if valor_operacao <= self.LIMITE_ISENCAO_IMPOSTO:
-            return Decimal("0")
-
-        return (lucro_liquido * self.ALIQUOTA_IMPOSTO).quantize(Decimal("0.01"))
+        imposto, _ = apurar_venda(
+            lucro_bruto, valor_operacao, prejuizo_acumulado, self._aliquota, self._limite_isencao
+        )
+        return imposto
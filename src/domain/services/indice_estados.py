@@ -0,0 +1,76 @@
+from decimal import Decimal
+from typing import Iterable, List
+
+from src.domain.models.estado_calculo import EstadoCalculo
+from src.domain.models.operacao import Operacao
+from src.domain.ports.services.calcular_imposto_service_port import CalcularImpostoServicePort
+
+
+class IndiceEstados:
+    """Índice do estado do cálculo ao longo de uma carteira processada, para consultas em qualquer ponto.
+
+    A carteira é calculada uma única vez, em blocos de `intervalo` operações, e o EstadoCalculo ao final de cada bloco
+    é guardado como instantâneo; as operações da carteira são os deltas entre dois instantâneos. O estado após as n
+    primeiras operações parte do instantâneo anterior mais próximo e recalcula no máximo intervalo - 1 operações, em
+    vez de refazer a carteira desde o início.
+
+    Args:
+        imposto_service: Serviço de cálculo usado na construção e nas consultas
+        operacoes: Operações da carteira, guardadas para as consultas
+        intervalo: Quantidade de operações entre dois instantâneos
+    """
+
+    def __init__(self, imposto_service: CalcularImpostoServicePort, operacoes: Iterable[Operacao], intervalo: int):
+        if intervalo < 1:
+            raise ValueError("Intervalo entre instantâneos deve ser maior que zero")
+
+        self._imposto_service = imposto_service
+        self._operacoes = list(operacoes)
+        self._intervalo = intervalo
+        self._instantaneos = [EstadoCalculo()]
+        self._impostos: List[Decimal | str] = []
+
+        estado = self._instantaneos[0]
+        for inicio in range(0, len(self._operacoes), intervalo):
+            impostos, estado = imposto_service.calcular_impostos_com_estado(
+                self._operacoes[inicio : inicio + intervalo], estado
+            )
+            self._impostos.extend(impostos)
+            self._instantaneos.append(estado)
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de operações da carteira."""
+        return len(self._operacoes)
+
+    @property
+    def impostos(self) -> List[Decimal | str]:
+        """Impostos de todas as operações, calculados na construção do índice."""
+        return self._impostos
+
+    @property
+    def instantaneos(self) -> int:
+        """Quantidade de instantâneos guardados, incluindo o estado da carteira vazia."""
+        return len(self._instantaneos)
+
+    def estado_em(self, operacoes_processadas: int) -> EstadoCalculo:
+        """Retorna o estado (posições, preços médios e prejuízo acumulado) após as primeiras operações da carteira.
+
+        Args:
+            operacoes_processadas: Quantidade de operações já processadas, de 0 (carteira vazia) a len(self)
+
+        Raises:
+            IndexError: Se a quantidade estiver fora da carteira
+        """
+        if not 0 <= operacoes_processadas <= len(self._operacoes):
+            raise IndexError(f"Operação fora da carteira: {operacoes_processadas}")
+
+        bloco, deslocamento = divmod(operacoes_processadas, self._intervalo)
+        instantaneo = self._instantaneos[bloco]
+        if deslocamento == 0:
+            return instantaneo
+
+        inicio = bloco * self._intervalo
+        _, estado = self._imposto_service.calcular_impostos_com_estado(
+            self._operacoes[inicio:operacoes_processadas], instantaneo
+        )
+        return estado
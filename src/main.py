@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Ponto de entrada principal da aplicação."""
 
+import sys
+
 from src.application.cli.main import main
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""Ponto de entrada do servidor de cálculo de impostos."""
+
+import sys
+
+from src.application.servidor.main import main
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -40,13 +40,14 @@ def load_input_file(filename):
         ),
     ],
 )
-def test_main_with_input(input_file, expected_output):
+@pytest.mark.parametrize("argumentos", [[], ["--engine", "local"]])
+def test_main_with_input(input_file, expected_output, argumentos):
     """Testa todos os dez casos de testes presentes nas especificações do code challenge."""
     input_data = load_input_file(input_file)
     output_data = io.StringIO()
 
     with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", output_data):
-        main()
+        main(argumentos)
 
     assert output_data.getvalue() == expected_output
 
@@ -0,0 +1,212 @@
+import json
+import sys
+
+from benchmarks.benchmark_cenarios import executar as executar_cenarios
+from benchmarks.benchmark_entrada import gerar_arquivo, medir_processo
+from benchmarks.benchmark_etapas import comparar_com_referencia, executar, main
+from benchmarks.benchmark_formatos import executar as executar_formatos
+from benchmarks.benchmark_indice import executar as executar_indice
+from benchmarks.benchmark_inicializacao import medir_importacao, verificar_orcamento
+from benchmarks.benchmark_lotes import executar as executar_lotes, gerar_lotes_pequenos
+from benchmarks.benchmark_memoria_operacoes import executar as executar_memoria
+from benchmarks.benchmark_servidor import resumir_latencias
+from benchmarks.benchmark_tickers import executar as executar_tickers
+from benchmarks.gerador_carteiras import LIMITE_ISENCAO, PerfilCarteira, gerar_linha, gerar_operacoes
+from src.adapters.input.json_parser import JsonParser
+from src.domain.models.operacao import TipoOperacao
+from src.domain.services.calcular_imposto_service import CalcularImpostoService
+
+
+class TestGeradorCarteiras:
+    def test_mesma_semente_gera_mesma_carteira(self):
+        """Testa se o gerador é determinístico para uma mesma semente."""
+        perfil = PerfilCarteira(operacoes=500, semente=7)
+
+        assert gerar_linha(perfil) == gerar_linha(perfil)
+        assert gerar_linha(perfil) != gerar_linha(PerfilCarteira(operacoes=500, semente=8))
+
+    def test_carteira_valida_para_o_calculo(self):
+        """Testa se a carteira gerada é lida e calculada sem vendas acima da quantidade em carteira."""
+        linha = gerar_linha(PerfilCarteira(operacoes=1000))
+
+        impostos = CalcularImpostoService().calcular_impostos(JsonParser.parse_operations(linha))
+
+        assert len(impostos) == 1000
+        assert all(not isinstance(imposto, str) for imposto in impostos)
+
+    def test_perfil_controla_compras_e_limite(self):
+        """Testa se a proporção de compras e de vendas acima do limite de isenção seguem o perfil."""
+        operacoes = gerar_operacoes(PerfilCarteira(operacoes=2000, proporcao_compras=0.8, proporcao_acima_limite=1))
+        vendas = [operacao for operacao in operacoes if operacao["operation"] == "sell"]
+
+        assert 0.75 < 1 - len(vendas) / len(operacoes) < 0.9
+        acima_do_limite = [venda for venda in vendas if venda["unit-cost"] * venda["quantity"] > LIMITE_ISENCAO]
+        assert len(acima_do_limite) > 0.5 * len(vendas)
+
+    def test_sequencias_de_prejuizo(self):
+        """Testa se as vendas produzem prejuízos quando a probabilidade de prejuízo é máxima."""
+        linha = gerar_linha(PerfilCarteira(operacoes=200, probabilidade_prejuizo=1, proporcao_acima_limite=1))
+
+        impostos = CalcularImpostoService().calcular_impostos(JsonParser.parse_operations(linha))
+
+        assert all(imposto == 0 for imposto in impostos)
+
+    def test_carteira_com_tickers(self):
+        """Testa se os tickers sorteados têm posições próprias, sem vendas acima da quantidade de cada ticker."""
+        perfil = PerfilCarteira(operacoes=1000, tickers=20)
+        linha = gerar_linha(perfil)
+
+        operacoes = JsonParser.parse_operations(linha)
+        impostos = CalcularImpostoService().calcular_impostos(operacoes)
+
+        assert len({operacao.ticker for operacao in operacoes}) == 20
+        assert all(not isinstance(imposto, str) for imposto in impostos)
+        assert gerar_linha(PerfilCarteira(operacoes=1000)) == gerar_linha(PerfilCarteira(operacoes=1000, tickers=0))
+
+
+class TestBenchmarkEtapas:
+    def test_executar(self):
+        """Testa se todas as etapas são medidas e os resultados são serializáveis."""
+        resultados = executar(PerfilCarteira(operacoes=50), linhas=2, repeticoes=2)
+
+        assert set(resultados["etapas"]) == {"leitura", "leitura_json", "calculo", "formatacao", "ponta_a_ponta"}
+        assert resultados["perfil"]["operacoes"] == 50
+        assert json.loads(json.dumps(resultados)) == resultados
+
+    def test_comparar_com_referencia(self):
+        """Testa a detecção de etapas mais lentas que a tolerância."""
+        referencia = {"etapas": {"leitura": {"minimo_s": 1.0}, "calculo": {"minimo_s": 1.0}}}
+        resultados = {"etapas": {"leitura": {"minimo_s": 1.1}, "calculo": {"minimo_s": 1.5}, "nova": {"minimo_s": 9}}}
+
+        regressoes = comparar_com_referencia(resultados, referencia, tolerancia=0.2)
+
+        assert regressoes == ["calculo: 1.0s -> 1.5s (1.50x)"]
+
+    def test_main_grava_resultados_e_compara(self, tmp_path):
+        """Testa a gravação dos resultados e o status de saída da comparação com uma referência."""
+        saida = tmp_path / "resultados.json"
+        referencia = tmp_path / "referencia.json"
+        referencia.write_text(json.dumps({"etapas": {"calculo": {"minimo_s": 1e-9}}}))
+        argumentos = ["--operacoes", "20", "--linhas", "1", "--repeticoes", "1", "--saida", str(saida)]
+
+        assert main(argumentos) == 0
+        assert "etapas" in json.loads(saida.read_text())
+        assert main(argumentos + ["--referencia", str(referencia)]) == 1
+
+
+class TestBenchmarkServidor:
+    def test_resumir_latencias(self):
+        """Testa o resumo das latências em milissegundos."""
+        resumo = resumir_latencias([0.001 * indice for indice in range(1, 101)])
+
+        assert resumo == {"mediana_ms": 50.5, "p90_ms": 91.0, "p99_ms": 100.0, "maximo_ms": 100.0}
+
+
+class TestBenchmarkInicializacao:
+    def test_medir_importacao(self):
+        """Testa se a importação é medida num processo novo, com os módulos importados."""
+        resultado = medir_importacao("src.domain.models.operacao")
+
+        assert resultado["microssegundos"] > 0
+        assert {"src.domain.models.operacao", "decimal"} <= resultado["modulos"]
+
+    def test_verificar_orcamento(self):
+        """Testa se o tempo acima do orçamento e os módulos pesados importados são apontados."""
+        resultados = {"importacao_ms": {"minimo": 80.0}, "modulos_pesados_importados": ["sqlite3"]}
+
+        assert verificar_orcamento({**resultados, "modulos_pesados_importados": []}, 100) == []
+        assert len(verificar_orcamento(resultados, 60)) == 2
+
+
+class TestBenchmarkEntrada:
+    def test_gerar_arquivo_e_medir_processo(self, tmp_path):
+        """Testa se o arquivo gerado é processado pela CLI com --input e se o tempo e a memória são medidos."""
+        caminho = str(tmp_path / "carteiras.txt")
+
+        tamanho = gerar_arquivo(caminho, PerfilCarteira(operacoes=20), linhas=3)
+        medicao = medir_processo([sys.executable, "-m", "src.main", "--input", caminho])
+
+        assert tamanho == (tmp_path / "carteiras.txt").stat().st_size
+        assert (tmp_path / "carteiras.txt").read_text().count("\n") == 3
+        assert medicao["segundos"] > 0
+        assert medicao["memoria_kib"] > 0
+
+
+class TestBenchmarkCenarios:
+    def test_executar(self):
+        """Testa se os dois motores são medidos e se os resultados são serializáveis."""
+        resultados = executar_cenarios(PerfilCarteira(operacoes=100), cenarios=5, repeticoes=1)
+
+        assert set(resultados["motores"]) == {"decimal", "local"}
+        etapas = {"recalculo_s", "cenarios_s", "aceleracao"}
+        assert all(set(medidas) == etapas for medidas in resultados["motores"].values())
+        assert json.loads(json.dumps(resultados)) == resultados
+
+
+class TestBenchmarkFormatos:
+    def test_executar(self):
+        """Testa se os dois formatos são medidos e se o binário ocupa menos bytes que o JSON."""
+        resultados = executar_formatos(PerfilCarteira(operacoes=50), linhas=2, repeticoes=1)
+
+        assert set(resultados["minimo_s"]) == {
+            "leitura_json",
+            "leitura_json_lote",
+            "leitura_binaria",
+            "formatacao_json",
+            "formatacao_binaria",
+        }
+        assert resultados["bytes"]["entrada_binaria"] == 2 * (4 + 50 * 17)
+        assert resultados["bytes"]["entrada_binaria"] < resultados["bytes"]["entrada_json"]
+        assert json.loads(json.dumps(resultados)) == resultados
+
+
+class TestBenchmarkIndice:
+    def test_executar(self):
+        """Testa se a construção e as consultas são medidas nos dois motores e se os resultados são serializáveis."""
+        resultados = executar_indice(PerfilCarteira(operacoes=100), intervalo=10, consultas=20, consultas_recalculo=5)
+
+        etapas = {"construcao_s", "consulta_indice_s", "consulta_recalculo_s", "aceleracao"}
+        assert all(set(medidas) == etapas for medidas in resultados["motores"].values())
+        assert set(resultados["motores"]) == {"decimal", "local"}
+        assert json.loads(json.dumps(resultados)) == resultados
+
+
+class TestBenchmarkLotes:
+    def test_gerar_lotes_pequenos(self):
+        """Testa se a carteira vende todas as ações compradas, em vendas periódicas e na venda final."""
+        operacoes = gerar_lotes_pequenos(250)
+
+        compras = sum(operacao.quantidade for operacao in operacoes if operacao.tipo_operacao is TipoOperacao.BUY)
+        vendas = sum(operacao.quantidade for operacao in operacoes if operacao.tipo_operacao is TipoOperacao.SELL)
+        assert len(operacoes) == 250 + 2 + 1
+        assert compras == vendas == 250
+
+    def test_executar(self):
+        """Testa se cada quantidade de lotes é medida com os três métodos de custo."""
+        resultados = executar_lotes([100, 200], repeticoes=1)
+
+        assert set(resultados["lotes"]) == {"100", "200"}
+        assert all(set(metodos) == {"medio", "fifo", "lifo"} for metodos in resultados["lotes"].values())
+        assert json.loads(json.dumps(resultados)) == resultados
+
+
+class TestBenchmarkMemoriaOperacoes:
+    def test_executar(self):
+        """Testa se a memória retida e o pico da leitura são medidos para a lista e para o lote compacto."""
+        resultados = executar_memoria(1000)
+
+        for representacao in ("lista_operacao", "lote_operacoes"):
+            retidos = resultados["bytes_por_operacao"][representacao]
+            assert 0 < retidos <= resultados["bytes_pico_leitura_por_operacao"][representacao]
+        assert resultados["bytes_por_operacao"]["lote_operacoes"] < resultados["bytes_por_operacao"]["lista_operacao"]
+        assert json.loads(json.dumps(resultados)) == resultados
+
+
+class TestBenchmarkTickers:
+    def test_executar(self):
+        """Testa se cada quantidade de tickers é medida nos dois motores e se os resultados são serializáveis."""
+        resultados = executar_tickers(PerfilCarteira(operacoes=100), [0, 10], repeticoes=1)
+
+        assert set(resultados["tickers"]) == {"0", "10"}
+        assert all(set(motores) == {"decimal", "local"} for motores in resultados["tickers"].values())
+        assert json.loads(json.dumps(resultados)) == resultados
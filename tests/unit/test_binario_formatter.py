@@ -0,0 +1,37 @@
+from decimal import Decimal
+import io
+
+from src.adapters.output.binario_formatter import CENTAVOS_ERRO, BinarioFormatter, ler_registro_impostos
+
+
+class TestBinarioFormatter:
+    def test_formatar_e_ler_impostos(self):
+        """Testa se os impostos e as mensagens de erro formatados num registro são lidos de volta na mesma ordem."""
+        impostos = [Decimal("0"), Decimal("10000.00"), "Can't sell more stocks than you have", Decimal("0.05"), "Erro"]
+
+        registro = BinarioFormatter.formatar_impostos(impostos)
+
+        assert ler_registro_impostos(io.BytesIO(registro)) == impostos
+
+    def test_layout_do_registro(self):
+        """Testa o layout do registro: o cabeçalho, a coluna em centavos e as mensagens de erro no final."""
+        registro = BinarioFormatter.formatar_impostos([Decimal("1.50"), "Erro"])
+
+        assert registro == (
+            (2).to_bytes(4, "little")
+            + (4).to_bytes(4, "little")
+            + (150).to_bytes(8, "little")
+            + CENTAVOS_ERRO.to_bytes(8, "little", signed=True)
+            + b"Erro"
+        )
+
+    def test_varios_registros_e_fim_do_arquivo(self):
+        """Testa a leitura de registros consecutivos, incluindo um registro vazio, até o fim do arquivo."""
+        arquivo = io.BytesIO()
+        BinarioFormatter().escrever_impostos([Decimal("1")], arquivo)
+        BinarioFormatter().escrever_impostos([], arquivo)
+        arquivo.seek(0)
+
+        assert ler_registro_impostos(arquivo) == [Decimal("1")]
+        assert ler_registro_impostos(arquivo) == []
+        assert ler_registro_impostos(arquivo) is None
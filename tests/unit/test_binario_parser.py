@@ -0,0 +1,56 @@
+from decimal import Decimal
+import io
+
+import pytest
+from src.adapters.input.binario_parser import BinarioParser, codificar_operacoes, ler_registros, tamanho_registro
+from src.domain.exceptions.parse_error import ParseError
+from src.domain.models.lote_operacoes import LoteOperacoes
+from src.domain.models.operacao import Operacao, TipoOperacao
+
+OPERACOES = [
+    Operacao(tipo_operacao=TipoOperacao.BUY, preco_unitario=Decimal("10.05"), quantidade=100),
+    Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("15"), quantidade=50),
+]
+
+
+class TestBinarioParser:
+    def test_codificar_e_ler_operacoes(self):
+        """Testa se as operações codificadas num registro são lidas de volta num lote compacto."""
+        registro = codificar_operacoes(OPERACOES)
+
+        lote = BinarioParser.parse_operations(registro)
+
+        assert len(registro) == tamanho_registro(2) == 4 + 2 * 17
+        assert isinstance(lote, LoteOperacoes)
+        assert list(lote) == OPERACOES
+
+    def test_registro_little_endian(self):
+        """Testa o layout do registro: a quantidade e as colunas de tipos, preços e quantidades em little-endian."""
+        registro = codificar_operacoes(OPERACOES[:1])
+
+        assert registro == b"\x01\x00\x00\x00" + b"\x00" + (1005).to_bytes(8, "little") + (100).to_bytes(8, "little")
+
+    def test_carteira_vazia(self):
+        """Testa a leitura de um registro sem operações."""
+        assert list(BinarioParser.parse_operations(codificar_operacoes([]))) == []
+
+    def test_ler_registros(self):
+        """Testa a separação dos registros de um arquivo pelos seus cabeçalhos."""
+        registros = [codificar_operacoes(OPERACOES), codificar_operacoes([]), codificar_operacoes(OPERACOES[1:])]
+
+        assert list(ler_registros(io.BytesIO(b"".join(registros)))) == registros
+
+    @pytest.mark.parametrize("dados", [b"\x02\x00", codificar_operacoes(OPERACOES)[:-1]])
+    def test_ler_registros_incompletos(self, dados):
+        """Testa se um cabeçalho ou um registro cortado no fim do arquivo gera ParseError."""
+        with pytest.raises(ParseError, match="incompleto"):
+            list(ler_registros(io.BytesIO(dados)))
+
+    @pytest.mark.parametrize(
+        "dados",
+        [b"\x01", codificar_operacoes(OPERACOES) + b"\x00", b"\x01\x00\x00\x00\x07" + bytes(16)],
+    )
+    def test_registro_invalido(self, dados):
+        """Testa se registros com tamanho diferente do cabeçalho ou com código inválido geram ParseError."""
+        with pytest.raises(ParseError, match="Erro ao processar registro binário"):
+            BinarioParser.parse_operations(dados)
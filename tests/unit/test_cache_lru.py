@@ -0,0 +1,70 @@
+import sys
+
+from src.adapters.cache.cache_lru import CacheLru
+from src.adapters.cache.persistencia_sqlite import PersistenciaSqlite
+
+
+def tamanho_entrada(chave: bytes, saida: str) -> int:
+    """Calcula o tamanho contabilizado para uma entrada do cache."""
+    return sys.getsizeof(chave) + sys.getsizeof(saida)
+
+
+class TestCacheLru:
+    def test_acerto_e_falha(self):
+        """Testa os contadores de acerto e falha."""
+        cache = CacheLru(limite_bytes=1024)
+
+        assert cache.obter(b"a") is None
+        cache.guardar(b"a", "[]")
+
+        assert cache.obter(b"a") == "[]"
+        assert cache.contadores()["acertos"] == 1
+        assert cache.contadores()["falhas"] == 1
+        assert cache.contadores()["entradas"] == 1
+        assert cache.contadores()["bytes"] == tamanho_entrada(b"a", "[]")
+
+    def test_remove_o_menos_usado_recentemente(self):
+        """Testa se, ao exceder o limite, a entrada usada há mais tempo é removida."""
+        cache = CacheLru(limite_bytes=2 * tamanho_entrada(b"a", "saida-a"))
+        cache.guardar(b"a", "saida-a")
+        cache.guardar(b"b", "saida-b")
+        cache.obter(b"a")
+
+        cache.guardar(b"c", "saida-c")
+
+        assert cache.obter(b"b") is None
+        assert cache.obter(b"a") == "saida-a"
+        assert cache.obter(b"c") == "saida-c"
+        assert cache.contadores()["remocoes"] == 1
+
+    def test_substituir_entrada_mantem_a_ocupacao(self):
+        """Testa se guardar novamente a mesma chave não conta o tamanho da entrada duas vezes."""
+        cache = CacheLru(limite_bytes=1024)
+        cache.guardar(b"a", "x")
+        cache.guardar(b"a", "x")
+
+        assert cache.contadores()["bytes"] == tamanho_entrada(b"a", "x")
+
+    def test_resultado_maior_que_o_limite_nao_fica_em_memoria(self):
+        """Testa se um resultado maior que o limite inteiro do cache não é mantido em memória."""
+        cache = CacheLru(limite_bytes=10)
+        cache.guardar(b"a", "resultado grande")
+
+        assert cache.obter(b"a") is None
+        assert cache.contadores()["remocoes"] == 0
+
+    def test_persistencia_sobrevive_a_um_novo_cache(self, tmp_path):
+        """Testa se os resultados persistidos são encontrados por um novo cache, como após reiniciar o processo."""
+        caminho = str(tmp_path / "cache.db")
+        cache = CacheLru(limite_bytes=1024, persistencia=PersistenciaSqlite(caminho))
+        cache.guardar(b"a", "[]")
+        cache.fechar()
+
+        novo_cache = CacheLru(limite_bytes=1024, persistencia=PersistenciaSqlite(caminho))
+
+        assert novo_cache.obter(b"a") == "[]"
+        assert novo_cache.obter(b"a") == "[]"
+        assert novo_cache.contadores()["acertos_disco"] == 1
+        assert novo_cache.contadores()["acertos"] == 1
+        assert novo_cache.obter(b"b") is None
+        novo_cache.fechar()
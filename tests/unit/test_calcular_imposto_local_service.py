@@ -0,0 +1,204 @@
+from datetime import date
+from decimal import Decimal
+import os
+import random
+
+import pytest
+from src.adapters.input.json_parser import JsonParser
+from src.domain.models.estado_calculo import EstadoCalculo
+from src.domain.models.lote_operacoes import LoteOperacoes
+from src.domain.models.operacao import Operacao, TipoOperacao
+from src.domain.models.regra_imposto import RegraImposto
+from src.domain.services.calcular_imposto_local_service import CalcularImpostoLocalService
+from src.domain.services.calcular_imposto_service import CalcularImpostoService
+
+
+def gerar_carteira(gerador: random.Random, tamanho: int, tickers: tuple = (None,)) -> list:
+    """Gera uma carteira aleatória com compras, vendas, prejuízos e vendas acima do estoque, nos tickers informados."""
+    operacoes = []
+    quantidades = dict.fromkeys(tickers, 0)
+    for _ in range(tamanho):
+        ticker = gerador.choice(tickers)
+        preco = Decimal(gerador.randint(1, 100_000)).scaleb(-2)
+        if quantidades[ticker] == 0 or gerador.random() < 0.5:
+            quantidade_operacao = gerador.randint(1, 10_000)
+            operacoes.append(Operacao(TipoOperacao.BUY, preco, quantidade_operacao, ticker))
+            quantidades[ticker] += quantidade_operacao
+        else:
+            quantidade_operacao = gerador.randint(1, quantidades[ticker] + 10)
+            operacoes.append(Operacao(TipoOperacao.SELL, preco, quantidade_operacao, ticker))
+            if quantidade_operacao <= quantidades[ticker]:
+                quantidades[ticker] -= quantidade_operacao
+    return operacoes
+
+
+def gerar_carteira_ampla(gerador: random.Random, tamanho: int, casas_decimais: int = 4) -> list:
+    """Gera uma carteira com preços e quantidades em várias ordens de grandeza, de centavos a bilhões."""
+    operacoes = []
+    quantidade = 0
+    for _ in range(tamanho):
+        preco = Decimal(gerador.randint(1, 10 ** gerador.randint(1, 12))).scaleb(-gerador.randint(0, casas_decimais))
+        if quantidade == 0 or gerador.random() < 0.6:
+            quantidade_operacao = gerador.randint(1, 10 ** gerador.randint(0, 7))
+            operacoes.append(Operacao(TipoOperacao.BUY, preco, quantidade_operacao))
+            quantidade += quantidade_operacao
+        else:
+            quantidade_operacao = gerador.randint(1, quantidade)
+            operacoes.append(Operacao(TipoOperacao.SELL, preco, quantidade_operacao))
+            quantidade -= quantidade_operacao
+    return operacoes
+
+
+# Carteira em que arredondar o preço médio numa escala fixa, e não em 28 dígitos significativos, muda um centavo.
+CARTEIRA_DIVERGENTE = [
+    Operacao(TipoOperacao.BUY, Decimal("10.00"), 7),
+    Operacao(TipoOperacao.BUY, Decimal("15.50"), 10000),
+    Operacao(TipoOperacao.BUY, Decimal("5.00"), 5001),
+    Operacao(TipoOperacao.SELL, Decimal("123.45"), 8308),
+]
+
+
+class TestCalcularImpostoLocalService:
+    def setup_method(self):
+        """Configuração inicial para cada teste."""
+        self.service = CalcularImpostoLocalService()
+        self.referencia = CalcularImpostoService()
+
+    @pytest.mark.parametrize("arquivo", sorted(os.listdir("input_examples")))
+    def test_mesmos_impostos_nos_exemplos(self, arquivo):
+        """Testa se os impostos são idênticos aos do serviço em Decimal nos exemplos do desafio."""
+        with open(os.path.join("input_examples", arquivo)) as entrada:
+            for linha in entrada:
+                if linha.strip():
+                    operacoes = JsonParser.parse_operations(linha)
+                    assert self.service.calcular_impostos(operacoes) == self.referencia.calcular_impostos(operacoes)
+
+    def test_mesmos_impostos_em_carteiras_aleatorias(self):
+        """Testa se os impostos são idênticos aos do serviço em Decimal em carteiras aleatórias."""
+        gerador = random.Random(2024)
+        for _ in range(50):
+            operacoes = gerar_carteira(gerador, 200)
+
+            assert self.service.calcular_impostos(operacoes) == self.referencia.calcular_impostos(operacoes)
+
+    def test_preco_medio_arredondado_como_no_decimal(self):
+        """Testa se o preço médio é arredondado em 28 dígitos significativos a cada compra, como no Decimal."""
+        impostos = self.service.calcular_impostos(CARTEIRA_DIVERGENTE)
+
+        assert impostos == self.referencia.calcular_impostos(CARTEIRA_DIVERGENTE)
+        assert impostos[-1] == Decimal("185187.65")
+
+    def test_mesmos_impostos_e_estado_em_ordens_de_grandeza_variadas(self):
+        """Testa impostos e estado idênticos aos do serviço em Decimal com preços e quantidades muito variados."""
+        gerador = random.Random(2031)
+        for _ in range(200):
+            operacoes = gerar_carteira_ampla(gerador, 100)
+
+            impostos, estado = self.service.calcular_impostos_com_estado(operacoes)
+
+            assert (impostos, estado) == self.referencia.calcular_impostos_com_estado(operacoes)
+
+    def test_mesmos_impostos_com_lote_operacoes(self):
+        """Testa se um LoteOperacoes produz os mesmos impostos que a lista de operações equivalente."""
+        gerador = random.Random(2025)
+        for _ in range(20):
+            operacoes = gerar_carteira(gerador, 200)
+
+            impostos = self.service.calcular_impostos(LoteOperacoes.de_operacoes(operacoes))
+
+            assert impostos == self.referencia.calcular_impostos(operacoes)
+
+    def test_calcular_impostos_com_estado_retoma_do_prefixo(self):
+        """Testa se retomar do estado serializado de um prefixo produz os mesmos impostos da carteira inteira."""
+        gerador = random.Random(2026)
+        for _ in range(10):
+            operacoes = gerar_carteira(gerador, 100)
+            corte = gerador.randint(0, len(operacoes))
+
+            impostos_prefixo, estado = self.service.calcular_impostos_com_estado(operacoes[:corte])
+            estado = EstadoCalculo.de_dict(estado.como_dict())
+            impostos_cauda, estado_final = self.service.calcular_impostos_com_estado(operacoes[corte:], estado)
+
+            assert impostos_prefixo + impostos_cauda == self.referencia.calcular_impostos(operacoes)
+            assert estado_final == self.service.calcular_impostos_com_estado(operacoes)[1]
+            assert estado_final.operacoes_processadas == len(operacoes)
+
+    def test_mesmos_impostos_e_estado_com_varios_tickers(self):
+        """Testa os impostos e as posições de carteiras com vários tickers, inclusive ao retomar de um estado."""
+        gerador = random.Random(2027)
+        for _ in range(10):
+            operacoes = gerar_carteira(gerador, 200, (None, "PETR4", "VALE3", "ITUB4"))
+            corte = gerador.randint(0, len(operacoes))
+
+            impostos_prefixo, estado = self.service.calcular_impostos_com_estado(operacoes[:corte])
+            estado = EstadoCalculo.de_dict(estado.como_dict())
+            impostos_cauda, estado_final = self.service.calcular_impostos_com_estado(operacoes[corte:], estado)
+
+            assert impostos_prefixo + impostos_cauda == self.referencia.calcular_impostos(operacoes)
+            assert estado_final == self.service.calcular_impostos_com_estado(operacoes)[1]
+            estado_referencia = self.referencia.calcular_impostos_com_estado(operacoes)[1]
+            assert sorted(estado_final.posicoes) == sorted(estado_referencia.posicoes)
+
+    def test_calcular_cenarios_igual_ao_recalculo_da_carteira(self):
+        """Testa se os cenários produzem os impostos do serviço em Decimal recalculando a carteira de cada cauda."""
+        gerador = random.Random(2028)
+        tickers = (None, "PETR4", "VALE3")
+        prefixo = gerar_carteira(gerador, 200, tickers)
+        caudas = [gerar_carteira(gerador, gerador.randint(0, 20), tickers) for _ in range(20)]
+
+        cenarios = self.service.calcular_cenarios(prefixo, caudas)
+
+        assert len(cenarios) == len(caudas)
+        for cauda, impostos in zip(caudas, cenarios):
+            assert impostos == self.referencia.calcular_impostos(prefixo + cauda)[len(prefixo) :]
+
+    def test_calcular_cenarios_nao_altera_o_estado_entre_caudas(self):
+        """Testa se a venda de uma cauda não reduz a posição vista pelas caudas seguintes."""
+        prefixo = LoteOperacoes.de_operacoes([Operacao(TipoOperacao.BUY, Decimal("10.00"), 1000)])
+        cauda = [Operacao(TipoOperacao.SELL, Decimal("5.00"), 1000)]
+
+        assert self.service.calcular_cenarios(prefixo, [cauda, cauda]) == [[Decimal("0")], [Decimal("0")]]
+
+    @pytest.mark.parametrize(
+        "aliquota, limite_isencao", [("0.15", "35000.00"), ("0.275", "0"), ("0.2", "1234.56"), ("0", "20000")]
+    )
+    def test_mesmos_impostos_com_regra(self, aliquota, limite_isencao):
+        """Testa se os impostos são idênticos aos do serviço em Decimal com outra alíquota e outro limite."""
+        regra = RegraImposto(date(2025, 1, 1), Decimal(aliquota), Decimal(limite_isencao))
+        service = CalcularImpostoLocalService(regra)
+        referencia = CalcularImpostoService(regra=regra)
+        gerador = random.Random(2030)
+        for _ in range(20):
+            operacoes = gerar_carteira(gerador, 200)
+
+            assert service.calcular_impostos(operacoes) == referencia.calcular_impostos(operacoes)
+
+    def test_preco_medio_com_dizima(self):
+        """Testa um preço médio com dízima periódica, que exige arredondamento no contexto do Decimal."""
+        operacoes = [
+            Operacao(TipoOperacao.BUY, Decimal("10.00"), 3),
+            Operacao(TipoOperacao.BUY, Decimal("20.01"), 7),
+            Operacao(TipoOperacao.BUY, Decimal("30.07"), 11),
+            Operacao(TipoOperacao.SELL, Decimal("5000.00"), 20),
+        ]
+
+        impostos = self.service.calcular_impostos(operacoes)
+
+        assert impostos == self.referencia.calcular_impostos(operacoes)
+        assert impostos[-1] == Decimal("19904.60")
+
+    def test_compra_com_quantidade_invalida(self):
+        """Testa se uma compra com quantidade não positiva gera o mesmo erro do Investimento."""
+        with pytest.raises(ValueError, match="Quantidade deve ser maior que zero"):
+            self.service.calcular_impostos([Operacao(TipoOperacao.BUY, Decimal("10"), 0)])
+
+    def test_venda_com_quantidade_invalida(self):
+        """Testa se uma venda com quantidade não positiva produz a mensagem de erro."""
+        operacoes = [Operacao(TipoOperacao.BUY, Decimal("10"), 10), Operacao(TipoOperacao.SELL, Decimal("10"), 0)]
+
+        assert self.service.calcular_impostos(operacoes) == [Decimal("0"), "Quantidade deve ser maior que zero"]
+
+    def test_constantes_do_service(self):
+        """Testa se as constantes são as mesmas do serviço em Decimal."""
+        assert self.service.ALIQUOTA_IMPOSTO == Decimal("0.20")
+        assert self.service.LIMITE_ISENCAO_IMPOSTO == Decimal("20000.00")
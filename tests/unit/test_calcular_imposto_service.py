@@ -1,10 +1,15 @@
+from datetime import date
 from decimal import Decimal
 from unittest.mock import Mock
 
 import pytest
+from src.domain.models.estado_calculo import EstadoCalculo
 from src.domain.models.investimento import Investimento
+from src.domain.models.investimento_lotes import MetodoCusto
+from src.domain.models.lote_operacoes import LoteOperacoes
 from src.domain.models.operacao import Operacao, TipoOperacao
-from src.domain.services.calcular_imposto_service import CalcularImpostoService
+from src.domain.models.regra_imposto import RegraImposto
+from src.domain.services.calcular_imposto_service import CalcularImpostoService, apurar_venda
 
 
 class TestCalcularImpostoService:
@@ -114,8 +119,12 @@ class TestCalcularImpostoService:
         operacao_lucro = Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("15"), quantidade=50)
         operacao_prejuizo = Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("5"), quantidade=50)
 
-        lucro = self.service._calcular_lucro_ou_prejuizo(investimento, operacao_lucro)
-        prejuizo = self.service._calcular_lucro_ou_prejuizo(investimento, operacao_prejuizo)
+        lucro = self.service._calcular_lucro_ou_prejuizo(
+            investimento, operacao_lucro.preco_unitario, operacao_lucro.quantidade
+        )
+        prejuizo = self.service._calcular_lucro_ou_prejuizo(
+            investimento, operacao_prejuizo.preco_unitario, operacao_prejuizo.quantidade
+        )
 
         assert lucro == Decimal("250")  # (15 - 10) * 50
         assert prejuizo == Decimal("-250")  # (5 - 10) * 50
@@ -155,7 +164,224 @@ class TestCalcularImpostoService:
         )
         assert imposto == Decimal("0")
 
+    @pytest.mark.parametrize(
+        "lucro, valor, prejuizo, esperado",
+        [
+            ("-1000", "30000", "500", ("0", "1500")),
+            ("0", "30000", "500", ("0", "500")),
+            ("1000", "20000", "500", ("0", "500")),
+            ("1000", "30000", "400", ("120.00", "0")),
+            ("1000", "30000", "1500", ("0", "500")),
+        ],
+    )
+    def test_apurar_venda(self, lucro, valor, prejuizo, esperado):
+        """Testa o imposto e o prejuízo acumulado depois de uma venda com prejuízo, sem lucro, isenta e tributada."""
+        resultado = apurar_venda(Decimal(lucro), Decimal(valor), Decimal(prejuizo), Decimal("0.20"), Decimal("20000"))
+
+        assert resultado == tuple(Decimal(valor_esperado) for valor_esperado in esperado)
+
     def test_constantes_do_service(self):
         """Testa as constantes definidas no serviço."""
         assert self.service.ALIQUOTA_IMPOSTO == Decimal("0.20")
         assert self.service.LIMITE_ISENCAO_IMPOSTO == Decimal("20000.00")
+
+    def test_iter_impostos_produz_impostos_sob_demanda(self):
+        """Testa se iter_impostos entrega cada imposto antes de consumir as operações seguintes."""
+        consumidas = []
+
+        def operacoes():
+            for operacao in [
+                Operacao(tipo_operacao=TipoOperacao.BUY, preco_unitario=Decimal("10"), quantidade=10000),
+                Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("20"), quantidade=5000),
+                Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("20"), quantidade=6000),
+            ]:
+                consumidas.append(operacao)
+                yield operacao
+
+        impostos = self.service.iter_impostos(operacoes())
+
+        assert next(impostos) == Decimal("0")
+        assert len(consumidas) == 1
+        assert next(impostos) == Decimal("10000.00")
+        assert len(consumidas) == 2
+        assert next(impostos) == "Can't sell more stocks than you have"
+        with pytest.raises(StopIteration):
+            next(impostos)
+
+    def test_calcular_impostos_igual_a_iter_impostos(self):
+        """Testa se calcular_impostos devolve a lista com os mesmos valores produzidos por iter_impostos."""
+        operacoes = [
+            Operacao(tipo_operacao=TipoOperacao.BUY, preco_unitario=Decimal("10"), quantidade=5000),
+            Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("8"), quantidade=2000),
+            Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("15"), quantidade=3000),
+        ]
+
+        assert self.service.calcular_impostos(operacoes) == list(self.service.iter_impostos(operacoes))
+
+    def test_calcular_impostos_com_lote_operacoes(self):
+        """Testa se um LoteOperacoes produz os mesmos impostos que a lista de operações equivalente."""
+        operacoes = [
+            Operacao(tipo_operacao=TipoOperacao.BUY, preco_unitario=Decimal("10.00"), quantidade=10000),
+            Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("2.00"), quantidade=5000),
+            Operacao(tipo_operacao=TipoOperacao.BUY, preco_unitario=Decimal("20.50"), quantidade=3000),
+            Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("30.00"), quantidade=8000),
+            Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("30.00"), quantidade=1),
+        ]
+
+        impostos = self.service.calcular_impostos(LoteOperacoes.de_operacoes(operacoes))
+
+        assert impostos == self.service.calcular_impostos(operacoes)
+
+    def test_calcular_impostos_com_estado_retoma_do_prefixo(self):
+        """Testa se calcular a cauda a partir do estado do prefixo produz os impostos e o estado da carteira toda."""
+        operacoes = [
+            Operacao(tipo_operacao=TipoOperacao.BUY, preco_unitario=Decimal("10.00"), quantidade=10000),
+            Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("2.00"), quantidade=5000),
+            Operacao(tipo_operacao=TipoOperacao.BUY, preco_unitario=Decimal("20.00"), quantidade=2000),
+            Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("20.00"), quantidade=2000),
+            Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("25.00"), quantidade=1000),
+        ]
+        impostos_completos, estado_completo = self.service.calcular_impostos_com_estado(operacoes)
+
+        for corte in range(len(operacoes) + 1):
+            impostos_prefixo, estado_prefixo = self.service.calcular_impostos_com_estado(operacoes[:corte])
+            estado_prefixo = EstadoCalculo.de_dict(estado_prefixo.como_dict())
+            impostos_cauda, estado_final = self.service.calcular_impostos_com_estado(operacoes[corte:], estado_prefixo)
+
+            assert impostos_prefixo + impostos_cauda == impostos_completos
+            assert estado_final == estado_completo
+
+        assert impostos_completos == self.service.calcular_impostos(operacoes)
+        assert estado_completo.operacoes_processadas == 5
+        assert estado_completo.quantidade == 4000
+        assert estado_completo.prejuizo_acumulado == Decimal("13571.42857142857142857142858")
+
+    def test_calcular_impostos_com_varios_tickers(self):
+        """Testa se cada ticker tem a sua posição e se o prejuízo acumulado é compartilhado entre eles."""
+        operacoes = [
+            Operacao(TipoOperacao.BUY, Decimal("10.00"), 10000, ticker="PETR4"),
+            Operacao(TipoOperacao.BUY, Decimal("50.00"), 1000, ticker="VALE3"),
+            Operacao(TipoOperacao.SELL, Decimal("5.00"), 5000, ticker="PETR4"),
+            Operacao(TipoOperacao.SELL, Decimal("80.00"), 1000, ticker="VALE3"),
+            Operacao(TipoOperacao.SELL, Decimal("20.00"), 5000, ticker="PETR4"),
+            Operacao(TipoOperacao.SELL, Decimal("20.00"), 1, ticker="ITUB4"),
+        ]
+
+        impostos = self.service.calcular_impostos(operacoes)
+
+        # O prejuízo de R$ 25.000,00 em PETR4 compensa parte do lucro de R$ 30.000,00 em VALE3.
+        assert impostos == [
+            Decimal("0"),
+            Decimal("0"),
+            Decimal("0"),
+            Decimal("1000.00"),
+            Decimal("10000.00"),
+            "Can't sell more stocks than you have",
+        ]
+
+    def test_calcular_impostos_com_estado_guarda_as_posicoes_dos_tickers(self):
+        """Testa se o estado guarda as posições abertas de cada ticker e retoma a carteira a partir delas."""
+        operacoes = [
+            Operacao(TipoOperacao.BUY, Decimal("10.00"), 100),
+            Operacao(TipoOperacao.BUY, Decimal("10.00"), 10000, ticker="PETR4"),
+            Operacao(TipoOperacao.BUY, Decimal("50.00"), 1000, ticker="VALE3"),
+            Operacao(TipoOperacao.SELL, Decimal("60.00"), 1000, ticker="VALE3"),
+            Operacao(TipoOperacao.SELL, Decimal("30.00"), 5000, ticker="PETR4"),
+        ]
+
+        impostos_prefixo, estado = self.service.calcular_impostos_com_estado(operacoes[:3])
+        estado = EstadoCalculo.de_dict(estado.como_dict())
+        impostos_cauda, estado_final = self.service.calcular_impostos_com_estado(operacoes[3:], estado)
+
+        assert estado.quantidade == 100
+        assert estado.posicoes == (("PETR4", 10000, Decimal("10.00")), ("VALE3", 1000, Decimal("50.00")))
+        assert impostos_prefixo + impostos_cauda == self.service.calcular_impostos(operacoes)
+        assert estado_final.posicoes == (("PETR4", 5000, Decimal("10.00")),)
+
+    def test_calcular_cenarios_parte_do_estado_do_prefixo(self):
+        """Testa se cada cenário produz os impostos da sua cauda como se a carteira inteira fosse recalculada."""
+        prefixo = [
+            Operacao(TipoOperacao.BUY, Decimal("10.00"), 10000),
+            Operacao(TipoOperacao.SELL, Decimal("5.00"), 5000),
+            Operacao(TipoOperacao.BUY, Decimal("50.00"), 1000, ticker="VALE3"),
+        ]
+        caudas = [
+            [Operacao(TipoOperacao.SELL, Decimal("20.00"), 5000)],
+            [Operacao(TipoOperacao.SELL, Decimal("80.00"), 1000, ticker="VALE3")],
+            [Operacao(TipoOperacao.SELL, Decimal("20.00"), 5001)],
+            [],
+        ]
+
+        cenarios = self.service.calcular_cenarios(prefixo, caudas)
+
+        # O prejuízo de R$ 25.000,00 do prefixo compensa parte do lucro de cada cenário.
+        assert cenarios == [
+            [Decimal("5000.00")],
+            [Decimal("1000.00")],
+            ["Can't sell more stocks than you have"],
+            [],
+        ]
+        for cauda, impostos in zip(caudas, cenarios):
+            assert impostos == self.service.calcular_impostos(prefixo + cauda)[len(prefixo) :]
+
+    def test_calcular_cenarios_sem_caudas(self):
+        """Testa se calcular cenários sem caudas retorna uma matriz vazia."""
+        assert self.service.calcular_cenarios([Operacao(TipoOperacao.BUY, Decimal("10.00"), 100)], []) == []
+
+    @pytest.mark.parametrize(
+        "metodo_custo, esperado",
+        [
+            (MetodoCusto.MEDIO, [Decimal("0"), Decimal("0"), Decimal("5000.00"), Decimal("10000.00")]),
+            (MetodoCusto.FIFO, [Decimal("0"), Decimal("0"), Decimal("15000.00"), Decimal("10000.00")]),
+            (MetodoCusto.LIFO, [Decimal("0"), Decimal("0"), Decimal("0"), Decimal("5000.00")]),
+        ],
+    )
+    def test_calcular_impostos_com_metodo_de_custo(self, metodo_custo, esperado):
+        """Testa o custo das vendas pelo preço médio e pelos lotes consumidos em ordem FIFO e LIFO."""
+        operacoes = [
+            Operacao(TipoOperacao.BUY, Decimal("10.00"), 10000),
+            Operacao(TipoOperacao.BUY, Decimal("30.00"), 10000),
+            Operacao(TipoOperacao.SELL, Decimal("25.00"), 5000),
+            Operacao(TipoOperacao.SELL, Decimal("25.00"), 10000),
+            Operacao(TipoOperacao.SELL, Decimal("25.00"), 6000),
+        ]
+
+        impostos = CalcularImpostoService(metodo_custo).calcular_impostos(operacoes)
+
+        # FIFO: a primeira venda custa R$ 10,00 por ação; LIFO: custa R$ 30,00 e gera R$ 25.000,00 de prejuízo.
+        assert impostos == esperado + ["Can't sell more stocks than you have"]
+
+    def test_metodo_de_custo_por_ticker(self):
+        """Testa se os lotes de cada ticker são consumidos separadamente."""
+        operacoes = [
+            Operacao(TipoOperacao.BUY, Decimal("10.00"), 5000, ticker="PETR4"),
+            Operacao(TipoOperacao.BUY, Decimal("50.00"), 5000, ticker="VALE3"),
+            Operacao(TipoOperacao.BUY, Decimal("20.00"), 5000, ticker="PETR4"),
+            Operacao(TipoOperacao.SELL, Decimal("30.00"), 5000, ticker="PETR4"),
+        ]
+
+        assert CalcularImpostoService(MetodoCusto.FIFO).calcular_impostos(operacoes)[-1] == Decimal("20000.00")
+        assert CalcularImpostoService(MetodoCusto.LIFO).calcular_impostos(operacoes)[-1] == Decimal("10000.00")
+
+    def test_metodo_de_custo_por_lotes_sem_estado(self):
+        """Testa se o custo por lotes, que o EstadoCalculo não guarda, não pode ser retomado de um estado."""
+        service = CalcularImpostoService(MetodoCusto.FIFO)
+
+        assert service.metodo_custo is MetodoCusto.FIFO
+        with pytest.raises(ValueError, match="não guarda os lotes"):
+            service.calcular_impostos_com_estado([Operacao(TipoOperacao.BUY, Decimal("10.00"), 100)])
+
+    def test_calcular_impostos_com_regra(self):
+        """Testa se a alíquota e o limite de isenção da regra informada substituem as constantes da classe."""
+        regra = RegraImposto(date(2025, 1, 1), Decimal("0.15"), Decimal("50000.00"))
+        operacoes = [
+            Operacao(TipoOperacao.BUY, Decimal("10.00"), 10000),
+            Operacao(TipoOperacao.SELL, Decimal("15.00"), 3000),
+            Operacao(TipoOperacao.SELL, Decimal("20.00"), 5000),
+        ]
+
+        impostos = CalcularImpostoService(regra=regra).calcular_impostos(operacoes)
+
+        # A venda de R$ 45.000,00 fica abaixo do novo limite; a de R$ 100.000,00 paga 15% de R$ 50.000,00.
+        assert impostos == [Decimal("0"), Decimal("0"), Decimal("7500.00")]
+        assert self.service.calcular_impostos(operacoes) == [Decimal("0"), Decimal("3000.00"), Decimal("10000.00")]
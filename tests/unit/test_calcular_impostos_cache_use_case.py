@@ -0,0 +1,109 @@
+import io
+from unittest.mock import patch
+
+import pytest
+from src.adapters.cache.cache_lru import CacheLru
+from src.adapters.cache.persistencia_sqlite import PersistenciaSqlite
+from src.application.container import Container
+from src.application.use_cases.calcular_impostos_cache_use_case import CalcularImpostosCacheUseCase, chave_entrada
+from src.application.use_cases.calcular_impostos_use_case import CalcularImpostosUseCase
+
+ENTRADA = (
+    '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]'
+)
+SAIDA = '[{"tax": 0.0},{"tax": 10000.0}]'
+
+
+def criar_use_case(streaming: bool = False, limite_bytes: int = 1 << 20) -> CalcularImpostosCacheUseCase:
+    """Cria o caso de uso com cache a partir das dependências do Container."""
+    _, _, _, use_case = Container.get_dependencies(streaming=streaming)
+    return CalcularImpostosCacheUseCase(use_case, CacheLru(limite_bytes))
+
+
+class TestCalcularImpostosCacheUseCase:
+    def test_container_envolve_o_caso_de_uso(self, tmp_path):
+        """Testa se o Container só envolve o caso de uso com o cache quando ele é pedido."""
+        _, _, _, sem_cache = Container.get_dependencies()
+        _, _, _, com_cache = Container.get_dependencies(limite_cache_bytes=1024)
+        _, _, _, persistido = Container.get_dependencies(arquivo_cache=str(tmp_path / "cache.db"))
+
+        assert isinstance(sem_cache, CalcularImpostosUseCase)
+        assert isinstance(com_cache, CalcularImpostosCacheUseCase)
+        assert isinstance(persistido, CalcularImpostosCacheUseCase)
+        persistido.cache.fechar()
+
+    def test_chave_ignora_espacos_nas_extremidades(self):
+        """Testa se a mesma carteira com quebra de linha ou espaços nas extremidades gera a mesma chave."""
+        assert chave_entrada(ENTRADA + "\n") == chave_entrada("  " + ENTRADA)
+        assert chave_entrada(ENTRADA) != chave_entrada(ENTRADA.replace("20.00", "21.00"))
+
+    def test_chave_igual_para_texto_e_bytes(self):
+        """Testa se a mesma carteira lida como texto ou como bytes gera a mesma chave."""
+        assert chave_entrada((ENTRADA + "\n").encode()) == chave_entrada(ENTRADA)
+
+    def test_chave_depende_da_configuracao(self):
+        """Testa se a mesma carteira calculada com outra configuração gera outra chave."""
+        assert chave_entrada(ENTRADA, "decimal|medio") == chave_entrada(ENTRADA + "\n", "decimal|medio")
+        assert chave_entrada(ENTRADA, "decimal|medio") != chave_entrada(ENTRADA, "local|medio")
+
+    def test_execute_reaproveita_a_saida(self):
+        """Testa se uma linha repetida é respondida pelo cache, sem executar o caso de uso novamente."""
+        use_case = criar_use_case()
+
+        assert use_case.execute(ENTRADA) == SAIDA
+        with patch.object(CalcularImpostosUseCase, "execute") as execute:
+            assert use_case.execute(ENTRADA + "\n") == SAIDA
+
+        execute.assert_not_called()
+        assert use_case.cache.contadores()["acertos"] == 1
+
+    def test_linha_com_erro_nao_e_guardada(self):
+        """Testa se um erro é propagado e a linha não é guardada no cache."""
+        use_case = criar_use_case()
+
+        with pytest.raises(Exception):
+            use_case.execute("{invalid json")
+
+        assert use_case.cache.contadores()["entradas"] == 0
+
+    def test_execute_to_file_guarda_e_reaproveita(self):
+        """Testa se a saída incremental é guardada e depois escrita a partir do cache."""
+        use_case = criar_use_case(streaming=True)
+        primeira, segunda = io.StringIO(), io.StringIO()
+
+        use_case.execute_to_file(ENTRADA, primeira)
+        use_case.execute_to_file(ENTRADA, segunda)
+
+        assert primeira.getvalue() == segunda.getvalue() == SAIDA
+        assert use_case.cache.contadores()["acertos"] == 1
+
+    def test_iter_execute_guarda_e_reaproveita(self):
+        """Testa se os fragmentos de iter_execute são guardados e depois produzidos a partir do cache."""
+        use_case = criar_use_case(streaming=True)
+
+        assert "".join(use_case.iter_execute(ENTRADA)) == SAIDA
+        assert list(use_case.iter_execute(ENTRADA)) == [SAIDA]
+
+    def test_saida_incremental_maior_que_o_limite_nao_e_guardada(self):
+        """Testa se a cópia da saída incremental é descartada quando passa do limite do cache."""
+        use_case = criar_use_case(streaming=True, limite_bytes=10)
+
+        use_case.execute_to_file(ENTRADA, io.StringIO())
+        assert "".join(use_case.iter_execute(ENTRADA)) == SAIDA
+
+        assert use_case.cache.contadores()["entradas"] == 0
+        assert use_case.cache.contadores()["falhas"] == 2
+
+    def test_saida_incremental_persistida_sem_limite_de_memoria(self, tmp_path):
+        """Testa se, com o cache apenas no disco (limite de memória zero), a saída incremental é persistida."""
+        _, _, _, base = Container.get_dependencies(streaming=True)
+        arquivo_cache = str(tmp_path / "cache.db")
+        for metodo in ("execute_to_file", "iter_execute"):
+            use_case = CalcularImpostosCacheUseCase(base, CacheLru(0, PersistenciaSqlite(arquivo_cache)))
+            if metodo == "execute_to_file":
+                use_case.execute_to_file(ENTRADA, io.StringIO())
+            else:
+                assert list(use_case.iter_execute(ENTRADA)) == [SAIDA]
+            use_case.cache.fechar()
+
+        assert use_case.cache.contadores()["acertos_disco"] == 1
@@ -0,0 +1,49 @@
+import pytest
+from src.application.container import Container
+from src.domain.exceptions.parse_error import ParseError
+
+COMPRA = '{"ticker":"PETR4", "operation":"buy", "unit-cost":10.00, "quantity": 10000}'
+VENDA_LUCRO = '{"ticker":"PETR4", "operation":"sell", "unit-cost":20.00, "quantity": 5000}'
+VENDA_PREJUIZO = '{"ticker":"PETR4", "operation":"sell", "unit-cost":5.00, "quantity": 5000}'
+
+
+def registro(conta: str, *operacoes: str) -> str:
+    """Monta um registro de conta com as operações informadas."""
+    return '{"account": "' + conta + '", "operations": [' + ",".join(operacoes) + "]}"
+
+
+class TestCalcularImpostosContasUseCase:
+    @pytest.mark.parametrize("motor", sorted(Container.MOTORES))
+    def test_registros_intercalados_continuam_o_estado_da_conta(self, motor):
+        """Testa se os registros de uma conta são calculados como uma única carteira, mesmo intercalados."""
+        _, _, _, use_case = Container.get_dependencies(contas=True, motor=motor)
+        _, _, _, referencia = Container.get_dependencies(motor=motor)
+
+        use_case.execute(registro("A", COMPRA))
+        use_case.execute(registro("B", COMPRA, VENDA_PREJUIZO))
+        use_case.execute(registro("A", VENDA_LUCRO))
+        use_case.execute(registro("B", VENDA_LUCRO))
+        use_case.execute(registro("C"))
+
+        assert use_case.concluir() == {
+            "A": '{"account": "A", "taxes": ' + referencia.execute(f"[{COMPRA},{VENDA_LUCRO}]") + "}",
+            "B": '{"account": "B", "taxes": ' + referencia.execute(f"[{COMPRA},{VENDA_PREJUIZO},{VENDA_LUCRO}]") + "}",
+            "C": '{"account": "C", "taxes": []}',
+        }
+
+    def test_concluir_descarta_os_estados(self):
+        """Testa se, depois de concluir, as contas recomeçam de uma carteira vazia."""
+        _, _, _, use_case = Container.get_dependencies(contas=True)
+        use_case.execute(registro("A", COMPRA))
+        use_case.concluir()
+
+        use_case.execute(registro("A", VENDA_LUCRO))
+
+        assert use_case.concluir() == {"A": '{"account": "A", "taxes": [{"error": "Can\'t sell more stocks than you have"}]}'}
+
+    def test_registro_invalido(self):
+        """Testa se um registro inválido gera ParseError."""
+        _, _, _, use_case = Container.get_dependencies(contas=True)
+
+        with pytest.raises(ParseError):
+            use_case.execute("[" + COMPRA + "]")
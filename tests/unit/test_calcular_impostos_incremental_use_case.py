@@ -0,0 +1,106 @@
+import json
+import random
+
+import pytest
+from src.application.container import Container
+from src.application.use_cases.estatisticas_processamento import EstatisticasProcessamento
+from src.application.use_cases.calcular_impostos_incremental_use_case import CalcularImpostosIncrementalUseCase
+from src.domain.exceptions.parse_error import ParseError
+
+COMPRA = '{"operation":"buy", "unit-cost":10.00, "quantity": 10000}'
+VENDA_LUCRO = '{"operation":"sell", "unit-cost":20.00, "quantity": 5000}'
+VENDA_PREJUIZO = '{"operation":"sell", "unit-cost":5.00, "quantity": 5000}'
+
+
+def linha(*operacoes: str) -> str:
+    """Monta uma linha de entrada com as operações informadas."""
+    return "[" + ",".join(operacoes) + "]"
+
+
+def criar_use_case(limite_prefixos: int = 4, motor: str = "decimal") -> CalcularImpostosIncrementalUseCase:
+    """Cria o caso de uso incremental a partir das dependências do Container."""
+    _, _, _, use_case = Container.get_dependencies(motor=motor, limite_prefixos=limite_prefixos)
+    return use_case
+
+
+def referencia(entrada: str) -> str:
+    """Calcula a saída da linha inteira com o caso de uso padrão."""
+    _, _, _, use_case = Container.get_dependencies()
+    return use_case.execute(entrada)
+
+
+class TestCalcularImpostosIncrementalUseCase:
+    def test_container_escolhe_o_caso_de_uso(self):
+        """Testa se o Container só usa o caso de uso incremental quando o limite de prefixos é informado."""
+        assert isinstance(criar_use_case(), CalcularImpostosIncrementalUseCase)
+        _, _, _, use_case = Container.get_dependencies()
+        assert not isinstance(use_case, CalcularImpostosIncrementalUseCase)
+
+    def test_container_rejeita_estatisticas_com_prefixos(self):
+        """Testa se o Container rejeita a combinação de estatísticas e prefixos memorizados."""
+        with pytest.raises(ValueError):
+            Container.get_dependencies(estatisticas=EstatisticasProcessamento(), limite_prefixos=4)
+
+    @pytest.mark.parametrize("motor", ["decimal", "local"])
+    def test_retoma_do_prefixo(self, motor):
+        """Testa se uma carteira reenviada com novas operações reaproveita o prefixo e produz a mesma saída."""
+        use_case = criar_use_case(motor=motor)
+        prefixo = linha(COMPRA, VENDA_PREJUIZO)
+        completa = linha(COMPRA, VENDA_PREJUIZO, COMPRA, VENDA_LUCRO)
+
+        assert use_case.execute(prefixo) == referencia(prefixo)
+        assert use_case.execute(completa) == referencia(completa)
+        assert use_case.prefixos_reaproveitados == 1
+
+    def test_linha_repetida(self):
+        """Testa se uma linha idêntica a uma já processada é respondida com a saída guardada."""
+        use_case = criar_use_case()
+        entrada = linha(COMPRA, VENDA_LUCRO)
+
+        assert use_case.execute(entrada) == use_case.execute(entrada + "\n") == '[{"tax": 0.0},{"tax": 10000.0}]'
+        assert use_case.prefixos_reaproveitados == 1
+
+    def test_linha_que_nao_estende_o_prefixo(self):
+        """Testa se uma linha que diverge de todos os prefixos guardados é calculada inteira."""
+        use_case = criar_use_case()
+        use_case.execute(linha(COMPRA, VENDA_LUCRO))
+        entrada = linha(COMPRA, VENDA_PREJUIZO, VENDA_LUCRO)
+
+        assert use_case.execute(entrada) == referencia(entrada)
+        assert use_case.prefixos_reaproveitados == 0
+
+    def test_remove_prefixo_menos_recente(self):
+        """Testa se apenas os limite_prefixos estados usados mais recentemente são mantidos."""
+        use_case = criar_use_case(limite_prefixos=1)
+        primeira = linha(COMPRA)
+        use_case.execute(primeira)
+        use_case.execute(linha(VENDA_PREJUIZO))
+
+        use_case.execute(linha(COMPRA, VENDA_LUCRO))
+
+        assert use_case.prefixos_reaproveitados == 0
+
+    def test_erro_na_cauda(self):
+        """Testa se um erro de leitura nas operações acrescentadas é propagado."""
+        use_case = criar_use_case()
+        use_case.execute(linha(COMPRA))
+
+        with pytest.raises(ParseError):
+            use_case.execute(linha(COMPRA, '{"operation":"hold", "unit-cost":1.00, "quantity": 1}'))
+
+    def test_prefixos_crescentes_aleatorios(self):
+        """Testa se prefixos crescentes de uma carteira aleatória produzem a mesma saída do cálculo completo."""
+        gerador = random.Random(12)
+        operacoes = []
+        use_case = criar_use_case(limite_prefixos=2)
+        for _ in range(20):
+            for _ in range(gerador.randint(0, 5)):
+                tipo = "buy" if gerador.random() < 0.5 else "sell"
+                operacoes.append(
+                    json.dumps({"operation": tipo, "unit-cost": gerador.randint(100, 3000) / 100, "quantity": 10})
+                )
+            if not operacoes:
+                continue
+            entrada = linha(*operacoes)
+            assert use_case.execute(entrada) == referencia(entrada)
+        assert use_case.prefixos_reaproveitados > 0
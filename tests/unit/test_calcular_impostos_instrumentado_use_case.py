@@ -0,0 +1,53 @@
+import io
+
+import pytest
+from src.application.container import Container
+from src.application.use_cases.calcular_impostos_instrumentado_use_case import CalcularImpostosInstrumentadoUseCase
+from src.application.use_cases.calcular_impostos_use_case import CalcularImpostosUseCase
+from src.application.use_cases.estatisticas_processamento import EstatisticasProcessamento
+
+ENTRADA = (
+    '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000},'
+    '{"operation":"sell", "unit-cost":5.00, "quantity": 5000}]'
+)
+SAIDA = '[{"tax": 0.0},{"tax": 10000.0},{"tax": 0.0}]'
+
+
+class TestCalcularImpostosInstrumentadoUseCase:
+    def test_container_sem_estatisticas_usa_caso_de_uso_simples(self):
+        """Testa se a instrumentação só é montada quando as estatísticas são pedidas."""
+        _, _, _, use_case = Container.get_dependencies()
+
+        assert type(use_case) is CalcularImpostosUseCase
+
+    @pytest.mark.parametrize("opcoes", [{}, {"streaming": True}, {"compacto": True}, {"motor": "local"}])
+    def test_execute_registra_medicoes(self, opcoes):
+        """Testa se execute produz a mesma saída e registra as medições da linha."""
+        estatisticas = EstatisticasProcessamento()
+        _, _, _, use_case = Container.get_dependencies(**opcoes, estatisticas=estatisticas)
+
+        assert isinstance(use_case, CalcularImpostosInstrumentadoUseCase)
+        assert use_case.execute(ENTRADA) == SAIDA
+
+        [linha] = estatisticas.linhas
+        assert (linha.compras, linha.vendas) == (1, 2)
+        assert linha.bytes_entrada == len(ENTRADA)
+        assert linha.bytes_saida == len(SAIDA)
+        assert min(linha.segundos_leitura, linha.segundos_calculo, linha.segundos_formatacao) >= 0
+
+    @pytest.mark.parametrize("opcoes", [{}, {"streaming": True}, {"compacto": True}])
+    def test_execute_to_file_registra_medicoes(self, opcoes):
+        """Testa se execute_to_file escreve a mesma saída e registra as medições das etapas intercaladas."""
+        estatisticas = EstatisticasProcessamento()
+        _, _, _, use_case = Container.get_dependencies(**opcoes, estatisticas=estatisticas)
+        arquivo = io.StringIO()
+
+        use_case.execute_to_file(ENTRADA, arquivo)
+
+        assert arquivo.getvalue() == SAIDA
+        [linha] = estatisticas.linhas
+        assert (linha.compras, linha.vendas) == (1, 2)
+        assert linha.bytes_saida == len(SAIDA)
+        assert linha.segundos_leitura > 0
+        assert linha.segundos_calculo > 0
+        assert linha.segundos_formatacao > 0
@@ -0,0 +1,41 @@
+import json
+
+from src.application.container import Container
+from src.application.use_cases.calcular_impostos_tolerante_use_case import CalcularImpostosToleranteUseCase
+from src.application.use_cases.calcular_impostos_use_case import CalcularImpostosUseCase
+
+ENTRADA = (
+    '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]'
+)
+SAIDA = '[{"tax": 0.0},{"tax": 10000.0}]'
+
+
+class TestCalcularImpostosToleranteUseCase:
+    def test_container_envolve_o_caso_de_uso(self):
+        """Testa se o Container só envolve o caso de uso quando a tolerância é pedida, por fora do cache."""
+        _, _, _, padrao = Container.get_dependencies()
+        _, _, _, tolerante = Container.get_dependencies(tolerante=True, limite_cache_bytes=1024)
+
+        assert isinstance(padrao, CalcularImpostosUseCase)
+        assert isinstance(tolerante, CalcularImpostosToleranteUseCase)
+        assert tolerante.cache.limite_bytes == 1024
+
+    def test_linha_valida(self):
+        """Testa se uma linha válida recebe a saída do caso de uso envolvido."""
+        _, _, _, use_case = Container.get_dependencies(tolerante=True)
+
+        assert use_case.execute(ENTRADA) == SAIDA
+
+    def test_linhas_com_erro_recebem_registro_de_erro(self):
+        """Testa se erros de leitura e de cálculo viram registros de erro, sem interromper as linhas seguintes."""
+        _, _, _, use_case = Container.get_dependencies(tolerante=True, motor="local")
+
+        saidas = [
+            use_case.execute("{invalid json"),
+            use_case.execute('[{"operation":"buy", "unit-cost":10.00, "quantity": 0}]'),
+            use_case.execute(ENTRADA),
+        ]
+
+        assert json.loads(saidas[0])["error"].startswith("Erro ao processar entrada: Erro ao processar JSON")
+        assert json.loads(saidas[1]) == {"error": "Erro ao processar entrada: Quantidade deve ser maior que zero"}
+        assert saidas[2] == SAIDA
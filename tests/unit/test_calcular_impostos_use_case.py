@@ -0,0 +1,53 @@
+from decimal import Decimal
+
+import pytest
+from src.application.container import Container
+from src.domain.ports.input.operacoes_input_port import OperacoesInputPort
+from src.domain.ports.output.impostos_output_port import ImpostosOutputPort
+from src.domain.ports.services.calcular_imposto_service_port import CalcularImpostoServicePort
+
+ENTRADA = (
+    '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000},'
+    '{"operation":"sell", "unit-cost":5.00, "quantity": 5000}]'
+)
+
+
+class TestCalcularImpostosUseCase:
+    def test_iter_execute_igual_a_execute(self):
+        """Testa se os fragmentos produzidos por iter_execute formam a mesma saída de execute."""
+        _, _, _, use_case = Container.get_dependencies(streaming=True)
+
+        assert "".join(use_case.iter_execute(ENTRADA)) == use_case.execute(ENTRADA)
+        assert use_case.execute(ENTRADA) == '[{"tax": 0.0},{"tax": 10000.0},{"tax": 0.0}]'
+
+    def test_portas_delegam_por_padrao_para_os_metodos_em_lote(self):
+        """Testa as implementações padrão dos métodos incrementais das portas."""
+
+        class Servico(CalcularImpostoServicePort):
+            def calcular_impostos(self, operacoes):
+                return [Decimal("0") for _ in operacoes]
+
+            def calcular_impostos_com_estado(self, operacoes, estado=None):
+                return self.calcular_impostos(operacoes), estado
+
+        class Formatador(ImpostosOutputPort):
+            def formatar_impostos(self, impostos):
+                return str(len(impostos))
+
+        class Leitor(OperacoesInputPort):
+            def parse_operations(self, data):
+                return [data]
+
+        assert Leitor().iter_operations("x") == ["x"]
+        assert list(Servico().iter_impostos([1, 2])) == [Decimal("0"), Decimal("0")]
+        assert list(Formatador().iter_formatar_impostos(iter([Decimal("1")]))) == ["1"]
+
+    def test_servico_sem_calculo_com_estado_nao_pode_ser_criado(self):
+        """Testa se um motor que não implementa calcular_impostos_com_estado é recusado na criação."""
+
+        class Servico(CalcularImpostoServicePort):
+            def calcular_impostos(self, operacoes):
+                return [Decimal("0") for _ in operacoes]
+
+        with pytest.raises(TypeError, match="calcular_impostos_com_estado"):
+            Servico()
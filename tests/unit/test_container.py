@@ -0,0 +1,106 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from src.adapters.input.binario_parser import BinarioParser
+from src.adapters.input.json_parser import JsonLoteParser, JsonParser
+from src.adapters.input.json_stream_parser import JsonStreamParser
+from src.adapters.output.binario_formatter import BinarioFormatter
+from src.application.container import Container
+from src.application.use_cases.calcular_impostos_contas_use_case import CalcularImpostosContasUseCase
+from src.domain.models.investimento_lotes import MetodoCusto
+from src.domain.models.operacao import Operacao, TipoOperacao
+from src.domain.models.regra_imposto import RegraImposto
+from src.domain.services.calcular_imposto_local_service import CalcularImpostoLocalService
+from src.domain.services.calcular_imposto_service import CalcularImpostoService
+
+
+class TestContainer:
+    def test_dependencias_padrao(self):
+        """Testa as dependências montadas por padrão."""
+        input_port, service, _, _ = Container.get_dependencies()
+
+        assert isinstance(input_port, JsonParser)
+        assert isinstance(service, CalcularImpostoService)
+
+    def test_dependencias_streaming(self):
+        """Testa a seleção do adaptador de entrada incremental."""
+        assert isinstance(Container.get_input_port(streaming=True), JsonStreamParser)
+
+    def test_dependencias_compactas(self):
+        """Testa a seleção do adaptador de entrada que lê as operações num lote compacto."""
+        input_port, _, _, _ = Container.get_dependencies(compacto=True)
+
+        assert isinstance(input_port, JsonLoteParser)
+
+    def test_dependencias_binarias(self):
+        """Testa a seleção dos adaptadores do formato binário."""
+        input_port, _, output_port, _ = Container.get_dependencies(formato="binario")
+
+        assert isinstance(input_port, BinarioParser)
+        assert isinstance(output_port, BinarioFormatter)
+
+    def test_dependencias_por_conta(self):
+        """Testa a seleção do caso de uso por conta e a rejeição das opções que ele não aceita."""
+        _, _, _, use_case = Container.get_dependencies(contas=True, motor="local")
+
+        assert isinstance(use_case, CalcularImpostosContasUseCase)
+        with pytest.raises(ValueError, match="formato JSON"):
+            Container.get_dependencies(contas=True, compacto=True)
+        with pytest.raises(ValueError, match="cache"):
+            Container.get_dependencies(contas=True, limite_prefixos=10)
+
+    def test_formato_invalido(self):
+        """Testa a seleção de um formato inexistente e do formato binário com leitura incremental."""
+        with pytest.raises(ValueError, match="Formato desconhecido"):
+            Container.get_dependencies(formato="xml")
+        with pytest.raises(ValueError, match="incremental"):
+            Container.get_input_port(streaming=True, formato="binario")
+
+    def test_selecao_de_motor(self):
+        """Testa a seleção do motor de cálculo pelo nome."""
+        assert isinstance(Container.get_service("decimal"), CalcularImpostoService)
+        assert isinstance(Container.get_service("local"), CalcularImpostoLocalService)
+
+    def test_motor_desconhecido(self):
+        """Testa a seleção de um motor de cálculo inexistente."""
+        with pytest.raises(ValueError, match="Motor de cálculo desconhecido"):
+            Container.get_service("inexistente")
+
+    def test_selecao_do_metodo_de_custo(self):
+        """Testa a seleção do custo por lotes, aceito apenas pelo motor decimal e sem estado salvo."""
+        service = Container.get_service("decimal", "fifo")
+
+        assert isinstance(service, CalcularImpostoService)
+        assert service.metodo_custo is MetodoCusto.FIFO
+        assert Container.get_service("local", "medio").__class__ is CalcularImpostoLocalService
+        with pytest.raises(ValueError, match="requer o motor decimal"):
+            Container.get_service("local", "lifo")
+        with pytest.raises(ValueError, match="Método de custo desconhecido"):
+            Container.get_service("decimal", "peps")
+        with pytest.raises(ValueError, match="custo por lotes"):
+            Container.get_dependencies(metodo_custo="fifo", limite_prefixos=10)
+
+    @pytest.mark.parametrize("motor, metodo_custo", [("decimal", "medio"), ("decimal", "fifo"), ("local", "medio")])
+    def test_selecao_da_regra_do_imposto(self, motor, metodo_custo):
+        """Testa se a regra informada é repassada ao serviço do motor escolhido."""
+        regra = RegraImposto(date(2025, 1, 1), Decimal("0.10"), Decimal("0"))
+        operacoes = [Operacao(TipoOperacao.BUY, Decimal("10"), 10), Operacao(TipoOperacao.SELL, Decimal("20"), 10)]
+
+        service = Container.get_service(motor, metodo_custo, regra)
+
+        assert service.calcular_impostos(operacoes) == [Decimal("0"), Decimal("10.00")]
+        with pytest.raises(ValueError, match="cache em arquivo"):
+            Container.get_dependencies(regra=regra, arquivo_cache="cache.db")
+
+    def test_carregar_tabela_de_regras(self, tmp_path):
+        """Testa a leitura da tabela de regras do imposto de um arquivo JSON, com valores decimais exatos."""
+        arquivo = tmp_path / "regras.json"
+        arquivo.write_text('{"regras": [{"vigencia": "2025-01-01", "aliquota": 0.15, "limite_isencao": 35000.10}]}')
+
+        tabela = Container.get_tabela_regras(str(arquivo))
+
+        assert tabela.regras == (RegraImposto(date(2025, 1, 1), Decimal("0.15"), Decimal("35000.10")),)
+        arquivo.write_text("{regras")
+        with pytest.raises(ValueError, match="Tabela de regras do imposto inválida"):
+            Container.get_tabela_regras(str(arquivo))
@@ -0,0 +1,55 @@
+import pytest
+from src.application.cli import entrada_mapeada
+from src.application.cli.entrada_mapeada import EntradaMapeada
+from src.application.cli.ponto_controle import EntradaRetomavel
+
+LINHAS = [b'[{"operation":"buy", "unit-cost":10.00, "quantity": 100}]\n', b"[]\n", b'{"ultima": "sem quebra"}']
+
+
+@pytest.fixture
+def arquivo(tmp_path):
+    caminho = tmp_path / "entrada.txt"
+    caminho.write_bytes(b"".join(LINHAS))
+    return str(caminho)
+
+
+class TestEntradaMapeada:
+    def test_linhas_em_bytes_com_a_quebra_de_linha(self, arquivo):
+        """Testa se as linhas são entregues em bytes, incluindo a quebra de linha e a última linha sem quebra."""
+        linhas = list(EntradaMapeada(arquivo))
+
+        assert linhas == LINHAS
+        assert all(type(linha) is bytes for linha in linhas)
+
+    def test_linhas_a_partir_de_uma_posicao(self, arquivo):
+        """Testa a leitura a partir de uma posição em bytes, no início de uma linha."""
+        assert list(EntradaMapeada(arquivo).linhas(len(LINHAS[0]))) == LINHAS[1:]
+
+    def test_linhas_a_partir_do_fim(self, arquivo):
+        """Testa se a leitura a partir do fim do arquivo não produz linhas e se uma posição além dele é rejeitada."""
+        tamanho = len(b"".join(LINHAS))
+
+        assert list(EntradaMapeada(arquivo).linhas(tamanho)) == []
+        with pytest.raises(ValueError, match="ponto de controle"):
+            list(EntradaMapeada(arquivo).linhas(tamanho + 1))
+
+    def test_arquivo_vazio(self, tmp_path):
+        """Testa se um arquivo vazio, que não pode ser mapeado, não produz linhas."""
+        caminho = tmp_path / "vazio.txt"
+        caminho.write_bytes(b"")
+
+        assert list(EntradaMapeada(str(caminho))) == []
+
+    def test_descarte_das_paginas_lidas(self, arquivo, monkeypatch):
+        """Testa se as linhas continuam corretas quando as páginas lidas são devolvidas a cada poucos bytes."""
+        monkeypatch.setattr(entrada_mapeada, "TAMANHO_DESCARTE", 1)
+
+        assert list(EntradaMapeada(arquivo)) == LINHAS
+
+    def test_entrada_retomavel_com_arquivo_mapeado(self, arquivo):
+        """Testa se a EntradaRetomavel lê o arquivo mapeado a partir da posição inicial e conta os bytes lidos."""
+        entrada = EntradaRetomavel(EntradaMapeada(arquivo), len(LINHAS[0]))
+
+        assert list(entrada) == LINHAS[1:]
+        entrada.confirmar()
+        assert entrada.bytes_confirmados == len(LINHAS[0]) + len(LINHAS[1])
@@ -0,0 +1,38 @@
+from decimal import Decimal
+import json
+
+from src.domain.models.estado_calculo import EstadoCalculo
+
+
+class TestEstadoCalculo:
+    def test_estado_inicial(self):
+        """Testa se o estado padrão representa uma carteira vazia."""
+        estado = EstadoCalculo()
+
+        assert estado.quantidade == 0
+        assert estado.preco_medio == Decimal("0")
+        assert estado.prejuizo_acumulado == Decimal("0")
+        assert estado.operacoes_processadas == 0
+
+    def test_serializacao_exata(self):
+        """Testa se o estado sobrevive à serialização em JSON sem perder precisão."""
+        estado = EstadoCalculo(
+            quantidade=15,
+            preco_medio=Decimal("23.33333333333333333333333333"),
+            prejuizo_acumulado=Decimal("1234.56"),
+            operacoes_processadas=7,
+        )
+
+        restaurado = EstadoCalculo.de_dict(json.loads(json.dumps(estado.como_dict())))
+
+        assert restaurado == estado
+        assert str(restaurado.preco_medio) == "23.33333333333333333333333333"
+
+    def test_serializacao_com_posicoes_dos_tickers(self):
+        """Testa se as posições dos tickers sobrevivem à serialização e se estados sem elas continuam legíveis."""
+        estado = EstadoCalculo(posicoes=(("PETR4", 10, Decimal("12.345")), ("VALE3", 3, Decimal("50"))))
+        dados = json.loads(json.dumps(estado.como_dict()))
+
+        assert EstadoCalculo.de_dict(dados) == estado
+        del dados["posicoes"]
+        assert EstadoCalculo.de_dict(dados).posicoes == ()
@@ -0,0 +1,91 @@
+import json
+
+from src.application.use_cases.estatisticas_processamento import EstatisticasLinha, EstatisticasProcessamento
+
+
+def criar_linha(compras: int, vendas: int) -> EstatisticasLinha:
+    """Cria as medições de uma linha com tempos fixos."""
+    return EstatisticasLinha(
+        segundos_leitura=0.1,
+        segundos_calculo=0.2,
+        segundos_formatacao=0.1,
+        compras=compras,
+        vendas=vendas,
+        bytes_entrada=100,
+        bytes_saida=40,
+    )
+
+
+class TestEstatisticasProcessamento:
+    def test_totais(self):
+        """Testa a agregação das medições de todas as linhas."""
+        estatisticas = EstatisticasProcessamento()
+        estatisticas.registrar(criar_linha(compras=2, vendas=1))
+        estatisticas.registrar(criar_linha(compras=2, vendas=4))
+
+        totais = estatisticas.totais()
+
+        assert totais["linhas"] == 2
+        assert totais["operacoes"] == 9
+        assert totais["razao_vendas_compras"] == 1.25
+        assert totais["bytes_entrada"] == 200
+        assert totais["bytes_saida"] == 80
+        assert totais["segundos_calculo"] == 0.4
+        assert totais["segundos_total"] == 0.8
+
+    def test_totais_sem_linhas(self):
+        """Testa os totais quando nenhuma linha foi processada."""
+        totais = EstatisticasProcessamento().totais()
+
+        assert totais["linhas"] == 0
+        assert totais["razao_vendas_compras"] is None
+        assert "total: 0.000000s" in EstatisticasProcessamento().resumo()
+
+    def test_combinar_e_esvaziar(self):
+        """Testa a transferência das linhas entre acumuladores, como ocorre entre workers e o processo principal."""
+        worker = EstatisticasProcessamento()
+        worker.registrar(criar_linha(compras=1, vendas=0))
+        principal = EstatisticasProcessamento()
+
+        principal.combinar(worker.esvaziar())
+
+        assert worker.linhas == []
+        assert worker.totais()["linhas"] == 0
+        assert principal.linhas == [criar_linha(compras=1, vendas=0)]
+        assert principal.totais()["compras"] == 1
+
+    def test_sem_guardar_linhas(self):
+        """Testa se apenas os totais são mantidos quando as medições de cada linha não são guardadas."""
+        worker = EstatisticasProcessamento(guardar_linhas=False)
+        worker.registrar(criar_linha(compras=2, vendas=1))
+        principal = EstatisticasProcessamento(guardar_linhas=False)
+        principal.registrar(criar_linha(compras=2, vendas=4))
+
+        principal.combinar(worker.esvaziar())
+
+        assert worker.totais()["linhas"] == 0
+        assert principal.linhas == []
+        assert principal.totais()["linhas"] == 2
+        assert principal.totais()["operacoes"] == 9
+        assert principal.totais()["segundos_total"] == 0.8
+
+    def test_como_dict_serializavel(self):
+        """Testa se as medições podem ser gravadas em JSON, com os totais e cada linha."""
+        estatisticas = EstatisticasProcessamento()
+        estatisticas.registrar(criar_linha(compras=1, vendas=1))
+
+        dados = json.loads(json.dumps(estatisticas.como_dict()))
+
+        assert dados["totais"]["operacoes"] == 2
+        assert dados["linhas"][0]["operacoes"] == 2
+        assert dados["linhas"][0]["bytes_entrada"] == 100
+
+    def test_resumo(self):
+        """Testa o resumo legível, com a participação de cada etapa no tempo total."""
+        estatisticas = EstatisticasProcessamento()
+        estatisticas.registrar(criar_linha(compras=1, vendas=1))
+
+        resumo = estatisticas.resumo()
+
+        assert "operações: 2 (compras: 1, vendas: 1, vendas/compras: 1.0)" in resumo
+        assert "calculo: 0.200000s (50.0%)" in resumo
@@ -0,0 +1,68 @@
+from decimal import Decimal
+
+from benchmarks.gerador_carteiras import PerfilCarteira, gerar_linha
+import pytest
+from src.adapters.input.json_parser import JsonParser
+from src.domain.models.estado_calculo import EstadoCalculo
+from src.domain.models.operacao import Operacao, TipoOperacao
+from src.domain.services.calcular_imposto_local_service import CalcularImpostoLocalService
+from src.domain.services.calcular_imposto_service import CalcularImpostoService
+from src.domain.services.indice_estados import IndiceEstados
+
+
+class TestIndiceEstados:
+    @pytest.mark.parametrize("servico", [CalcularImpostoService, CalcularImpostoLocalService])
+    @pytest.mark.parametrize("intervalo", [1, 7, 50, 1000])
+    def test_estado_em_igual_ao_recalculo_do_prefixo(self, servico, intervalo):
+        """Testa se o estado em cada ponto é o mesmo de recalcular as operações desde o início."""
+        service = servico()
+        operacoes = JsonParser.parse_operations(gerar_linha(PerfilCarteira(operacoes=120, semente=2029, tickers=3)))
+
+        indice = IndiceEstados(service, operacoes, intervalo)
+
+        assert len(indice) == len(operacoes)
+        assert indice.impostos == service.calcular_impostos(operacoes)
+        for operacoes_processadas in range(len(operacoes) + 1):
+            estado = indice.estado_em(operacoes_processadas)
+            assert estado == service.calcular_impostos_com_estado(operacoes[:operacoes_processadas])[1]
+            assert estado.operacoes_processadas == operacoes_processadas
+
+    def test_estado_em_pontos_da_carteira(self):
+        """Testa a quantidade, o preço médio e o prejuízo acumulado em pontos conhecidos da carteira."""
+        operacoes = [
+            Operacao(TipoOperacao.BUY, Decimal("10.00"), 10000),
+            Operacao(TipoOperacao.SELL, Decimal("5.00"), 5000),
+            Operacao(TipoOperacao.BUY, Decimal("20.00"), 5000),
+            Operacao(TipoOperacao.SELL, Decimal("30.00"), 5000),
+        ]
+
+        indice = IndiceEstados(CalcularImpostoService(), operacoes, intervalo=2)
+
+        assert indice.instantaneos == 3
+        assert indice.estado_em(0) == EstadoCalculo()
+        assert indice.estado_em(1)[:3] == (10000, Decimal("10.00"), Decimal("0"))
+        assert indice.estado_em(2)[:3] == (5000, Decimal("10.00"), Decimal("25000.00"))
+        assert indice.estado_em(3)[:3] == (10000, Decimal("15.00"), Decimal("25000.00"))
+        assert indice.estado_em(4)[:3] == (5000, Decimal("15.00"), Decimal("0"))
+        assert indice.impostos == [Decimal("0"), Decimal("0"), Decimal("0"), Decimal("10000.00")]
+
+    def test_carteira_vazia(self):
+        """Testa se o índice de uma carteira vazia guarda apenas o estado inicial."""
+        indice = IndiceEstados(CalcularImpostoLocalService(), [], intervalo=10)
+
+        assert indice.instantaneos == 1
+        assert indice.impostos == []
+        assert indice.estado_em(0) == EstadoCalculo()
+
+    @pytest.mark.parametrize("operacoes_processadas", [-1, 3])
+    def test_estado_fora_da_carteira(self, operacoes_processadas):
+        """Testa se consultar um ponto fora da carteira gera erro."""
+        indice = IndiceEstados(CalcularImpostoService(), [Operacao(TipoOperacao.BUY, Decimal("10"), 1)] * 2, 1)
+
+        with pytest.raises(IndexError, match="Operação fora da carteira"):
+            indice.estado_em(operacoes_processadas)
+
+    def test_intervalo_invalido(self):
+        """Testa se um intervalo não positivo entre instantâneos gera erro."""
+        with pytest.raises(ValueError, match="Intervalo entre instantâneos deve ser maior que zero"):
+            IndiceEstados(CalcularImpostoService(), [], intervalo=0)
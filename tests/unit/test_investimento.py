@@ -83,3 +83,20 @@ class TestInvestimento:
     #         ValueError, match="Não é possível remover 15 ações. O investimento possui apenas 10 ações."
     #     ):
     #         investimento.remover_acao(15)
+
+    def test_restaurar_investimento(self):
+        """Testa a criação de um investimento a partir de um estado salvo."""
+        investimento = Investimento.restaurar(10, Decimal("20.5"))
+        investimento.adicionar_acao(10, Decimal("30.5"))
+
+        assert investimento.quantidade == 20
+        assert investimento.preco_medio == Decimal("25.5")
+
+    def test_restaurar_investimento_vazio_zera_preco_medio(self):
+        """Testa se um estado sem ações é restaurado com preço médio zero."""
+        assert Investimento.restaurar(0, Decimal("10")).preco_medio == Decimal("0")
+
+    def test_restaurar_investimento_com_quantidade_negativa(self):
+        """Testa a restauração de um estado inválido."""
+        with pytest.raises(ValueError, match="Quantidade não pode ser negativa"):
+            Investimento.restaurar(-1, Decimal("10"))
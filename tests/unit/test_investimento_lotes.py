@@ -0,0 +1,112 @@
+from decimal import Decimal
+
+import pytest
+from src.domain.models.investimento_lotes import InvestimentoLotes, MetodoCusto
+
+
+class TestInvestimentoLotes:
+    def setup_method(self):
+        """Configuração inicial para cada teste."""
+        self.fifo = InvestimentoLotes(MetodoCusto.FIFO)
+        self.lifo = InvestimentoLotes(MetodoCusto.LIFO)
+        for investimento in (self.fifo, self.lifo):
+            investimento.adicionar_acao(10, Decimal("10"))
+            investimento.adicionar_acao(20, Decimal("20"))
+            investimento.adicionar_acao(30, Decimal("30"))
+
+    def test_inicializacao(self):
+        """Testa se o investimento é inicializado sem lotes, com zero ações e preço médio zero."""
+        investimento = InvestimentoLotes(MetodoCusto.FIFO)
+
+        assert investimento.quantidade == 0
+        assert investimento.preco_medio == Decimal("0")
+        assert investimento.valor_total == Decimal("0")
+        assert investimento.lotes == ()
+
+    def test_metodo_sem_lotes(self):
+        """Testa se o preço médio, que não usa lotes, é rejeitado."""
+        with pytest.raises(ValueError, match="FIFO ou LIFO"):
+            InvestimentoLotes(MetodoCusto.MEDIO)
+
+    def test_adicionar_acao(self):
+        """Testa se cada compra forma um lote e se o preço médio é o dos lotes restantes."""
+        assert self.fifo.quantidade == 60
+        assert self.fifo.valor_total == Decimal("1400")
+        assert self.fifo.preco_medio == Decimal("1400") / 60
+        assert self.fifo.lotes == ((10, Decimal("10")), (20, Decimal("20")), (30, Decimal("30")))
+
+    def test_compras_seguidas_com_o_mesmo_preco_formam_um_lote(self):
+        """Testa se compras seguidas com o mesmo preço são somadas no último lote."""
+        self.fifo.adicionar_acao(5, Decimal("30.00"))
+
+        assert self.fifo.lotes[-1] == (35, Decimal("30"))
+        assert len(self.fifo.lotes) == 3
+
+    def test_calcular_custo_fifo(self):
+        """Testa se o custo FIFO consome os lotes mais antigos, com o último em parte, sem removê-los."""
+        assert self.fifo.calcular_custo(5) == Decimal("50")
+        assert self.fifo.calcular_custo(25) == Decimal("400")
+        assert self.fifo.calcular_custo(60) == Decimal("1400")
+        assert self.fifo.quantidade == 60
+
+    def test_calcular_custo_lifo(self):
+        """Testa se o custo LIFO consome os lotes mais recentes, com o último em parte, sem removê-los."""
+        assert self.lifo.calcular_custo(5) == Decimal("150")
+        assert self.lifo.calcular_custo(35) == Decimal("1000")
+        assert self.lifo.calcular_custo(60) == Decimal("1400")
+        assert self.lifo.quantidade == 60
+
+    def test_remover_acao_fifo(self):
+        """Testa se a venda FIFO remove os lotes mais antigos e consome o seguinte em parte."""
+        self.fifo.remover_acao(25)
+
+        assert self.fifo.lotes == ((5, Decimal("20")), (30, Decimal("30")))
+        assert self.fifo.quantidade == 35
+        assert self.fifo.valor_total == Decimal("1000")
+
+    def test_remover_acao_lifo(self):
+        """Testa se a venda LIFO remove os lotes mais recentes e consome o seguinte em parte."""
+        self.lifo.remover_acao(35)
+
+        assert self.lifo.lotes == ((10, Decimal("10")), (15, Decimal("20")))
+        assert self.lifo.quantidade == 25
+        assert self.lifo.valor_total == Decimal("400")
+
+    def test_remover_lote_inteiro(self):
+        """Testa se a venda da quantidade exata de um lote o remove sem alterar o seguinte."""
+        self.fifo.remover_acao(10)
+
+        assert self.fifo.lotes == ((20, Decimal("20")), (30, Decimal("30")))
+
+    def test_remover_todas_as_acoes(self):
+        """Testa se a venda de todas as ações remove os lotes e zera o preço médio."""
+        self.lifo.remover_acao(60)
+
+        assert self.lifo.lotes == ()
+        assert self.lifo.preco_medio == Decimal("0")
+        assert self.lifo.valor_total == Decimal("0")
+
+    def test_muitos_lotes_pequenos(self):
+        """Testa o consumo de muitos lotes de uma ação com preços diferentes numa única venda."""
+        investimento = InvestimentoLotes(MetodoCusto.FIFO)
+        for centavos in range(1, 10001):
+            investimento.adicionar_acao(1, Decimal(centavos).scaleb(-2))
+
+        custo = investimento.calcular_custo(9999)
+        investimento.remover_acao(9999)
+
+        assert custo == Decimal(sum(range(1, 10000))).scaleb(-2)
+        assert investimento.lotes == ((1, Decimal("100.00")),)
+
+    def test_quantidade_invalida(self):
+        """Testa a compra e a venda com quantidades não positivas."""
+        with pytest.raises(ValueError, match="Quantidade deve ser maior que zero"):
+            self.fifo.adicionar_acao(0, Decimal("10"))
+        with pytest.raises(ValueError, match="Quantidade deve ser maior que zero"):
+            self.fifo.remover_acao(0)
+
+    def test_verifica_se_pode_remover_acao(self):
+        """Testa as mensagens de erro da verificação de venda."""
+        assert self.fifo.verifica_se_pode_remover_acao(60) is None
+        assert self.fifo.verifica_se_pode_remover_acao(61) == "Can't sell more stocks than you have"
+        assert self.fifo.verifica_se_pode_remover_acao(0) == "Quantidade deve ser maior que zero"
@@ -1,8 +1,10 @@
 from decimal import Decimal
+import io
 import json
+import random
 
 import pytest
-from src.adapters.output.json_formatter import DecimalEncoder, JsonFormatter
+from src.adapters.output.json_formatter import DecimalEncoder, JsonFormatter, formatar_decimal
 
 
 class TestJsonFormatter:
@@ -45,6 +47,96 @@ class TestJsonFormatter:
         # O formato esperado mantém a precisão original (exceto zeros à direita)
         assert resultado == '[{"tax": 10.1},{"tax": 10.12},{"tax": 10.123},{"tax": 10.1234}]'
 
+    @pytest.mark.parametrize(
+        "impostos",
+        [
+            [],
+            [Decimal("0")],
+            [Decimal("0"), Decimal("10000.00"), "Can't sell more stocks than you have", Decimal("1143.20")],
+        ],
+    )
+    def test_iter_formatar_impostos_igual_a_formatar_impostos(self, impostos):
+        """Testa se a concatenação dos fragmentos é idêntica ao JSON completo."""
+        fragmentos = list(JsonFormatter.iter_formatar_impostos(iter(impostos)))
+
+        assert "".join(fragmentos) == JsonFormatter.formatar_impostos(impostos)
+        assert len(fragmentos) == len(impostos) + 1
+
+    @pytest.mark.parametrize(
+        "impostos",
+        [
+            [],
+            [Decimal("0"), Decimal("10000.00"), "Can't sell more stocks than you have", Decimal("1143.20")],
+        ],
+    )
+    def test_escrever_impostos_em_arquivo(self, impostos):
+        """Testa se escrever_impostos escreve no arquivo o mesmo JSON produzido por formatar_impostos."""
+        arquivo = io.StringIO()
+
+        JsonFormatter.escrever_impostos(iter(impostos), arquivo)
+
+        assert arquivo.getvalue() == JsonFormatter.formatar_impostos(impostos)
+
+    def test_formatar_impostos_igual_ao_json_dumps_com_decimal_encoder(self):
+        """Testa se a formatação direta é idêntica à serialização original via DecimalEncoder."""
+        impostos = [Decimal("0"), Decimal("0.00"), Decimal("870.10"), Decimal("3000.70"), "erro \"com\" aspas é", 0]
+        esperado = json.dumps(
+            [{"error": imposto} if isinstance(imposto, str) else {"tax": imposto} for imposto in impostos],
+            cls=DecimalEncoder,
+            separators=(",", ": "),
+        )
+
+        assert JsonFormatter.formatar_impostos(impostos) == esperado
+
+    def test_formatar_erro(self):
+        """Testa se o registro de erro de uma linha é reconhecido e distinto das saídas com impostos e erros."""
+        registro = JsonFormatter.formatar_erro('erro "com" aspas')
+
+        assert json.loads(registro) == {"error": 'erro "com" aspas'}
+        assert JsonFormatter.eh_registro_erro(registro)
+        assert not JsonFormatter.eh_registro_erro(JsonFormatter.formatar_impostos(["erro"]))
+        assert not JsonFormatter.eh_registro_erro("[]")
+
+    def test_formatar_conta(self):
+        """Testa se as saídas dos registros de uma conta são reunidas num único array, ignorando as vazias."""
+        saidas = ["[]", JsonFormatter.formatar_impostos([Decimal("0")]), JsonFormatter.formatar_impostos(["erro"])]
+
+        resultado = JsonFormatter.formatar_conta('conta "1"', saidas)
+
+        assert json.loads(resultado) == {"account": 'conta "1"', "taxes": [{"tax": 0.0}, {"error": "erro"}]}
+        assert JsonFormatter.formatar_conta("A", []) == '{"account": "A", "taxes": []}'
+
+
+class TestFormatarDecimal:
+    @pytest.mark.parametrize(
+        "valor,esperado",
+        [
+            ("0", "0.0"),
+            ("-0", "-0.0"),
+            ("0.00", "0.0"),
+            ("10000.00", "10000.0"),
+            ("1143.20", "1143.2"),
+            ("10.1234", "10.1234"),
+            ("0.0001", "0.0001"),
+            ("0.00001", "1e-05"),
+            ("1E+2", "100.0"),
+            ("1E+16", "1e+16"),
+            ("NaN", "NaN"),
+        ],
+    )
+    def test_formatar_decimal(self, valor, esperado):
+        """Testa a formatação direta de Decimals em casos de borda."""
+        assert formatar_decimal(Decimal(valor)) == esperado
+
+    def test_formatar_decimal_igual_ao_float(self):
+        """Testa se a formatação direta coincide com a serialização do float para valores aleatórios."""
+        gerador = random.Random(42)
+        for _ in range(5000):
+            digitos = tuple(gerador.randint(0, 9) for _ in range(gerador.randint(1, 20)))
+            valor = Decimal((gerador.randint(0, 1), digitos, gerador.randint(-22, 18)))
+
+            assert formatar_decimal(valor) == json.dumps(float(valor))
+
 
 class TestDecimalEncoder:
     def test_converter_decimal_para_float(self):
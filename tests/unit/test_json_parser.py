@@ -4,6 +4,7 @@ import json
 import pytest
 from src.adapters.input.json_parser import JsonParser
 from src.domain.exceptions.parse_error import ParseError
+from src.domain.models.lote_operacoes import CODIGO_COMPRA, CODIGO_VENDA, LoteOperacoes
 from src.domain.models.operacao import Operacao, TipoOperacao
 
 
@@ -133,3 +134,121 @@ class TestJsonParser:
         assert operacoes[0].tipo_operacao == TipoOperacao.BUY
         assert operacoes[0].preco_unitario == Decimal("10.00")
         assert operacoes[0].quantidade == 100
+
+    def test_parse_operations_e_parse_lote_com_bytes(self):
+        """Testa se as linhas em bytes, como as lidas de um arquivo mapeado, produzem o mesmo resultado do texto."""
+        json_data = '[{"operation":"buy", "unit-cost":10.05, "quantity": 100},{"operation":"sell", "unit-cost":15, "quantity": 50}]\n'
+
+        assert JsonParser.parse_operations(json_data.encode()) == JsonParser.parse_operations(json_data)
+        assert list(JsonParser.parse_lote(json_data.encode())) == list(JsonParser.parse_lote(json_data))
+        with pytest.raises(ParseError, match="Erro ao processar JSON"):
+            JsonParser.parse_operations(b"{invalid json")
+
+    @pytest.mark.parametrize(
+        "json_data",
+        [
+            '[{"operation":"buy", "unit-cost":10.05, "quantity": 100},{"operation":"sell", "unit-cost":15, "quantity": 50}]',
+            '[{"quantity": 100, "unit-cost":10.05, "operation":"buy"},{"operation":"sell", "unit-cost":1.5e1, "quantity": 50}]',
+        ],
+    )
+    def test_parse_operations_com_e_sem_a_varredura(self, json_data):
+        """Testa se o formato da entrada, lido pela varredura, e as demais formas, lidas pelo json.loads, coincidem."""
+        esperado = [
+            Operacao(tipo_operacao=TipoOperacao.BUY, preco_unitario=Decimal("10.05"), quantidade=100),
+            Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("15"), quantidade=50),
+        ]
+
+        assert JsonParser.parse_operations(json_data) == esperado
+        assert JsonParser.parse_operations_json(json_data) == esperado
+        assert list(JsonParser.parse_lote(json_data)) == esperado
+        assert list(JsonParser.parse_lote_json(json_data)) == esperado
+
+    @pytest.mark.parametrize(
+        "json_data",
+        [
+            '[{"ticker":"PETR4", "operation":"buy", "unit-cost":10.05, "quantity": 100},{"operation":"sell", "unit-cost":15, "quantity": 50, "ticker":"VALE3"},{"operation":"sell", "unit-cost":15, "quantity": 50}]',
+            '[{"quantity": 100, "unit-cost":10.05, "operation":"buy", "ticker":"PETR4"},{"ticker":"VALE3", "operation":"sell", "unit-cost":1.5e1, "quantity": 50},{"operation":"sell", "unit-cost":15, "quantity": 50}]',
+        ],
+    )
+    def test_parse_operations_com_ticker(self, json_data):
+        """Testa se o ticker opcional é lido, com e sem a varredura."""
+        esperado = [
+            Operacao(TipoOperacao.BUY, Decimal("10.05"), 100, ticker="PETR4"),
+            Operacao(TipoOperacao.SELL, Decimal("15"), 50, ticker="VALE3"),
+            Operacao(TipoOperacao.SELL, Decimal("15"), 50),
+        ]
+
+        assert JsonParser.parse_operations(json_data) == esperado
+        assert JsonParser.parse_operations(json_data.encode()) == esperado
+        assert JsonParser.parse_operations_json(json_data) == esperado
+
+    def test_parse_operations_com_ticker_invalido(self):
+        """Testa se um ticker que não é texto gera ParseError."""
+        with pytest.raises(ParseError, match="ticker inválido"):
+            JsonParser.parse_operations('[{"operation":"buy", "unit-cost":10.00, "quantity": 100, "ticker": 3}]')
+
+    def test_parse_lote_com_ticker(self):
+        """Testa se o lote compacto, que não guarda o ticker, rejeita operações com ticker."""
+        with pytest.raises(ParseError, match="não guarda o ticker"):
+            JsonParser.parse_lote('[{"ticker":"PETR4", "operation":"buy", "unit-cost":10.00, "quantity": 100}]')
+
+    @pytest.mark.parametrize(
+        "json_data",
+        [
+            '{"account": "A", "operations": [{"operation":"buy", "unit-cost":10.05, "quantity": 100}]}',
+            '{"operations": [{"operation":"buy", "unit-cost":10.05, "quantity": 100}], "account": "A"}',
+            b'{"account": "A", "operations": [{"quantity": 100, "unit-cost":10.05, "operation":"buy"}]}',
+        ],
+    )
+    def test_parse_conta(self, json_data):
+        """Testa a leitura da conta e das operações de um registro, com e sem a varredura."""
+        esperado = ("A", [Operacao(TipoOperacao.BUY, Decimal("10.05"), 100)])
+
+        assert JsonParser.parse_conta(json_data) == esperado
+        assert JsonParser.parse_id_conta(json_data) == "A"
+
+    @pytest.mark.parametrize(
+        "json_data",
+        [
+            '{"account": 1, "operations": []}',
+            '{"operations": []}',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}]',
+            '{"account": "A", "operations": [{"operation":"buy"}]}',
+            "{invalid json",
+        ],
+    )
+    def test_parse_conta_invalida(self, json_data):
+        """Testa se registros de conta inválidos geram ParseError."""
+        with pytest.raises(ParseError, match="Erro ao processar JSON"):
+            JsonParser.parse_conta(json_data)
+
+    def test_parse_operations_preserva_os_digitos_do_preco(self):
+        """Testa se o preço é convertido em Decimal a partir dos dígitos da entrada, sem passar por float."""
+        json_data = '[{"operation":"buy", "unit-cost":0.10000000000000000555, "quantity": 1}]'
+
+        assert JsonParser.parse_operations(json_data)[0].preco_unitario == Decimal("0.10000000000000000555")
+
+    def test_parse_lote(self):
+        """Testa o preenchimento de um lote compacto, com os preços em centavos."""
+        json_data = '[{"operation":"buy", "unit-cost":10.05, "quantity": 100},{"operation":"sell", "unit-cost":15, "quantity": 50}]'
+
+        lote = JsonParser.parse_lote(json_data)
+
+        assert isinstance(lote, LoteOperacoes)
+        assert list(lote.iter_colunas()) == [(CODIGO_COMPRA, 1005, 100), (CODIGO_VENDA, 1500, 50)]
+        assert list(lote) == JsonParser.parse_operations(json_data)
+
+    @pytest.mark.parametrize(
+        "json_data",
+        [
+            '[{"operation":"buy", "unit-cost":10.001, "quantity": 100}]',
+            '[{"operation":"invalid", "unit-cost":10.00, "quantity": 100}]',
+            '[{"operation":"buy", "quantity": 100}]',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100000000000000000000}]',
+            "{invalid json",
+        ],
+    )
+    def test_parse_lote_invalido(self, json_data):
+        """Testa se entradas inválidas para o lote compacto geram ParseError."""
+        with pytest.raises(ParseError, match="Erro ao processar JSON"):
+            JsonParser.parse_lote(json_data)
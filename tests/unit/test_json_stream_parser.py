@@ -0,0 +1,75 @@
+from decimal import Decimal
+import types
+
+import pytest
+from src.adapters.input.json_parser import JsonParser
+from src.adapters.input.json_stream_parser import JsonStreamParser
+from src.domain.exceptions.parse_error import ParseError
+from src.domain.models.operacao import TipoOperacao
+
+
+class TestJsonStreamParser:
+    def setup_method(self):
+        """Configuração inicial para cada teste."""
+        self.parser = JsonStreamParser()
+
+    def test_iter_operations_retorna_gerador(self):
+        """Testa se iter_operations produz as operações de forma preguiçosa."""
+        json_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}]'
+
+        operacoes = self.parser.iter_operations(json_data)
+
+        assert isinstance(operacoes, types.GeneratorType)
+        operacao = next(operacoes)
+        assert operacao.tipo_operacao == TipoOperacao.BUY
+        assert operacao.preco_unitario == Decimal("10.00")
+        assert operacao.quantidade == 100
+        with pytest.raises(StopIteration):
+            next(operacoes)
+
+    @pytest.mark.parametrize(
+        "json_data",
+        [
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100},{"operation":"sell", "unit-cost":15.00, "quantity": 50}]',
+            '[{"operation":"buy", "unit-cost":10, "quantity": 100}, {"operation":"buy", "unit-cost":10.5, "quantity": 100}]\n',
+            """
+            [
+              {"operation": "buy", "unit-cost": 10.00, "quantity": 100},
+              {"operation": "sell", "unit-cost": 20.00, "quantity": 100}
+            ]
+            """,
+            "[]",
+            "  [ ]  ",
+        ],
+    )
+    def test_mesmo_resultado_do_json_parser(self, json_data):
+        """Testa se o parser incremental produz as mesmas operações que o JsonParser."""
+        assert self.parser.parse_operations(json_data) == JsonParser.parse_operations(json_data)
+
+    def test_erro_so_ocorre_ao_alcancar_o_item_invalido(self):
+        """Testa se as operações anteriores a um item inválido são entregues antes do erro."""
+        json_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 100},{"operation":"invalid"}]'
+
+        operacoes = self.parser.iter_operations(json_data)
+
+        assert next(operacoes).quantidade == 100
+        with pytest.raises(ParseError, match="Erro ao processar JSON"):
+            next(operacoes)
+
+    @pytest.mark.parametrize(
+        "json_data",
+        [
+            "",
+            '{"operation":"buy", "unit-cost":10.00, "quantity": 100}',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100} {"operation":"buy"}]',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}] []',
+            '[{"operation":"buy", "quantity": 100}]',
+            '[{"operation":"buy", "unit-cost":"invalid", "quantity": 100}]',
+            "[{invalid json}]",
+        ],
+    )
+    def test_json_invalido(self, json_data):
+        """Testa se entradas inválidas geram ParseError."""
+        with pytest.raises(ParseError, match="Erro ao processar JSON"):
+            self.parser.parse_operations(json_data)
@@ -0,0 +1,55 @@
+import io
+
+from src.adapters.output.json_formatter import JsonFormatter
+from src.application.cli.linhas_rejeitadas import LinhasRejeitadas, SaidaComRejeicoes
+from src.application.cli.saida_bufferizada import SaidaBufferizada
+
+ERRO = JsonFormatter.formatar_erro("Erro ao processar entrada: falha")
+
+
+class TestLinhasRejeitadas:
+    def test_grava_apenas_as_linhas_com_registro_de_erro(self):
+        """Testa se apenas as linhas respondidas com registro de erro são gravadas e contadas, na ordem."""
+        arquivo = io.BytesIO()
+        rejeitadas = LinhasRejeitadas(arquivo, JsonFormatter.eh_registro_erro)
+        linhas = rejeitadas.acompanhar(["[]\n", "{ruim\n", b"[1]", b"{outra"])
+
+        for _, saida in zip(linhas, ["[]", ERRO, '[{"tax": 0.0}]', ERRO]):
+            rejeitadas.conferir(saida)
+
+        assert arquivo.getvalue() == b"{ruim\n{outra\n"
+        assert rejeitadas.quantidade == 2
+
+    def test_retomar_descarta_as_linhas_depois_do_ponto_de_controle(self, tmp_path):
+        """Testa se a retomada trunca o arquivo na posição registrada e continua contando os bytes a partir dela."""
+        caminho = tmp_path / "rejeitadas.txt"
+        with open(caminho, "wb") as arquivo:
+            rejeitadas = LinhasRejeitadas(arquivo, JsonFormatter.eh_registro_erro)
+            for _ in rejeitadas.acompanhar(["{ruim\n", "{outra\n"]):
+                rejeitadas.conferir(ERRO)
+            assert rejeitadas.bytes_escritos == len(b"{ruim\n{outra\n")
+            rejeitadas.flush()
+
+        with open(caminho, "ab") as arquivo:
+            rejeitadas = LinhasRejeitadas(arquivo, JsonFormatter.eh_registro_erro)
+            rejeitadas.retomar(len(b"{ruim\n"))
+            for _ in rejeitadas.acompanhar(["{outra\n"]):
+                rejeitadas.conferir(ERRO)
+            assert rejeitadas.bytes_escritos == len(b"{ruim\n{outra\n")
+
+        assert caminho.read_bytes() == b"{ruim\n{outra\n"
+
+    def test_saida_com_rejeicoes(self):
+        """Testa se a saída envolvida escreve todas as linhas de resultado, conferindo cada uma."""
+        arquivo = io.BytesIO()
+        rejeitadas = LinhasRejeitadas(arquivo, JsonFormatter.eh_registro_erro)
+        texto = io.StringIO()
+        list(rejeitadas.acompanhar(["[]", "{ruim"]))
+
+        with SaidaBufferizada(texto) as saida_bufferizada:
+            saida = SaidaComRejeicoes(saida_bufferizada, rejeitadas)
+            saida.escrever_linha("[]")
+            saida.escrever_linha(ERRO)
+
+        assert texto.getvalue() == "[]\n" + ERRO + "\n"
+        assert arquivo.getvalue() == b"{ruim\n"
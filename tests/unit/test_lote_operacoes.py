@@ -0,0 +1,75 @@
+from decimal import Decimal
+
+import pytest
+from src.domain.models.lote_operacoes import CODIGO_COMPRA, CODIGO_VENDA, LoteOperacoes
+from src.domain.models.operacao import Operacao, TipoOperacao
+
+
+class TestLoteOperacoes:
+    def test_lote_vazio(self):
+        """Testa a criação de um lote vazio."""
+        lote = LoteOperacoes()
+
+        assert len(lote) == 0
+        assert list(lote) == []
+
+    def test_adicionar_e_materializar_operacoes(self):
+        """Testa se as operações adicionadas podem ser materializadas como Operacao."""
+        lote = LoteOperacoes()
+        lote.adicionar(TipoOperacao.BUY, 1050, 100)
+        lote.adicionar(TipoOperacao.SELL, 2000, 50)
+
+        assert len(lote) == 2
+        assert lote[0] == Operacao(TipoOperacao.BUY, Decimal("10.50"), 100)
+        assert list(lote) == [
+            Operacao(TipoOperacao.BUY, Decimal("10.50"), 100),
+            Operacao(TipoOperacao.SELL, Decimal("20.00"), 50),
+        ]
+
+    def test_iter_colunas(self):
+        """Testa a leitura das colunas sem materializar operações."""
+        lote = LoteOperacoes()
+        lote.adicionar(TipoOperacao.BUY, 1050, 100)
+        lote.adicionar(TipoOperacao.SELL, 2000, 50)
+
+        assert list(lote.iter_colunas()) == [(CODIGO_COMPRA, 1050, 100), (CODIGO_VENDA, 2000, 50)]
+
+    def test_estender(self):
+        """Testa se as operações informadas coluna a coluna são adicionadas ao final do lote."""
+        lote = LoteOperacoes()
+        lote.adicionar(TipoOperacao.BUY, 1050, 100)
+        lote.estender([TipoOperacao.SELL, TipoOperacao.BUY], [2000, 900], [50, 10])
+
+        assert list(lote.iter_colunas()) == [
+            (CODIGO_COMPRA, 1050, 100),
+            (CODIGO_VENDA, 2000, 50),
+            (CODIGO_COMPRA, 900, 10),
+        ]
+
+    def test_colunas_compactas(self):
+        """Testa se as colunas usam tipos de largura fixa: 1 byte para o tipo e 8 bytes para preço e quantidade."""
+        lote = LoteOperacoes()
+
+        assert lote.tipos.itemsize == 1
+        assert lote.precos_centavos.itemsize == 8
+        assert lote.quantidades.itemsize == 8
+        assert not hasattr(lote, "__dict__")
+
+    def test_de_operacoes(self):
+        """Testa a criação de um lote a partir de operações."""
+        operacoes = [Operacao(TipoOperacao.BUY, Decimal("10"), 100), Operacao(TipoOperacao.SELL, Decimal("0.05"), 1)]
+
+        lote = LoteOperacoes.de_operacoes(operacoes)
+
+        assert list(lote.iter_colunas()) == [(CODIGO_COMPRA, 1000, 100), (CODIGO_VENDA, 5, 1)]
+        assert list(lote) == operacoes
+
+    def test_de_operacoes_com_mais_de_duas_casas(self):
+        """Testa se preços que não cabem em centavos são rejeitados."""
+        with pytest.raises(ValueError, match="mais de duas casas decimais"):
+            LoteOperacoes.de_operacoes([Operacao(TipoOperacao.BUY, Decimal("10.001"), 100)])
+
+    def test_de_operacoes_com_ticker(self):
+        """Testa se operações com ticker, que o lote não guarda, são rejeitadas."""
+        with pytest.raises(ValueError, match="não guarda o ticker"):
+            LoteOperacoes.de_operacoes([Operacao(TipoOperacao.BUY, Decimal("10"), 100, ticker="PETR4")])
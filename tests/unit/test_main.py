@@ -1,12 +1,17 @@
 from decimal import Decimal
 import importlib
 import io
+import json
+import subprocess
 import sys
 from unittest.mock import MagicMock, call, patch
 
 import pytest
+from src.adapters.input.binario_parser import codificar_operacoes
 from src.adapters.input.json_parser import JsonParser
+from src.adapters.output.binario_formatter import ler_registro_impostos
 from src.adapters.output.json_formatter import JsonFormatter
+from src.application.cli.main import _emitir_estatisticas
 from src.domain.exceptions.parse_error import ParseError
 from src.domain.models.operacao import Operacao, TipoOperacao
 from src.domain.services.calcular_imposto_service import CalcularImpostoService
@@ -181,7 +186,7 @@ class TestMain:
 
         # Verificar se o bloco condicional está presente
         assert 'if __name__ == "__main__"' in content
-        assert "main()" in content
+        assert "main(sys.argv[1:])" in content
 
         # Verificação alternativa para confirmar que é um bloco funcional
         # Este teste verifica se a estrutura do código está correta, não se ele realmente executa
@@ -191,3 +196,492 @@ class TestMain:
 
         # Se conseguimos acessar a função main, e ela é chamável, então a estrutura do código está correta
         assert callable(main_function)
+
+    def test_main_com_workers_mantem_ordem_e_saida(self):
+        """Testa a função main com --workers, que deve produzir a mesma saída do modo sequencial."""
+        input_data = (
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n'
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100},{"operation":"sell", "unit-cost":15.00, "quantity": 50}]\n'
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n'
+        )
+        saida_sequencial = io.StringIO()
+        saida_paralela = io.StringIO()
+
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", saida_sequencial):
+            main()
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", saida_paralela):
+            main(["--workers", "2", "--chunk-size", "1"])
+
+        assert saida_paralela.getvalue() == saida_sequencial.getvalue()
+        assert saida_paralela.getvalue() == (
+            '[{"tax": 0.0},{"tax": 10000.0}]\n[{"tax": 0.0},{"tax": 0.0}]\n[{"tax": 0.0},{"tax": 10000.0}]\n'
+        )
+
+    def test_main_com_workers_invalido(self):
+        """Testa a função main com uma quantidade de workers inválida."""
+        with pytest.raises(SystemExit), patch("sys.stderr", io.StringIO()):
+            main(["--workers", "0"])
+
+    def test_main_com_stream(self):
+        """Testa a função main com --stream, que lê as operações de forma incremental."""
+        input_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n'
+        output_data = io.StringIO()
+
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", output_data):
+            main(["--stream"])
+
+        assert output_data.getvalue() == '[{"tax": 0.0},{"tax": 10000.0}]\n'
+
+    @pytest.mark.parametrize("motor", ["decimal", "local"])
+    def test_main_com_compact(self, motor):
+        """Testa a função main com --compact, que lê as operações num lote compacto."""
+        input_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n'
+        output_data = io.StringIO()
+
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", output_data):
+            main(["--compact", "--engine", motor])
+
+        assert output_data.getvalue() == '[{"tax": 0.0},{"tax": 10000.0}]\n'
+
+    @pytest.mark.parametrize("argumentos", [[], ["--engine", "decimal"], ["--stream"]])
+    def test_main_com_varios_tickers(self, argumentos):
+        """Testa se cada ticker tem a sua posição e se o prejuízo acumulado é compartilhado entre eles."""
+        input_data = '[{"ticker":"PETR4", "operation":"buy", "unit-cost":10.00, "quantity": 10000},{"ticker":"VALE3", "operation":"buy", "unit-cost":50.00, "quantity": 1000},{"ticker":"PETR4", "operation":"sell", "unit-cost":5.00, "quantity": 5000},{"ticker":"VALE3", "operation":"sell", "unit-cost":80.00, "quantity": 1000}]\n'
+        output_data = io.StringIO()
+
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", output_data):
+            main(argumentos)
+
+        assert output_data.getvalue() == '[{"tax": 0.0},{"tax": 0.0},{"tax": 0.0},{"tax": 1000.0}]\n'
+
+    @pytest.mark.parametrize(
+        "argumentos, esperado",
+        [
+            ([], '[{"tax": 0.0},{"tax": 0.0},{"tax": 5000.0}]\n'),
+            (["--cost-basis", "fifo"], '[{"tax": 0.0},{"tax": 0.0},{"tax": 15000.0}]\n'),
+            (["--cost-basis", "lifo", "--stream"], '[{"tax": 0.0},{"tax": 0.0},{"tax": 0.0}]\n'),
+            (["--cost-basis", "fifo", "--compact"], '[{"tax": 0.0},{"tax": 0.0},{"tax": 15000.0}]\n'),
+        ],
+    )
+    def test_main_com_cost_basis(self, argumentos, esperado):
+        """Testa a função main com o custo das vendas pelo preço médio e pelos lotes FIFO e LIFO."""
+        input_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"buy", "unit-cost":30.00, "quantity": 10000},{"operation":"sell", "unit-cost":25.00, "quantity": 5000}]\n'
+        output_data = io.StringIO()
+
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", output_data):
+            main(argumentos)
+
+        assert output_data.getvalue() == esperado
+
+    @pytest.mark.parametrize(
+        "argumentos", [["--engine", "local"], ["--accounts"], ["--cache-file", "cache.db"], ["--prefix-cache", "10"]]
+    )
+    def test_main_cost_basis_incompativel(self, argumentos):
+        """Testa se o custo por lotes é rejeitado junto com as opções que ele não aceita."""
+        with pytest.raises(SystemExit), patch("sys.stderr", io.StringIO()):
+            main(["--cost-basis", "lifo"] + argumentos)
+
+    @pytest.mark.parametrize(
+        "argumentos, esperado",
+        [
+            (["--tax-date", "2024-12-31"], '[{"tax": 0.0},{"tax": 3000.0},{"tax": 10000.0}]\n'),
+            (["--tax-date", "2025-01-01"], '[{"tax": 0.0},{"tax": 0.0},{"tax": 7500.0}]\n'),
+            (["--tax-date", "2025-01-01", "--engine", "local"], '[{"tax": 0.0},{"tax": 0.0},{"tax": 7500.0}]\n'),
+            (["--tax-date", "2025-01-01", "--workers", "2"], '[{"tax": 0.0},{"tax": 0.0},{"tax": 7500.0}]\n'),
+            ([], '[{"tax": 0.0},{"tax": 0.0},{"tax": 7500.0}]\n'),
+        ],
+    )
+    def test_main_com_tax_rules(self, tmp_path, argumentos, esperado):
+        """Testa a função main com a regra do imposto vigente na data escolhida (por padrão, a data atual)."""
+        regras = tmp_path / "regras.json"
+        regras.write_text(
+            '{"regras": [{"vigencia": "2020-01-01", "aliquota": "0.20", "limite_isencao": "20000.00"}, '
+            '{"vigencia": "2025-01-01", "aliquota": "0.15", "limite_isencao": "50000.00"}]}'
+        )
+        input_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":15.00, "quantity": 3000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n'
+        output_data = io.StringIO()
+
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", output_data):
+            main(["--tax-rules", str(regras)] + argumentos)
+
+        assert output_data.getvalue() == esperado
+
+    @pytest.mark.parametrize(
+        "argumentos",
+        [
+            ["--tax-date", "2025-01-01"],
+            ["--tax-rules", "inexistente.json"],
+            ["--tax-rules", "{regras}", "--tax-date", "2019-01-01"],
+            ["--tax-rules", "{regras}", "--tax-date", "2025-02-30"],
+            ["--tax-rules", "{regras}", "--cache-file", "cache.db"],
+        ],
+    )
+    def test_main_tax_rules_invalido(self, tmp_path, argumentos):
+        """Testa se as opções da regra do imposto são rejeitadas com arquivo, data ou combinação inválidos."""
+        regras = tmp_path / "regras.json"
+        regras.write_text('{"regras": [{"vigencia": "2020-01-01", "aliquota": "0.20", "limite_isencao": "20000"}]}')
+
+        with pytest.raises(SystemExit), patch("sys.stderr", io.StringIO()):
+            main([argumento.replace("{regras}", str(regras)) for argumento in argumentos])
+
+    def test_main_com_compact_e_stream(self):
+        """Testa se --compact e --stream não podem ser usados juntos."""
+        with pytest.raises(SystemExit), patch("sys.stderr", io.StringIO()):
+            main(["--compact", "--stream"])
+
+    def test_main_com_stats_na_saida_de_erro(self):
+        """Testa a função main com --stats, que imprime o resumo das medições na saída de erro."""
+        input_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n'
+        output_data = io.StringIO()
+        erros = io.StringIO()
+
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", output_data), patch("sys.stderr", erros):
+            main(["--stats"])
+
+        assert output_data.getvalue() == '[{"tax": 0.0},{"tax": 10000.0}]\n'
+        assert "operações: 2 (compras: 1, vendas: 1, vendas/compras: 1.0)" in erros.getvalue()
+
+    @pytest.mark.parametrize("argumentos", [[], ["--stream"], ["--workers", "2"]])
+    def test_main_com_stats_na_saida_de_erro_guarda_apenas_totais(self, argumentos):
+        """Testa se --stats sem ARQUIVO acumula apenas os totais, sem guardar as medições de cada linha."""
+        input_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}]\n' * 3
+        erros = io.StringIO()
+
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", io.StringIO()), patch(
+            "sys.stderr", erros
+        ), patch("src.application.cli.main._emitir_estatisticas", wraps=_emitir_estatisticas) as emitir:
+            main(argumentos + ["--stats"])
+
+        estatisticas = emitir.call_args.args[0]
+        assert estatisticas.linhas == []
+        assert estatisticas.totais()["linhas"] == 3
+        assert "linhas: 3" in erros.getvalue()
+
+    @pytest.mark.parametrize("argumentos", [[], ["--stream"], ["--workers", "2"]])
+    def test_main_com_stats_em_arquivo(self, tmp_path, argumentos):
+        """Testa a função main com --stats ARQUIVO, que grava as medições de cada linha em JSON."""
+        input_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}]\n' * 3
+        arquivo = tmp_path / "stats.json"
+
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", io.StringIO()):
+            main(argumentos + ["--stats", str(arquivo)])
+
+        estatisticas = json.loads(arquivo.read_text())
+        assert estatisticas["totais"]["linhas"] == 3
+        assert estatisticas["totais"]["compras"] == 3
+        assert len(estatisticas["linhas"]) == 3
+
+    @pytest.mark.parametrize("politica", ["interactive", "exit", "2"])
+    def test_main_com_politica_de_flush(self, politica):
+        """Testa se a saída é a mesma em qualquer política de descarga."""
+        input_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}]\n' * 3
+        output_data = io.StringIO()
+
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", output_data):
+            main(["--flush", politica])
+
+        assert output_data.getvalue() == '[{"tax": 0.0}]\n' * 3
+
+    @pytest.mark.parametrize("politica,descargas_parciais", [("interactive", True), ("exit", False), ("1", True)])
+    def test_main_stream_descarrega_cada_imposto(self, politica, descargas_parciais):
+        """Testa se, com --stream e descarga a cada linha, cada imposto é descarregado antes do fim da carteira."""
+        input_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n'
+        output_data = io.StringIO()
+        descarregados = []
+        output_data.flush = lambda: descarregados.append(output_data.getvalue())
+
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", output_data):
+            main(["--stream", "--flush", politica])
+
+        assert output_data.getvalue() == '[{"tax": 0.0},{"tax": 10000.0}]\n'
+        assert ('[{"tax": 0.0}' in descarregados) is descargas_parciais
+
+    @pytest.mark.parametrize("politica", ["0", "nunca"])
+    def test_main_com_politica_de_flush_invalida(self, politica):
+        """Testa a validação da política de descarga."""
+        with pytest.raises(SystemExit), patch("sys.stderr", io.StringIO()):
+            main(["--flush", politica])
+
+    def test_main_descarrega_resultados_anteriores_ao_erro(self):
+        """Testa se os resultados já calculados são escritos antes da falha de uma linha seguinte."""
+        input_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}]\n{invalid json\n'
+        output_data = io.StringIO()
+
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", output_data), pytest.raises(SystemExit):
+            main(["--flush", "exit"])
+
+        assert output_data.getvalue() == '[{"tax": 0.0}]\n'
+
+    @pytest.mark.parametrize("argumentos", [["--cache", "1"], ["--cache", "1", "--stream"]])
+    def test_main_com_cache(self, argumentos):
+        """Testa a função main com --cache, que reaproveita a saída das linhas repetidas."""
+        input_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]\n' * 3
+        output_data = io.StringIO()
+        erros = io.StringIO()
+
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", output_data), patch("sys.stderr", erros):
+            main(argumentos + ["--stats"])
+
+        assert output_data.getvalue() == '[{"tax": 0.0},{"tax": 10000.0}]\n' * 3
+        assert "cache: acertos: 2, acertos_disco: 0, falhas: 1" in erros.getvalue()
+
+    def test_main_com_cache_persistido(self, tmp_path):
+        """Testa se os resultados persistidos com --cache-file são reaproveitados numa nova execução."""
+        input_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}]\n'
+        arquivo_cache = str(tmp_path / "cache.db")
+        arquivo_stats = tmp_path / "stats.json"
+
+        for _ in range(2):
+            with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", io.StringIO()):
+                main(["--cache-file", arquivo_cache, "--stats", str(arquivo_stats)])
+
+        assert json.loads(arquivo_stats.read_text())["cache"]["acertos_disco"] == 1
+
+    def test_main_stream_com_cache_somente_em_arquivo(self, tmp_path):
+        """Testa se, com --stream e apenas --cache-file, a saída é persistida e reaproveitada na execução seguinte."""
+        input_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}]\n'
+        arquivo_cache = str(tmp_path / "cache.db")
+        arquivo_stats = tmp_path / "stats.json"
+
+        saidas = []
+        for _ in range(2):
+            output_data = io.StringIO()
+            with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", output_data):
+                main(["--stream", "--cache-file", arquivo_cache, "--stats", str(arquivo_stats)])
+            saidas.append(output_data.getvalue())
+
+        assert saidas == ['[{"tax": 0.0}]\n'] * 2
+        assert json.loads(arquivo_stats.read_text())["cache"]["acertos_disco"] == 1
+
+    def test_main_com_cache_persistido_e_outro_motor(self, tmp_path):
+        """Testa se o arquivo de --cache-file reaproveitado com outro --engine não responde com a saída do anterior."""
+        input_data = '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}]\n'
+        arquivo_cache = str(tmp_path / "cache.db")
+        arquivo_stats = tmp_path / "stats.json"
+
+        for motor in ("decimal", "local", "decimal"):
+            with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", io.StringIO()):
+                main(["--cache-file", arquivo_cache, "--engine", motor, "--stats", str(arquivo_stats)])
+            if motor == "local":
+                assert json.loads(arquivo_stats.read_text())["cache"]["acertos_disco"] == 0
+
+        assert json.loads(arquivo_stats.read_text())["cache"]["acertos_disco"] == 1
+
+    def test_main_com_prefix_cache(self):
+        """Testa a função main com --prefix-cache, que retoma carteiras reenviadas com novas operações."""
+        compra = '{"operation":"buy", "unit-cost":10.00, "quantity": 10000}'
+        venda = '{"operation":"sell", "unit-cost":20.00, "quantity": 5000}'
+        input_data = f"[{compra}]\n[{compra},{venda}]\n[{compra},{venda},{venda}]\n"
+        output_data = io.StringIO()
+
+        with patch("sys.stdin", io.StringIO(input_data)), patch("sys.stdout", output_data):
+            main(["--prefix-cache", "4"])
+
+        assert output_data.getvalue() == (
+            '[{"tax": 0.0}]\n[{"tax": 0.0},{"tax": 10000.0}]\n[{"tax": 0.0},{"tax": 10000.0},{"tax": 10000.0}]\n'
+        )
+
+    @pytest.mark.parametrize("argumentos", [["--stream"], ["--stats"]])
+    def test_main_prefix_cache_incompativel(self, argumentos):
+        """Testa se --prefix-cache é rejeitado junto com --stream ou --stats."""
+        with pytest.raises(SystemExit), patch("sys.stderr", io.StringIO()):
+            main(["--prefix-cache", "4"] + argumentos)
+
+    @pytest.mark.parametrize("argumentos", [[], ["--stream"]])
+    def test_main_retoma_do_ponto_de_controle(self, tmp_path, argumentos):
+        """Testa se uma execução interrompida e retomada com --resume produz a mesma saída de uma execução inteira."""
+        compra = '{"operation":"buy", "unit-cost":10.00, "quantity": 10000}'
+        venda = '{"operation":"sell", "unit-cost":20.00, "quantity": 5000}'
+        linhas = [f"[{compra}]\n", f"[{compra},{venda}]\n", f"[{venda}]\n"]
+        entrada_interrompida = tmp_path / "interrompida.txt"
+        entrada_interrompida.write_text("".join(linhas) + "{invalid json\n")
+        entrada = tmp_path / "entrada.txt"
+        entrada.write_text("".join(linhas) + f"[{compra},{compra}]\n")
+        saida = tmp_path / "saida.txt"
+        checkpoint = ["--checkpoint", str(tmp_path / "ponto.json"), "--checkpoint-every", "2"]
+
+        with open(entrada_interrompida) as stdin, open(saida, "w") as stdout, patch("sys.stdin", stdin), patch(
+            "sys.stdout", stdout
+        ), pytest.raises(SystemExit):
+            main(argumentos + checkpoint)
+        assert saida.read_text().count("\n") == 3
+
+        with open(entrada) as stdin, open(saida, "a") as stdout, patch("sys.stdin", stdin), patch(
+            "sys.stdout", stdout
+        ):
+            main(argumentos + checkpoint + ["--resume"])
+
+        assert saida.read_text() == (
+            '[{"tax": 0.0}]\n[{"tax": 0.0},{"tax": 10000.0}]\n[{"error": "Can\'t sell more stocks than you have"}]\n'
+            '[{"tax": 0.0},{"tax": 0.0}]\n'
+        )
+
+    @pytest.mark.parametrize(
+        "argumentos", [[], ["--stream"], ["--compact"], ["--workers", "2"], ["--cache", "4"], ["--prefix-cache", "4"]]
+    )
+    def test_main_com_input(self, tmp_path, argumentos):
+        """Testa a função main lendo as carteiras de um arquivo mapeado em memória com --input."""
+        compra = '{"operation":"buy", "unit-cost":10.00, "quantity": 10000}'
+        venda = '{"operation":"sell", "unit-cost":20.00, "quantity": 5000}'
+        entrada = tmp_path / "entrada.txt"
+        entrada.write_text(f"[{compra}]\n[{compra},{venda}]\n\n[{venda}]\n")
+        output_data = io.StringIO()
+
+        with patch("sys.stdin", io.StringIO("")), patch("sys.stdout", output_data):
+            main(["--input", str(entrada)] + argumentos)
+
+        assert output_data.getvalue() == '[{"tax": 0.0}]\n[{"tax": 0.0},{"tax": 10000.0}]\n'
+
+    def test_main_com_input_retoma_do_ponto_de_controle(self, tmp_path):
+        """Testa se uma execução com --input interrompida é retomada a partir da posição gravada no arquivo."""
+        compra = '{"operation":"buy", "unit-cost":10.00, "quantity": 10000}'
+        venda = '{"operation":"sell", "unit-cost":20.00, "quantity": 5000}'
+        entrada = tmp_path / "entrada.txt"
+        entrada.write_text(f"[{compra}]\n[{compra},{venda}]\n{{invalid json\n")
+        saida = tmp_path / "saida.txt"
+        argumentos = ["--input", str(entrada), "--checkpoint", str(tmp_path / "ponto.json"), "--checkpoint-every", "1"]
+
+        with open(saida, "w") as stdout, patch("sys.stdout", stdout), pytest.raises(SystemExit):
+            main(argumentos)
+
+        entrada.write_text(f"[{compra}]\n[{compra},{venda}]\n[{venda}]\n")
+        with open(saida, "a") as stdout, patch("sys.stdout", stdout):
+            main(argumentos + ["--resume"])
+
+        assert saida.read_text() == (
+            '[{"tax": 0.0}]\n[{"tax": 0.0},{"tax": 10000.0}]\n[{"error": "Can\'t sell more stocks than you have"}]\n'
+        )
+
+    @pytest.mark.parametrize("argumentos", [[], ["--engine", "local"], ["--workers", "2"]])
+    def test_main_com_formato_binario(self, tmp_path, argumentos):
+        """Testa a função main lendo e escrevendo registros binários, pela entrada padrão e com --input."""
+        compra = Operacao(tipo_operacao=TipoOperacao.BUY, preco_unitario=Decimal("10.00"), quantidade=10000)
+        venda = Operacao(tipo_operacao=TipoOperacao.SELL, preco_unitario=Decimal("20.00"), quantidade=5000)
+        entrada = codificar_operacoes([compra, venda]) + codificar_operacoes([venda])
+        arquivo = tmp_path / "entrada.bin"
+        arquivo.write_bytes(entrada)
+        esperado = [[Decimal("0"), Decimal("10000")], ["Can't sell more stocks than you have"]]
+
+        for opcoes, stdin in [([], entrada), (["--input", str(arquivo)], b"")]:
+            saida = io.BytesIO()
+            stdout = io.TextIOWrapper(saida)
+            with patch("sys.stdin", io.TextIOWrapper(io.BytesIO(stdin))), patch("sys.stdout", stdout):
+                main(["--format", "binario"] + opcoes + argumentos)
+
+            saida.seek(0)
+            assert [ler_registro_impostos(saida), ler_registro_impostos(saida), ler_registro_impostos(saida)] == [
+                *esperado,
+                None,
+            ]
+
+    @pytest.mark.parametrize("argumentos", [["--stream"], ["--stats"], ["--cache", "1"], ["--checkpoint", "ponto"]])
+    def test_main_formato_binario_incompativel(self, argumentos):
+        """Testa se o formato binário é rejeitado junto com as opções que trabalham com linhas de texto."""
+        with pytest.raises(SystemExit), patch("sys.stderr", io.StringIO()):
+            main(["--format", "binario"] + argumentos)
+
+    @pytest.mark.parametrize("argumentos", [[], ["--workers", "2", "--chunk-size", "1"], ["--engine", "local"]])
+    def test_main_com_contas(self, tmp_path, argumentos):
+        """Testa a função main com registros de contas intercalados, pela entrada padrão e com --input."""
+        compra = '{"operation":"buy", "unit-cost":10.00, "quantity": 10000}'
+        venda = '{"operation":"sell", "unit-cost":20.00, "quantity": 5000}'
+        entrada = (
+            f'{{"account": "A", "operations": [{compra}]}}\n'
+            f'{{"account": "B", "operations": [{venda}]}}\n'
+            f'{{"operations": [{venda}], "account": "A"}}\n'
+        )
+        arquivo = tmp_path / "entrada.txt"
+        arquivo.write_text(entrada)
+
+        for opcoes, stdin in [([], entrada), (["--input", str(arquivo)], "")]:
+            output_data = io.StringIO()
+            with patch("sys.stdin", io.StringIO(stdin)), patch("sys.stdout", output_data):
+                main(["--accounts"] + opcoes + argumentos)
+
+            assert output_data.getvalue() == (
+                '{"account": "A", "taxes": [{"tax": 0.0},{"tax": 10000.0}]}\n'
+                '{"account": "B", "taxes": [{"error": "Can\'t sell more stocks than you have"}]}\n'
+            )
+
+    @pytest.mark.parametrize("argumentos", [["--stream"], ["--format", "binario"], ["--prefix-cache", "2"]])
+    def test_main_contas_incompativel(self, argumentos):
+        """Testa se --accounts é rejeitado junto com as opções que ele não aceita."""
+        with pytest.raises(SystemExit), patch("sys.stderr", io.StringIO()):
+            main(["--accounts"] + argumentos)
+
+    @pytest.mark.parametrize("argumentos", [[], ["--workers", "2", "--chunk-size", "1"], ["--cache", "1"]])
+    def test_main_com_rejects(self, tmp_path, argumentos):
+        """Testa se as linhas com erro viram registros de erro e são gravadas no arquivo de linhas rejeitadas."""
+        valida = '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}]'
+        quantidade_invalida = '[{"operation":"buy", "unit-cost":10.00, "quantity": 0}]'
+        rejeitadas = tmp_path / "rejeitadas.txt"
+        output_data = io.StringIO()
+        stderr = io.StringIO()
+
+        with patch("sys.stdin", io.StringIO(f"{valida}\n{{invalid json\n{quantidade_invalida}\n{valida}\n")), patch(
+            "sys.stdout", output_data
+        ), patch("sys.stderr", stderr):
+            main(["--rejects", str(rejeitadas)] + argumentos)
+
+        saidas = output_data.getvalue().splitlines()
+        assert saidas[0] == saidas[3] == '[{"tax": 0.0}]'
+        assert json.loads(saidas[1])["error"].startswith("Erro ao processar entrada: Erro ao processar JSON")
+        assert json.loads(saidas[2]) == {"error": "Erro ao processar entrada: Quantidade deve ser maior que zero"}
+        assert rejeitadas.read_text() == f"{{invalid json\n{quantidade_invalida}\n"
+        assert stderr.getvalue() == f"Linhas rejeitadas: 2 (gravadas em {rejeitadas})\n"
+
+    def test_main_com_rejects_e_checkpoint_retomado(self, tmp_path):
+        """Testa se a retomada mantém as linhas rejeitadas até o ponto de controle, sem gravar nenhuma duas vezes."""
+        compra = '{"operation":"buy", "unit-cost":10.00, "quantity": 10000}'
+        linhas = ["{invalid json\n", f"[{compra}]\n", "{outra\n"]
+        entrada = tmp_path / "entrada.txt"
+        entrada.write_text("".join(linhas[:2]))
+        rejeitadas = tmp_path / "rejeitadas.txt"
+        saida = tmp_path / "saida.txt"
+        argumentos = ["--input", str(entrada), "--rejects", str(rejeitadas), "--checkpoint", str(tmp_path / "ponto")]
+
+        with open(saida, "w") as stdout, patch("sys.stdout", stdout), patch("sys.stderr", io.StringIO()):
+            main(argumentos)
+        # Simula uma interrupção depois de a terceira linha ser rejeitada e antes do ponto de controle seguinte.
+        entrada.write_text("".join(linhas))
+        with open(rejeitadas, "a") as arquivo:
+            arquivo.write(linhas[2])
+        with open(saida, "a") as arquivo:
+            arquivo.write("parcial\n")
+
+        with open(saida, "a") as stdout, patch("sys.stdout", stdout), patch("sys.stderr", io.StringIO()) as stderr:
+            main(argumentos + ["--resume"])
+
+        assert rejeitadas.read_text() == "{invalid json\n{outra\n"
+        resultados = saida.read_text().splitlines()
+        assert len(resultados) == 3
+        assert resultados[1] == '[{"tax": 0.0}]'
+        assert "parcial" not in resultados
+        assert stderr.getvalue() == f"Linhas rejeitadas: 1 (gravadas em {rejeitadas})\n"
+
+    @pytest.mark.parametrize("argumentos", [["--stream"], ["--format", "binario"], ["--accounts"]])
+    def test_main_rejects_incompativel(self, argumentos):
+        """Testa se --rejects é rejeitado junto com as opções que ele não aceita."""
+        with pytest.raises(SystemExit), patch("sys.stderr", io.StringIO()):
+            main(["--rejects", "rejeitadas.txt"] + argumentos)
+
+    def test_main_resume_sem_checkpoint(self):
+        """Testa se --resume é rejeitado sem --checkpoint."""
+        with pytest.raises(SystemExit), patch("sys.stderr", io.StringIO()):
+            main(["--resume"])
+
+    def test_inicializacao_nao_importa_modulos_das_opcoes(self):
+        """Testa se a CLI na configuração padrão não importa o SQLite nem o processamento paralelo."""
+        codigo = (
+            "import sys; from src.application.cli.main import main; main([]); "
+            "print(','.join(m for m in ('sqlite3', 'multiprocessing') if m in sys.modules))"
+        )
+        processo = subprocess.run(
+            [sys.executable, "-c", codigo],
+            input='[{"operation":"buy", "unit-cost":10.00, "quantity": 100}]\n',
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+        assert processo.stdout.splitlines() == ['[{"tax": 0.0}]', ""]
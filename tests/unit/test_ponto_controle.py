@@ -0,0 +1,119 @@
+import io
+import json
+
+import pytest
+from src.application.cli.ponto_controle import (
+    EntradaRetomavel,
+    PontoControle,
+    SaidaComPontoControle,
+    gravar_ponto_controle,
+    ler_ponto_controle,
+    posicionar_saida,
+)
+from src.application.cli.saida_bufferizada import SaidaBufferizada
+
+
+class _BinarioSemSeek(io.BytesIO):
+    """Entrada binária que não permite seek, como um pipe."""
+
+    def seekable(self) -> bool:
+        return False
+
+
+def criar_entrada(conteudo: str, seek: bool = True) -> io.TextIOWrapper:
+    """Cria uma entrada de texto com camada binária, como o sys.stdin."""
+    binario = io.BytesIO(conteudo.encode()) if seek else _BinarioSemSeek(conteudo.encode())
+    return io.TextIOWrapper(binario, encoding="utf-8")
+
+
+class TestPontoControle:
+    def test_serializacao(self, tmp_path):
+        """Testa se o ponto de controle gravado é lido de volta, sem deixar o arquivo temporário."""
+        caminho = str(tmp_path / "ponto.json")
+        ponto = PontoControle(bytes_entrada=120, bytes_saida=30, linhas=2)
+
+        gravar_ponto_controle(caminho, ponto)
+
+        assert ler_ponto_controle(caminho) == ponto
+        assert json.loads((tmp_path / "ponto.json").read_text()) == ponto.como_dict()
+        assert not (tmp_path / "ponto.json.tmp").exists()
+
+    def test_ponto_controle_sem_bytes_rejeitadas(self):
+        """Testa se um ponto de controle gravado sem a posição das linhas rejeitadas é lido com a posição zero."""
+        ponto = PontoControle.de_dict({"bytes_entrada": 120, "bytes_saida": 30, "linhas": 2})
+
+        assert ponto == PontoControle(bytes_entrada=120, bytes_saida=30, linhas=2, bytes_rejeitadas=0)
+
+    def test_arquivo_inexistente(self, tmp_path):
+        """Testa se a ausência do arquivo equivale ao início do processamento."""
+        assert ler_ponto_controle(str(tmp_path / "ausente.json")) == PontoControle()
+
+    @pytest.mark.parametrize("seek", [True, False])
+    def test_entrada_pula_bytes_iniciais(self, seek):
+        """Testa se a leitura começa logo após os bytes já processados, com ou sem seek."""
+        entrada = EntradaRetomavel(criar_entrada("ação\nb\nc\n", seek), bytes_iniciais=len("ação\n".encode()))
+
+        assert list(entrada) == ["b\n", "c\n"]
+
+    def test_entrada_de_texto_pula_bytes_iniciais(self):
+        """Testa se uma entrada sem camada binária também é retomada pela posição em bytes."""
+        entrada = EntradaRetomavel(io.StringIO("ação\nb\n"), bytes_iniciais=len("ação\n".encode()))
+
+        assert list(entrada) == ["b\n"]
+
+    def test_entrada_que_nao_corresponde(self):
+        """Testa se uma entrada menor que a posição do ponto de controle é rejeitada."""
+        with pytest.raises(ValueError):
+            list(EntradaRetomavel(criar_entrada("a\n", seek=False), bytes_iniciais=10))
+        with pytest.raises(ValueError):
+            list(EntradaRetomavel(io.StringIO("abc\n"), bytes_iniciais=2))
+
+    def test_confirmar_na_ordem_de_leitura(self):
+        """Testa se apenas as linhas confirmadas avançam a posição na entrada."""
+        entrada = EntradaRetomavel(criar_entrada("aa\nbbb\ncccc\n"), bytes_iniciais=0)
+        linhas = iter(entrada)
+        next(linhas), next(linhas)
+
+        entrada.confirmar()
+
+        assert entrada.bytes_confirmados == 3
+
+    def test_posicionar_saida_descarta_o_excedente(self, tmp_path):
+        """Testa se a saída é truncada na posição do ponto de controle e a escrita continua dali."""
+        caminho = tmp_path / "saida.txt"
+        caminho.write_bytes(b"linha 1\nlinha 2 incomplet")
+
+        with open(caminho, "a", encoding="utf-8") as arquivo:
+            posicionar_saida(arquivo, 8)
+            arquivo.buffer.write(b"linha 2\n")
+
+        assert caminho.read_bytes() == b"linha 1\nlinha 2\n"
+
+    def test_posicionar_saida_menor_que_o_ponto(self, tmp_path):
+        """Testa se uma saída com menos bytes que o ponto de controle é rejeitada."""
+        caminho = tmp_path / "saida.txt"
+        caminho.write_bytes(b"linha 1\n")
+
+        with open(caminho, "a", encoding="utf-8") as arquivo, pytest.raises(ValueError):
+            posicionar_saida(arquivo, 100)
+
+    def test_posicionar_saida_sem_arquivo_regular(self):
+        """Testa se saídas que não são arquivos regulares são mantidas como estão."""
+        arquivo = io.StringIO("abc")
+
+        posicionar_saida(arquivo, 1)
+
+        assert arquivo.getvalue() == "abc"
+
+    def test_grava_a_cada_n_linhas(self, tmp_path):
+        """Testa se o ponto de controle é gravado a cada N linhas, após descarregar a saída."""
+        caminho = str(tmp_path / "ponto.json")
+        entrada = EntradaRetomavel(criar_entrada("a\nb\nc\n"))
+        arquivo = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        saida = SaidaComPontoControle(SaidaBufferizada(arquivo), entrada, caminho, 2, PontoControle(0, 5, 1))
+
+        for linha in entrada:
+            saida.escrever_linha(linha.strip().upper())
+            if linha == "b\n":
+                assert ler_ponto_controle(caminho) == PontoControle(bytes_entrada=4, bytes_saida=9, linhas=3)
+                assert arquivo.buffer.getvalue() == b"A\nB\n"
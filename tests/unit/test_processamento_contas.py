@@ -0,0 +1,52 @@
+import json
+
+import pytest
+from src.application.cli.processamento_contas import fatia_da_conta, processar_contas
+
+COMPRA = '{"operation":"buy", "unit-cost":10.00, "quantity": 100}'
+VENDA = '{"operation":"sell", "unit-cost":15.00, "quantity": 10}'
+
+
+def registros(contas: int, rodadas: int) -> list:
+    """Monta registros intercalados: em cada rodada, um registro de cada conta."""
+    return [
+        f'{{"account": "conta-{conta}", "operations": [{COMPRA if rodada == 0 else VENDA}]}}'
+        for rodada in range(rodadas)
+        for conta in range(contas)
+    ]
+
+
+class TestProcessamentoContas:
+    def test_fatia_da_conta(self):
+        """Testa se a fatia é estável e fica entre zero e a quantidade de fatias."""
+        assert fatia_da_conta("conta-1", 4) == fatia_da_conta("conta-1", 4)
+        assert {fatia_da_conta(f"conta-{indice}", 4) for indice in range(100)} == {0, 1, 2, 3}
+
+    @pytest.mark.parametrize("workers,tamanho_bloco", [(2, 1), (3, 4)])
+    def test_fatias_em_paralelo_iguais_ao_sequencial(self, workers, tamanho_bloco):
+        """Testa se as fatias em processos produzem as mesmas saídas, na ordem em que as contas aparecem."""
+        linhas = registros(contas=10, rodadas=3)
+        esperado = list(processar_contas(linhas, workers=1, tamanho_bloco=1))
+
+        resultado = list(processar_contas(linhas, workers=workers, tamanho_bloco=tamanho_bloco))
+
+        assert resultado == esperado
+        assert [json.loads(saida)["account"] for saida in resultado] == [f"conta-{indice}" for indice in range(10)]
+        assert resultado[0] == '{"account": "conta-0", "taxes": [{"tax": 0.0},{"tax": 0.0},{"tax": 0.0}]}'
+
+    def test_entrada_vazia(self):
+        """Testa o processamento por conta sem nenhum registro."""
+        assert list(processar_contas([], workers=2, tamanho_bloco=10)) == []
+
+    def test_erro_na_fatia_e_propagado(self):
+        """Testa se um erro ocorrido no processo de uma fatia é propagado."""
+        linhas = registros(contas=2, rodadas=1) + ['{"account": "conta-0", "operations": [{"operation":"buy"}]}']
+
+        with pytest.raises(Exception, match="Erro ao processar JSON"):
+            list(processar_contas(linhas, workers=2, tamanho_bloco=1))
+
+    @pytest.mark.parametrize("workers,tamanho_bloco", [(0, 1), (1, 0)])
+    def test_parametros_invalidos(self, workers, tamanho_bloco):
+        """Testa a validação da quantidade de workers e do tamanho do bloco."""
+        with pytest.raises(ValueError):
+            list(processar_contas([], workers=workers, tamanho_bloco=tamanho_bloco))
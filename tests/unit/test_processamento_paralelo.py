@@ -0,0 +1,50 @@
+import pytest
+from src.application.cli.processamento_paralelo import processar_em_paralelo
+from src.application.container import Container
+from src.application.use_cases.estatisticas_processamento import EstatisticasProcessamento
+
+LINHAS = [
+    '[{"operation":"buy", "unit-cost":10.00, "quantity": 100},{"operation":"sell", "unit-cost":15.00, "quantity": 50}]',
+    '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]',
+    '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":5.00, "quantity": 5000}]',
+    '[{"operation":"buy", "unit-cost":10, "quantity": 100},{"operation":"sell", "unit-cost":20, "quantity": 110}]',
+]
+
+
+class TestProcessamentoParalelo:
+    def test_resultados_na_ordem_de_entrada(self):
+        """Testa se os resultados saem na ordem de entrada e iguais ao processamento sequencial."""
+        _, _, _, use_case = Container.get_dependencies()
+        linhas = LINHAS * 5
+        esperado = [use_case.execute(linha) for linha in linhas]
+
+        resultado = list(processar_em_paralelo(linhas, workers=2, tamanho_bloco=3))
+
+        assert resultado == esperado
+
+    def test_entrada_vazia(self):
+        """Testa o processamento paralelo sem nenhuma linha de entrada."""
+        assert list(processar_em_paralelo([], workers=2, tamanho_bloco=10)) == []
+
+    def test_erro_no_worker_e_propagado(self):
+        """Testa se um erro ocorrido em um worker é propagado para quem consome os resultados."""
+        resultados = processar_em_paralelo([LINHAS[0], "{invalid json"], workers=2, tamanho_bloco=1)
+
+        assert next(resultados) == '[{"tax": 0.0},{"tax": 0.0}]'
+        with pytest.raises(Exception, match="Erro ao processar JSON"):
+            next(resultados)
+
+    @pytest.mark.parametrize("workers,tamanho_bloco", [(0, 1), (1, 0)])
+    def test_parametros_invalidos(self, workers, tamanho_bloco):
+        """Testa a validação da quantidade de workers e do tamanho do bloco."""
+        with pytest.raises(ValueError):
+            list(processar_em_paralelo(LINHAS, workers=workers, tamanho_bloco=tamanho_bloco))
+
+    def test_estatisticas_dos_workers(self):
+        """Testa se as medições feitas nos workers são reunidas na ordem de entrada."""
+        estatisticas = EstatisticasProcessamento()
+
+        resultado = list(processar_em_paralelo(LINHAS, workers=2, tamanho_bloco=1, estatisticas=estatisticas))
+
+        assert len(resultado) == len(LINHAS)
+        assert [linha.bytes_entrada for linha in estatisticas.linhas] == [len(linha) for linha in LINHAS]
@@ -0,0 +1,84 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from src.domain.models.regra_imposto import RegraImposto, TabelaRegras
+
+REGRA_2020 = RegraImposto(date(2020, 1, 1), Decimal("0.20"), Decimal("20000.00"))
+REGRA_2025 = RegraImposto(date(2025, 7, 1), Decimal("0.15"), Decimal("35000.00"))
+
+
+class TestRegraImposto:
+    def test_serializacao(self):
+        """Testa se a regra serializada é restaurada com a data e os valores exatos."""
+        dados = REGRA_2025.como_dict()
+
+        assert dados == {"vigencia": "2025-07-01", "aliquota": "0.15", "limite_isencao": "35000.00"}
+        assert RegraImposto.de_dict(dados) == REGRA_2025
+
+    def test_valores_numericos(self):
+        """Testa se a alíquota e o limite também são aceitos como números."""
+        regra = RegraImposto.de_dict({"vigencia": "2025-07-01", "aliquota": 0.15, "limite_isencao": 35000})
+
+        assert regra == REGRA_2025
+
+
+class TestTabelaRegras:
+    def setup_method(self):
+        """Configuração inicial para cada teste."""
+        self.tabela = TabelaRegras([REGRA_2025, REGRA_2020])
+
+    @pytest.mark.parametrize(
+        "data, esperada",
+        [
+            (date(2020, 1, 1), REGRA_2020),
+            (date(2025, 6, 30), REGRA_2020),
+            (date(2025, 7, 1), REGRA_2025),
+            (date(2040, 1, 1), REGRA_2025),
+        ],
+    )
+    def test_regra_em(self, data, esperada):
+        """Testa se a regra vigente é a de vigência mais recente até a data, inclusive."""
+        assert self.tabela.regra_em(data) == esperada
+
+    def test_data_anterior_a_todas_as_regras(self):
+        """Testa a consulta de uma data sem regra vigente."""
+        with pytest.raises(ValueError, match="Nenhuma regra do imposto vigente em 2019-12-31"):
+            self.tabela.regra_em(date(2019, 12, 31))
+
+    def test_regras_ordenadas(self):
+        """Testa se as regras ficam em ordem de vigência."""
+        assert len(self.tabela) == 2
+        assert self.tabela.regras == (REGRA_2020, REGRA_2025)
+
+    def test_serializacao(self):
+        """Testa se a tabela serializada é restaurada com as mesmas regras."""
+        assert TabelaRegras.de_dict(self.tabela.como_dict()).regras == self.tabela.regras
+
+    @pytest.mark.parametrize(
+        "regras, mensagem",
+        [
+            ([], "ao menos uma regra"),
+            ([REGRA_2020, REGRA_2020._replace(aliquota=Decimal("0.10"))], "mesma vigência"),
+            ([REGRA_2020._replace(aliquota=Decimal("1.5"))], "Alíquota deve estar entre 0 e 1"),
+            ([REGRA_2020._replace(limite_isencao=Decimal("-1"))], "Limite de isenção não pode ser negativo"),
+        ],
+    )
+    def test_regras_invalidas(self, regras, mensagem):
+        """Testa a validação das regras na criação da tabela."""
+        with pytest.raises(ValueError, match=mensagem):
+            TabelaRegras(regras)
+
+    @pytest.mark.parametrize(
+        "dados",
+        [
+            {},
+            [],
+            {"regras": [{"vigencia": "2020-01-01", "aliquota": "abc", "limite_isencao": "0"}]},
+            {"regras": [{"vigencia": "2020-01-01", "aliquota": "0.2"}]},
+        ],
+    )
+    def test_tabela_serializada_invalida(self, dados):
+        """Testa se uma tabela serializada com campos ausentes ou inválidos gera erro."""
+        with pytest.raises(ValueError, match="Tabela de regras do imposto inválida"):
+            TabelaRegras.de_dict(dados)
@@ -0,0 +1,85 @@
+import io
+
+from src.application.cli.saida_bufferizada import SaidaBufferizada
+
+
+def criar_arquivo_texto() -> io.TextIOWrapper:
+    """Cria um arquivo de texto com camada binária, como o sys.stdout."""
+    return io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+
+
+class TestSaidaBufferizada:
+    def test_escreve_na_camada_binaria_apenas_ao_final(self):
+        """Testa se, sem política de descarga, nada é escrito antes do flush final."""
+        arquivo = criar_arquivo_texto()
+
+        with SaidaBufferizada(arquivo) as saida:
+            saida.escrever_linha('[{"tax": 0.0}]')
+            saida.escrever_linha("[]")
+            assert arquivo.buffer.getvalue() == b""
+
+        assert arquivo.buffer.getvalue() == b'[{"tax": 0.0}]\n[]\n'
+
+    def test_descarrega_a_cada_n_linhas(self):
+        """Testa a descarga a cada N linhas."""
+        arquivo = criar_arquivo_texto()
+        saida = SaidaBufferizada(arquivo, linhas_por_flush=2)
+
+        saida.escrever_linha("a")
+        assert arquivo.buffer.getvalue() == b""
+        saida.escrever_linha("b")
+        assert arquivo.buffer.getvalue() == b"a\nb\n"
+
+    def test_descarrega_cada_fragmento(self):
+        """Testa se, com descarregar_fragmentos, cada texto é escrito no arquivo assim que é recebido."""
+        arquivo = criar_arquivo_texto()
+        saida = SaidaBufferizada(arquivo, linhas_por_flush=1, descarregar_fragmentos=True)
+
+        saida.write("[")
+        assert arquivo.buffer.getvalue() == b"["
+        saida.write('{"tax": 0.0}')
+        assert arquivo.buffer.getvalue() == b'[{"tax": 0.0}'
+        saida.write("]")
+        saida.escrever_linha()
+
+        assert arquivo.buffer.getvalue() == b'[{"tax": 0.0}]\n'
+
+    def test_descarrega_quando_o_buffer_enche(self):
+        """Testa se o conteúdo acumulado é escrito quando atinge o tamanho do buffer."""
+        arquivo = criar_arquivo_texto()
+        saida = SaidaBufferizada(arquivo, tamanho_buffer=8)
+
+        saida.write("1234")
+        assert arquivo.buffer.getvalue() == b""
+        saida.writelines(["56", "78", "9"])
+        assert arquivo.buffer.getvalue() == b"12345678"
+
+    def test_texto_ja_escrito_sai_antes(self):
+        """Testa se o texto pendente na camada de texto é escrito antes dos bytes da saída bufferizada."""
+        arquivo = criar_arquivo_texto()
+        arquivo.write("anterior\n")
+
+        with SaidaBufferizada(arquivo) as saida:
+            saida.escrever_linha("depois")
+
+        assert arquivo.buffer.getvalue() == b"anterior\ndepois\n"
+
+    def test_arquivo_sem_camada_binaria(self):
+        """Testa a escrita em um arquivo sem camada binária, como io.StringIO."""
+        arquivo = io.StringIO()
+
+        with SaidaBufferizada(arquivo, linhas_por_flush=1) as saida:
+            saida.escrever_linha("á")
+
+        assert arquivo.getvalue() == "á\n"
+
+    def test_conta_os_bytes_escritos(self):
+        """Testa se bytes_escritos conta apenas os bytes UTF-8 já entregues ao arquivo."""
+        arquivo = criar_arquivo_texto()
+        saida = SaidaBufferizada(arquivo)
+
+        saida.escrever_linha("ação")
+        assert saida.bytes_escritos == 0
+        saida.flush()
+
+        assert saida.bytes_escritos == len(arquivo.buffer.getvalue()) == 7
@@ -0,0 +1,169 @@
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+from src.application.servidor.main import _criar_parser_argumentos
+from src.application.servidor.servidor_impostos import TAMANHO_MAXIMO_LINHA, ServidorImpostos, ler_blocos
+
+ENTRADA = '[{"operation":"buy", "unit-cost":10.00, "quantity": 10000},{"operation":"sell", "unit-cost":20.00, "quantity": 5000}]'
+SAIDA = '[{"tax": 0.0},{"tax": 10000.0}]'
+
+
+async def conversar(servidor: ServidorImpostos, dados: bytes, caminho_socket: str | None = None) -> bytes:
+    """Inicia o servidor, envia os dados de uma só vez e retorna tudo o que foi respondido até o fim da conexão."""
+    servidor_socket = await servidor.iniciar(caminho_socket)
+    async with servidor_socket:
+        if caminho_socket:
+            reader, writer = await asyncio.open_unix_connection(caminho_socket)
+        else:
+            host, porta = servidor_socket.sockets[0].getsockname()[:2]
+            reader, writer = await asyncio.open_connection(host, porta)
+        writer.write(dados)
+        writer.write_eof()
+        resposta = await reader.read()
+        writer.close()
+        return resposta
+
+
+async def ler_todos_os_blocos(*partes: bytes, tamanho_maximo_linha: int = TAMANHO_MAXIMO_LINHA):
+    """Entrega as partes a um StreamReader e retorna os blocos de linhas produzidos."""
+    reader = asyncio.StreamReader()
+    for parte in partes:
+        reader.feed_data(parte)
+    reader.feed_eof()
+    return [linhas async for linhas in ler_blocos(reader, tamanho_maximo_linha)]
+
+
+class TestServidorImpostos:
+    def test_responde_linhas_em_sequencia_no_socket_unix(self, tmp_path):
+        """Testa se as linhas enviadas sem esperar resposta são respondidas uma a uma, na mesma ordem."""
+        servidor = ServidorImpostos()
+        entrada = f"{ENTRADA}\n[]\n{ENTRADA}\n".encode()
+
+        resposta = asyncio.run(conversar(servidor, entrada, str(tmp_path / "servidor.sock")))
+
+        assert resposta.decode() == f"{SAIDA}\n[]\n{SAIDA}\n"
+
+    def test_responde_por_tcp(self):
+        """Testa o servidor numa porta TCP local."""
+        servidor = ServidorImpostos({"motor": "local"})
+
+        resposta = asyncio.run(conversar(servidor, f"{ENTRADA}\n".encode()))
+
+        assert resposta.decode() == f"{SAIDA}\n"
+
+    def test_linha_invalida_nao_encerra_a_conexao(self):
+        """Testa se uma linha inválida é respondida com um erro e as seguintes continuam sendo calculadas."""
+        servidor = ServidorImpostos()
+
+        resposta = asyncio.run(conversar(servidor, f"{{invalid json\n{ENTRADA}".encode())).decode()
+
+        erro, saida = resposta.splitlines()
+        assert json.loads(erro)["error"].startswith("Erro ao processar entrada")
+        assert saida == SAIDA
+
+    def test_calcula_os_blocos_no_pool_de_processos(self, tmp_path):
+        """Testa se, com workers, as respostas dos blocos calculados em outros processos mantêm a ordem."""
+        servidor = ServidorImpostos(workers=2, blocos_em_voo=1)
+        linhas = [ENTRADA.replace("20.00", f"{20 + indice}.00") for indice in range(50)]
+        try:
+            resposta = asyncio.run(conversar(servidor, "\n".join(linhas).encode() + b"\n", str(tmp_path / "s.sock")))
+        finally:
+            servidor.fechar()
+
+        impostos = [json.loads(linha)[1]["tax"] for linha in resposta.decode().splitlines()]
+        assert impostos == [(20 + indice - 10) * 5000 * 0.2 for indice in range(50)]
+
+    def test_workers_negativos(self):
+        """Testa a validação da quantidade de workers."""
+        with pytest.raises(ValueError):
+            ServidorImpostos(workers=-1)
+
+    def test_ler_blocos_une_linhas_divididas(self):
+        """Testa se uma linha recebida em várias leituras é entregue inteira, ignorando linhas vazias."""
+        blocos = asyncio.run(ler_todos_os_blocos(b"[1,", b"2]\n\n[3", b"]\r\n[4]"))
+
+        assert [linha for bloco in blocos for linha in bloco] == ["[1,2]", "[3]", "[4]"]
+
+    def test_ler_blocos_recusa_linha_acima_do_tamanho_maximo(self):
+        """Testa se uma linha sem quebra acima do tamanho máximo é recusada sem esperar o fim dela."""
+        with pytest.raises(ValueError, match="tamanho máximo de 4 bytes"):
+            asyncio.run(ler_todos_os_blocos(b"[1,", b"2,3", b"]\n", tamanho_maximo_linha=4))
+
+        with pytest.raises(ValueError, match="tamanho máximo de 4 bytes"):
+            asyncio.run(ler_todos_os_blocos(b"[1]\n[1,2,3]\n[2]\n", tamanho_maximo_linha=4))
+
+        blocos = asyncio.run(ler_todos_os_blocos(b"[1", b",2]\n[3]", tamanho_maximo_linha=5))
+        assert [linha for bloco in blocos for linha in bloco] == ["[1,2]", "[3]"]
+
+    def test_linha_acima_do_tamanho_maximo_responde_erro(self):
+        """Testa se as linhas anteriores são respondidas e a linha longa recebe um erro antes de a conexão fechar."""
+        servidor = ServidorImpostos(tamanho_maximo_linha=len(ENTRADA))
+        longa = "[" + " " * len(ENTRADA) + "]"
+
+        resposta = asyncio.run(conversar(servidor, f"{ENTRADA}\n{longa}\n{ENTRADA}\n".encode())).decode()
+
+        saida, erro = resposta.splitlines()
+        assert saida == SAIDA
+        assert json.loads(erro) == {
+            "error": f"Erro ao processar entrada: Linha excede o tamanho máximo de {len(ENTRADA)} bytes"
+        }
+
+    def test_tamanho_maximo_linha_invalido(self):
+        """Testa a validação do tamanho máximo da linha."""
+        with pytest.raises(ValueError):
+            ServidorImpostos(tamanho_maximo_linha=0)
+
+    def test_sem_workers_calcula_fora_do_laco_de_eventos(self):
+        """Testa se, sem workers, os blocos são calculados numa thread que não é a do laço de eventos."""
+        servidor = ServidorImpostos()
+        threads = []
+
+        def responder(use_case, linhas, impostos_output):
+            threads.append(threading.current_thread())
+            return b"[]\n" * len(linhas)
+
+        try:
+            with patch("src.application.servidor.servidor_impostos.responder_linhas", side_effect=responder):
+                resposta = asyncio.run(conversar(servidor, f"{ENTRADA}\n".encode()))
+        finally:
+            servidor.fechar()
+
+        assert resposta == b"[]\n"
+        assert threads and threads[0] is not threading.main_thread()
+
+    def test_erro_formatado_pela_porta_de_saida(self):
+        """Testa se o registro de erro de uma linha é montado pela porta de saída do servidor."""
+        servidor = ServidorImpostos()
+        with patch.object(servidor._impostos_output, "formatar_erro", return_value='{"erro": 1}') as formatar_erro:
+            resposta = asyncio.run(conversar(servidor, b"{invalid json\n")).decode()
+
+        assert resposta == '{"erro": 1}\n'
+        assert formatar_erro.call_args.args[0].startswith("Erro ao processar entrada")
+
+    def test_argumentos_padrao(self):
+        """Testa os argumentos padrão do servidor."""
+        argumentos = _criar_parser_argumentos().parse_args([])
+
+        assert argumentos.socket is None
+        assert (argumentos.host, argumentos.port, argumentos.workers) == ("127.0.0.1", 8765, 0)
+        assert argumentos.max_line_bytes == TAMANHO_MAXIMO_LINHA
+
+    def test_tamanho_maximo_linha_deve_ser_positivo(self):
+        """Testa se o argumento do tamanho máximo da linha recusa zero."""
+        with pytest.raises(SystemExit):
+            _criar_parser_argumentos().parse_args(["--max-line-bytes", "0"])
+
+    def test_falha_do_bloco_responde_cada_linha(self):
+        """Testa se a falha do cálculo de um bloco inteiro é respondida com um erro para cada uma das suas linhas."""
+        servidor = ServidorImpostos()
+        with patch(
+            "src.application.servidor.servidor_impostos.responder_linhas", side_effect=RuntimeError("worker encerrado")
+        ):
+            resposta = asyncio.run(conversar(servidor, f"{ENTRADA}\n{ENTRADA}\n".encode())).decode()
+
+        assert [json.loads(linha)["error"] for linha in resposta.splitlines()] == [
+            "Erro ao processar entrada: worker encerrado"
+        ] * 2
@@ -0,0 +1,119 @@
+import tracemalloc
+
+import pytest
+from src.adapters.input.varredura_operacoes import preco_em_centavos, varrer_conta, varrer_id_conta, varrer_operacoes
+
+
+class TestVarreduraOperacoes:
+    @pytest.mark.parametrize(
+        "json_data",
+        [
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100},{"operation":"sell", "unit-cost":15, "quantity": 50}]',
+            ' [ {"operation" : "buy","unit-cost":10.00,"quantity":100} ,\n\t{"operation":"sell","unit-cost":15,"quantity":50} ]\n',
+            b'[{"operation":"buy", "unit-cost":10.00, "quantity": 100},{"operation":"sell", "unit-cost":15, "quantity": 50}]',
+        ],
+    )
+    def test_varre_o_formato_da_entrada(self, json_data):
+        """Testa se o array no formato da entrada, em texto ou bytes e com espaços variados, é varrido."""
+        assert varrer_operacoes(json_data) == [("", "buy", "10.00", "100", ""), ("", "sell", "15", "50", "")]
+
+    def test_memoria_de_pico_nao_cresce_com_o_array(self):
+        """Testa se a varredura de um array grande usa no pico pouco mais que as operações devolvidas, sem a pilha de
+        um único casamento da linha inteira."""
+        quantidade = 20_000
+        json_data = "[" + ",".join(
+            '{"operation":"buy", "unit-cost":10.00, "quantity": 100}' for _ in range(quantidade)
+        )
+        json_data += "]"
+
+        tracemalloc.start()
+        try:
+            varridas = varrer_operacoes(json_data)
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(varridas) == quantidade
+        assert pico / quantidade < 400
+
+    @pytest.mark.parametrize(
+        "json_data",
+        [
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}] ]',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}',
+        ],
+    )
+    def test_array_sem_fechamento_unico(self, json_data):
+        """Testa se o array precisa terminar num único colchete, seguido apenas de espaços."""
+        assert varrer_operacoes(json_data) is None
+
+    def test_array_vazio(self):
+        """Testa se um array vazio é varrido sem operações."""
+        assert varrer_operacoes(" [ ]\n") == []
+
+    def test_preserva_os_digitos_do_preco(self):
+        """Testa se o preço é devolvido com os dígitos da entrada, sem o arredondamento de um float."""
+        json_data = '[{"operation":"buy", "unit-cost":0.10000000000000000555, "quantity": 1}]'
+
+        assert varrer_operacoes(json_data) == [("", "buy", "0.10000000000000000555", "1", "")]
+
+    def test_ticker_no_inicio_ou_no_final(self):
+        """Testa se o ticker opcional é varrido tanto no início quanto no final do objeto."""
+        json_data = (
+            '[{"ticker": "PETR4", "operation":"buy", "unit-cost":10.00, "quantity": 100},'
+            '{"operation":"sell", "unit-cost":15, "quantity": 50, "ticker":"VALE3"}]'
+        )
+
+        assert varrer_operacoes(json_data) == [("PETR4", "buy", "10.00", "100", ""), ("", "sell", "15", "50", "VALE3")]
+
+    @pytest.mark.parametrize(
+        "json_data",
+        [
+            '[{"unit-cost":10.00, "operation":"buy", "quantity": 100}]',
+            '[{"operation":"buy", "unit-cost":1e1, "quantity": 100}]',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100.0}]',
+            '[{"operation":"buy", "unit-cost":010, "quantity": 100}]',
+            '[{"operation":"hold", "unit-cost":10.00, "quantity": 100}]',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100, "ticker": 3}]',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100, "ticker": "A\\"B"}]',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100, "ticker": ""}]',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100, "papel": "X"}]',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100},]',
+            '[{"operation":"buy", "unit-cost":10.00, "quantity": 100}] []',
+            "{invalid json",
+            b"[\xff]",
+        ],
+    )
+    def test_formas_inesperadas_retornam_none(self, json_data):
+        """Testa se outras ordens de chaves, números com expoente, tickers fora do formato, campos extras ou JSON
+        inválido retornam None."""
+        assert varrer_operacoes(json_data) is None
+
+    @pytest.mark.parametrize(
+        "preco, esperado",
+        [("10", 1000), ("10.5", 1050), ("10.05", 1005), ("1.2300", 123), ("-0.5", -50), ("0", 0), ("0.001", None)],
+    )
+    def test_preco_em_centavos(self, preco, esperado):
+        """Testa a conversão dos dígitos do preço em centavos, rejeitando mais de duas casas decimais."""
+        assert preco_em_centavos(preco) == esperado
+
+    def test_varre_registro_de_conta(self):
+        """Testa se o registro de uma conta no formato da entrada é varrido, com a conta e as operações."""
+        json_data = ' {"account": "A-1", "operations": [{"operation":"buy", "unit-cost":10.00, "quantity": 100}]}\n'
+
+        assert varrer_conta(json_data) == ("A-1", [("", "buy", "10.00", "100", "")])
+        assert varrer_conta(json_data.encode()) == varrer_conta(json_data)
+        assert varrer_id_conta(json_data) == "A-1"
+
+    @pytest.mark.parametrize(
+        "json_data",
+        [
+            '{"operations": [], "account": "A"}',
+            '{"account": "A", "operations": [], "extra": [1]}',
+            '{"account": "A", "operations": [{"quantity": 100, "unit-cost":10.00, "operation":"buy"}]}',
+            '{"account": 1, "operations": []}',
+        ],
+    )
+    def test_registro_de_conta_fora_do_formato(self, json_data):
+        """Testa se registros com outra ordem de chaves, campos extras ou operações fora do formato retornam None."""
+        assert varrer_conta(json_data) is None